@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Benchmarks run headless against the simulated command backend, a temporary
+# config file and a synthetic share tree; nothing here touches Qt.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broetje_vpn.core.config_store import ConfigStore
+from broetje_vpn.core.drive_inventory import parse_net_use, parse_wmic, scan_drives, scan_net_use
+from broetje_vpn.core.drive_list import diff_sorted, drive_list_items
+from broetje_vpn.core.import_report import measure_imports
+from broetje_vpn.core.listing_cache import ListingCache, fetch_listing
+from broetje_vpn.core.mapping import build_mapping_jobs, map_drives, plan_reconciliation, reconcile_drives
+from broetje_vpn.core.prefetch import Prefetcher, VisitHistory
+from broetje_vpn.core.runner import SimulatedRunner, set_runner
+from broetje_vpn.core.search_index import FileIndex
+from broetje_vpn.core.server_catalog import ServerCatalog, write_server_file
+
+DEFAULT_TREE_FILES = 100000
+PROJECT_LAYOUT = ["02_Execution", "03_Design", "07_Electrical", "PLC Programs"]
+
+# ------------------------------
+# Timing helpers
+# ------------------------------
+def measure(func, repeat, setup=None):
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state) if setup is not None else func()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return {
+        "runs": repeat,
+        "min_ms": round(min(times), 3),
+        "median_ms": round(statistics.median(times), 3),
+        "mean_ms": round(statistics.mean(times), 3),
+    }
+
+# ------------------------------
+# Synthetic fixtures
+# ------------------------------
+def build_share_tree(root, total_files):
+    # Projects laid out like the PW trees: <project>/02_Execution/03_Design/
+    # 07_Electrical/PLC Programs/<files>, plus a flat folder per project.
+    projects = max(1, total_files // 1000)
+    per_dir = total_files // (projects * 2)
+    for p in range(projects):
+        project = os.path.join(root, f"{3000 + p} PW WPB 2 NEO-135 Carriers")
+        deep = os.path.join(project, *PROJECT_LAYOUT)
+        flat = os.path.join(project, "01_Documents")
+        os.makedirs(deep, exist_ok=True)
+        os.makedirs(flat, exist_ok=True)
+        for i in range(per_dir):
+            open(os.path.join(deep, f"PLC_{p:04d}_{i:04d}.zap16"), "wb").close()
+            open(os.path.join(flat, f"DOC_{p:04d}_{i:04d}.pdf"), "wb").close()
+    return projects * per_dir * 2
+
+def connect_config(servers):
+    return {
+        "german": {"server": "vpn.broetje-automation.de", "username": "banet.loc\\bench", "password": "x"},
+        "american": {"server": "vpn.ba-us.com", "username": "ba-us.com\\bench", "password": "x"},
+        "german_network_folders": [
+            {"drive": "N:", "path": r"\\banet.loc\baw"},
+            {"drive": "I:", "path": r"\\banet.loc\derae.user\home"},
+            {"drive": "P:", "path": r"\\banet.loc\projects"},
+            {"drive": "S:", "path": r"\\banet.loc\scans"},
+            {"drive": "T:", "path": r"\\banet.loc\transfer"},
+        ],
+        "custom_servers": [
+            {"description": f"Project {i}", "address": f"\\\\banet.loc\\uschi\\70 Projects\\{3000 + i} Project"}
+            for i in range(servers)
+        ],
+    }
+
+def net_use_output(drives):
+    runner = SimulatedRunner(drives={f"{chr(ord('D') + i)}:": f"\\\\banet.loc\\share{i}" for i in range(drives)})
+    return runner.netUseOutput()
+
+# ------------------------------
+# Benchmarks
+# ------------------------------
+def bench_connect(results, args, workdir):
+    data = connect_config(args.servers)
+    for status, key in (("german", "german"), ("us", "american")):
+        def setup():
+            runner = SimulatedRunner(time_scale=args.latency_scale, seed=1)
+            for job in build_mapping_jobs(status, data, data[key]["username"], "x"):
+                runner.drives[job.drive.upper()] = [job.path, "OK"]
+            set_runner(runner)
+            return build_mapping_jobs(status, data, data[key]["username"], "x")
+        results[f"connect_{status}"] = measure(
+            lambda jobs: map_drives(jobs, disconnect_first=True), args.repeat, setup)
+        results[f"reconnect_{status}_unchanged"] = measure(
+            lambda jobs: reconcile_drives(plan_reconciliation(jobs, scan_net_use())), args.repeat, setup)
+
+def bench_enumerate(results, args, workdir):
+    output = net_use_output(20)
+    wmic = "DeviceID  ProviderName\n" + "\n".join(f"{chr(ord('D') + i)}:  \\\\banet.loc\\share{i}" for i in range(20))
+    results["parse_net_use"] = measure(lambda: parse_net_use(output), args.repeat * 20)
+    results["parse_wmic"] = measure(lambda: parse_wmic(wmic), args.repeat * 20)
+    set_runner(SimulatedRunner(time_scale=args.latency_scale, drives={"N:": r"\\banet.loc\baw", "Z:": r"\\fs02\uschi"}))
+    results["refresh_drive_list"] = measure(scan_drives, args.repeat)
+    entries, error = scan_drives()
+    servers = connect_config(args.servers)["custom_servers"]
+    previous = drive_list_items(entries, error, servers)
+    # A rescan that changed nothing should cost the merge and no row updates.
+    results["drive_list_merge_unchanged"] = measure(
+        lambda: diff_sorted(previous, drive_list_items(entries, error, servers)), args.repeat * 20)
+
+def bench_config(results, args, workdir):
+    path = os.path.join(workdir, "credentials_manager.json")
+    with open(path, "w") as f:
+        json.dump(connect_config(args.servers), f, indent=4)
+    results["config_cold_load"] = measure(lambda: ConfigStore(path).data(), args.repeat)
+    store = ConfigStore(path)
+    store.data()
+    results["config_cached_get_custom_servers"] = measure(lambda: store.get("custom_servers"), args.repeat * 20)
+    def save():
+        servers = store.get("custom_servers")
+        servers.append({"description": "Bench", "address": r"\\banet.loc\bench"})
+        store.set("custom_servers", servers)
+        store.flush()
+    results["config_save_flush"] = measure(save, args.repeat)
+    catalog = ServerCatalog(store)
+    imported = [{"description": f"Project {i}", "address": f"\\\\banet.loc\\import\\P{i:05d}"}
+                for i in range(args.servers)]
+    def bulk_import():
+        catalog.remove(catalog.ids())
+        catalog.importEntries(imported)
+        store.flush()
+    results["catalog_bulk_import"] = measure(bulk_import, args.repeat)
+    export_path = os.path.join(workdir, "servers_export.json")
+    results["catalog_export"] = measure(lambda: write_server_file(export_path, catalog.entries()), args.repeat)
+    def type_filter():
+        for i in range(1, 6):
+            catalog.filter("p0004"[:i])
+    results["catalog_type_filter"] = measure(type_filter, args.repeat * 20)
+
+def bench_browse(results, args, workdir):
+    tree = args.tree_dir or os.path.join(workdir, "share")
+    marker = os.path.join(tree, ".bench_files")
+    if not os.path.exists(marker):
+        os.makedirs(tree, exist_ok=True)
+        count = build_share_tree(tree, args.files)
+        with open(marker, "w") as f:
+            f.write(str(count))
+    with open(marker) as f:
+        results["tree_files"] = int(f.read())
+    project = sorted(d for d in os.listdir(tree) if not d.startswith("."))[0]
+    deep = os.path.join(tree, project, *PROJECT_LAYOUT)
+
+    def cold():
+        cache = ListingCache(os.path.join(workdir, f"listing_{time.perf_counter_ns()}.sqlite3"))
+        fetch_listing(tree, cache)
+        fetch_listing(deep, cache)
+    results["expand_cold"] = measure(cold, args.repeat)
+    cache = ListingCache(os.path.join(workdir, "listing_warm.sqlite3"))
+    fetch_listing(tree, cache)
+    fetch_listing(deep, cache)
+    known_root = cache.get(tree)[0]
+    known_deep = cache.get(deep)[0]
+    results["expand_cached_read"] = measure(lambda: (cache.get(tree), cache.get(deep)), args.repeat)
+    results["expand_revalidate_unchanged"] = measure(
+        lambda: (fetch_listing(tree, cache, known_root), fetch_listing(deep, cache, known_deep)), args.repeat)
+    # Selecting a project folder with a fresh cache, until its sub folders are listed.
+    def prefetch_round():
+        run = time.perf_counter_ns()
+        prefetcher = Prefetcher(ListingCache(os.path.join(workdir, f"prefetch_{run}.sqlite3")),
+                                VisitHistory(os.path.join(workdir, f"visits_{run}.sqlite3")), kbps=0)
+        prefetcher.navigate(os.path.join(tree, project))
+        prefetcher.wait()
+        prefetcher.stop()
+    results["prefetch_project_children"] = measure(prefetch_round, args.repeat)
+
+    index = FileIndex(os.path.join(workdir, "index.z"))
+    results["index_build"] = measure(lambda: FileIndex(os.path.join(workdir, "index_cold.z")).updateRoots([tree]), 1)
+    index.updateRoots([tree])
+    results["index_incremental_unchanged"] = measure(lambda: index.updateRoots([tree]), args.repeat)
+    index.search("warmup")
+    results["search_substring"] = measure(lambda: index.search("PLC_0042"), args.repeat * 5)
+    results["search_fuzzy"] = measure(lambda: index.search("plc0042zap"), args.repeat * 5)
+
+def bench_imports(results, args, workdir):
+    # Cold import of the headless entry point in a fresh interpreter each run;
+    # the GUI is left out because the benchmarks never need Qt.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(args.repeat):
+        rows = measure_imports("broetje_vpn.cli", cwd=root)
+        times.append(max(cumulative for _, _, cumulative, _ in rows) / 1000.0)
+    results["import_cli"] = {
+        "runs": args.repeat,
+        "min_ms": round(min(times), 3),
+        "median_ms": round(statistics.median(times), 3),
+        "mean_ms": round(statistics.mean(times), 3),
+    }
+
+BENCHMARKS = {
+    "connect": bench_connect,
+    "enumerate": bench_enumerate,
+    "config": bench_config,
+    "browse": bench_browse,
+    "imports": bench_imports,
+}
+
+# ------------------------------
+# Baseline comparison
+# ------------------------------
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f"{'benchmark':<36}{'baseline ms':>14}{'current ms':>14}{'change':>10}")
+    for name, current in sorted(results.items()):
+        if not isinstance(current, dict):
+            continue
+        base = baseline.get("results", {}).get(name)
+        if not isinstance(base, dict) or not base.get("median_ms"):
+            print(f"{name:<36}{'-':>14}{current['median_ms']:>14.3f}{'new':>10}")
+            continue
+        change = (current["median_ms"] - base["median_ms"]) / base["median_ms"] * 100.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<36}{base['median_ms']:>14.3f}{current['median_ms']:>14.3f}{change:>9.1f}%{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for connect, enumerate, browse and config hot paths")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only these groups")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency-scale", type=float, default=0.1,
+                        help="scale of the simulated command latencies (1.0 = nominal VPN)")
+    parser.add_argument("--files", type=int, default=DEFAULT_TREE_FILES, help="files in the synthetic share tree")
+    parser.add_argument("--servers", type=int, default=500, help="custom_servers entries in the config")
+    parser.add_argument("--tree-dir", help="reuse (or create) the synthetic tree in this directory")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previously saved JSON result")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="broetje_bench_")
+    os.environ["BROETJE_VPN_CACHE_DIR"] = os.path.join(workdir, "cache")
+    results = {}
+    try:
+        for name in args.only or sorted(BENCHMARKS):
+            BENCHMARKS[name](results, args, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+            "latency_scale": args.latency_scale,
+            "files": args.files,
+            "servers": args.servers,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            if compare(results, json.load(f), args.threshold):
+                status = 1
+    else:
+        print(json.dumps(report, indent=4))
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
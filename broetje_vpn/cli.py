@@ -0,0 +1,218 @@
+import argparse
+import getpass
+import json
+import sys
+
+# The headless entry point must never pull in PyQt5; everything below is
+# shared with the GUI through the Qt-free core package. Modules only some
+# commands need (vault, sync) are imported by those commands.
+from .core.config_store import get_config_store
+from .core.drive_inventory import scan_drives, scan_net_use
+from .core.mapping import (
+    KEEP, build_mapping_jobs, map_drives, plan_reconciliation, reconcile_drives, release_drives
+)
+from .core.profiles import get_profile_registry
+from .core.runner import SimulatedRunner, set_runner
+from .core.vpn_client import terminate_vpn_client
+
+def resolve_profile(name):
+    registry = get_profile_registry()
+    profile = registry.resolve(name)
+    if profile is None:
+        raise SystemExit(f"Unknown profile '{name}'. Use one of: {', '.join(registry.keys())}")
+    return profile.key
+
+def open_vault():
+    # Moves any plain-text password left in the config into the vault first.
+    from .core.credential_vault import VaultError, get_vault, migrate_plaintext_passwords
+    vault = get_vault()
+    try:
+        credential_keys = [p.credentialKey for p in get_profile_registry().profiles()]
+        migrate_plaintext_passwords(get_config_store(), vault, credential_keys)
+        vault.unlock()
+    except (VaultError, OSError) as e:
+        print(f"Credential vault unavailable: {str(e)}", file=sys.stderr)
+        return None
+    return vault
+
+def profile_credentials(profile, args):
+    vault = open_vault() if args.password is None else None
+    server, username, password = get_profile_registry().get(profile).savedCredentials(get_config_store().data(), vault)
+    username = args.username or username
+    if args.password is not None:
+        password = args.password
+    if not password and sys.stdin.isatty():
+        password = getpass.getpass(f"Password for {username or profile}: ")
+    return username, password
+
+# ------------------------------
+# Commands
+# ------------------------------
+def cmd_connect(args):
+    data = get_config_store().data()
+    jobs = []
+    for name in args.profiles:
+        profile = resolve_profile(name)
+        username, password = profile_credentials(profile, args)
+        jobs.extend(build_mapping_jobs(profile, data, username, password))
+    def report(result):
+        if args.verbose:
+            print(result.text())
+        else:
+            print(f"{result.drive} {'OK' if result.ok else 'FAILED'} {result.path}")
+    # All profiles share one bounded pool, so their drives map in parallel.
+    if args.force:
+        results = map_drives(jobs, on_result=report, disconnect_first=True)
+    else:
+        plan = plan_reconciliation(jobs, scan_net_use())
+        if args.verbose:
+            print("Drives to update: " + (", ".join(f"{j.drive} ({a})" for j, a in plan if a != KEEP) or "none"))
+        results = reconcile_drives(plan, on_result=report)
+    return 0 if all(r.ok for r in results) else 1
+
+def cmd_disconnect(args):
+    status = 0
+    data = get_config_store().data()
+    jobs = []
+    for name in args.drives_of or []:
+        jobs.extend(build_mapping_jobs(resolve_profile(name), data, "", ""))
+    for result in release_drives(jobs):
+        print(result.text())
+        if not result.ok:
+            status = 1
+    if not args.keep_vpn:
+        try:
+            terminate_vpn_client()
+            print("WatchGuard application terminated.")
+        except Exception as e:
+            print(f"Error disconnecting: {str(e)}", file=sys.stderr)
+            status = 1
+    return status
+
+def cmd_list_drives(args):
+    entries, error = scan_drives()
+    if args.json:
+        print(json.dumps([{"drive": e.drive, "remote": e.remote, "status": e.status} for e in entries], indent=4))
+    else:
+        for entry in entries:
+            print(f"{entry.drive:<4}{entry.status or '-':<14}{entry.remote}")
+    if error:
+        print(f"Error retrieving drives: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+def cmd_add_server(args):
+    from .core.server_catalog import ServerCatalog
+    ServerCatalog().add(args.description, args.address)
+    print(f"Custom server '{args.description}' added.")
+    return 0
+
+def cmd_sync(args):
+    from .core.delta_sync import sync_tree
+    def progress(done, total, rel):
+        if args.verbose:
+            print(f"[{done}/{total}] {rel}")
+    try:
+        result = sync_tree(args.source, args.dest, delete=args.delete, on_progress=progress)
+    except OSError as e:
+        print(f"Sync failed: {str(e)}", file=sys.stderr)
+        return 1
+    print(result.summary())
+    for error in result.errors:
+        print(error, file=sys.stderr)
+    return 0 if result.ok() else 1
+
+def cmd_vault_reset(args):
+    from .core.credential_vault import get_vault
+    if not args.yes:
+        if not sys.stdin.isatty():
+            print("Refusing to reset the credential vault without --yes.", file=sys.stderr)
+            return 1
+        answer = input("Delete all saved passwords and create a new credential vault? [y/N] ")
+        if answer.strip().lower() not in ("y", "yes"):
+            return 1
+    try:
+        get_vault().reset()
+    except OSError as e:
+        print(f"Resetting the credential vault failed: {str(e)}", file=sys.stderr)
+        return 1
+    print("Credential vault reset. Save the passwords again with the GUI or pass --password.")
+    return 0
+
+def cmd_import_report(args):
+    from .core.import_report import import_report
+    try:
+        lines = import_report(args.module, top=args.top)
+    except ImportError as e:
+        print(f"Could not import {args.module}: {str(e)}", file=sys.stderr)
+        return 1
+    for line in lines:
+        print(line)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Headless VPN drive manager")
+    parser.add_argument("--simulate", action="store_true",
+                        help="run against the simulated command backend instead of Windows tools")
+    parser.add_argument("--latency-ms", type=float, default=None,
+                        help="scale of the simulated latencies (1000 = nominal)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    connect = sub.add_parser("connect", help="map the network folders of one or more profiles")
+    connect.add_argument("profiles", nargs="+", help="profile keys or aliases, e.g. german us")
+    connect.add_argument("--username", help="override the saved username")
+    connect.add_argument("--password", help="override the saved password")
+    connect.add_argument("--force", action="store_true",
+                         help="release and remap every drive instead of only the ones that changed")
+    connect.add_argument("-v", "--verbose", action="store_true")
+    connect.set_defaults(func=cmd_connect)
+
+    disconnect = sub.add_parser("disconnect", help="terminate WatchGuard and optionally release drives")
+    disconnect.add_argument("--drives-of", nargs="+", metavar="PROFILE",
+                            help="also release the network folders of these profiles")
+    disconnect.add_argument("--keep-vpn", action="store_true", help="leave the WatchGuard client running")
+    disconnect.set_defaults(func=cmd_disconnect)
+
+    list_drives = sub.add_parser("list-drives", help="list mapped network drives")
+    list_drives.add_argument("--json", action="store_true")
+    list_drives.set_defaults(func=cmd_list_drives)
+
+    add_server = sub.add_parser("add-server", help="add a custom server location")
+    add_server.add_argument("description")
+    add_server.add_argument("address")
+    add_server.set_defaults(func=cmd_add_server)
+
+    sync = sub.add_parser("sync", help="copy only new and changed files of a folder tree")
+    sync.add_argument("source", help="folder to sync from, e.g. a custom server path")
+    sync.add_argument("dest", help="local folder to sync into")
+    sync.add_argument("--delete", action="store_true",
+                      help="remove files that were synced before and are gone from the source")
+    sync.add_argument("-v", "--verbose", action="store_true")
+    sync.set_defaults(func=cmd_sync)
+
+    vault_reset = sub.add_parser("vault-reset", help="delete the saved passwords and the vault key, e.g. "
+                                                     "after the key was lost")
+    vault_reset.add_argument("--yes", action="store_true", help="do not ask for confirmation")
+    vault_reset.set_defaults(func=cmd_vault_reset)
+
+    report = sub.add_parser("import-report", help="show which modules dominate the import time")
+    report.add_argument("module", nargs="?", default="broetje_vpn.ui.main_window",
+                        help="module to import, e.g. broetje_vpn.cli")
+    report.add_argument("--top", type=int, default=20, help="number of modules to list")
+    report.set_defaults(func=cmd_import_report)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.simulate:
+        runner = SimulatedRunner.from_env()
+        if args.latency_ms is not None:
+            runner.time_scale = args.latency_ms / 1000.0
+        set_runner(runner)
+    try:
+        return args.func(args)
+    finally:
+        get_config_store().flush()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import os
+
+APP_NAME = "BroetjeVPN"
+
+def base_dir():
+    # The checkout root (broetje_vpn/core/ is two levels below it), where
+    # the images and credentials_manager.json live.
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def asset_path(name):
+    return os.path.join(base_dir(), name)
+
+def cache_dir(*parts):
+    # Per-user cache location; BROETJE_VPN_CACHE_DIR overrides it (handy for
+    # benchmarks and for running several copies side by side).
+    root = os.environ.get("BROETJE_VPN_CACHE_DIR")
+    if not root:
+        if os.name == "nt":
+            root = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), APP_NAME, "cache")
+        else:
+            root = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), APP_NAME.lower())
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def data_dir(*parts):
+    # Per-user data that must survive a cache wipe (e.g. the credential
+    # vault); BROETJE_VPN_DATA_DIR overrides it.
+    root = os.environ.get("BROETJE_VPN_DATA_DIR")
+    if not root:
+        if os.name == "nt":
+            root = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), APP_NAME)
+        else:
+            root = os.path.join(os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), APP_NAME.lower())
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,342 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from .listing_cache import listing_key
+
+DEBOUNCE = 0.3
+POLL_MIN_INTERVAL = 2.0
+POLL_MAX_INTERVAL = 60.0
+WAIT_TIMEOUT = 0.5
+# Linux only sees changes made through the local kernel on these, so
+# remote edits on a share would never show up through inotify.
+NETWORK_FS_TYPES = {"cifs", "smb3", "smbfs", "nfs", "nfs4", "fuse.sshfs", "9p"}
+
+def network_fs_type(path):
+    # Filesystem type of the mount holding path (Linux), or None.
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f if line.strip()]
+    except OSError:
+        return None
+    real = os.path.realpath(path)
+    best, best_type = "", None
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        if (real == mount_point or real.startswith(mount_point.rstrip("/") + "/")) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type if best_type in NETWORK_FS_TYPES else None
+
+# ------------------------------
+# Native backends
+# ------------------------------
+class InotifyBackend:
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+            | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths = {}
+        self.wds = {}
+
+    def add(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            return False
+        self.paths[wd] = path
+        self.wds[path] = wd
+        return True
+
+    def remove(self, path):
+        wd = self.wds.pop(path, None)
+        if wd is not None:
+            self.paths.pop(wd, None)
+            self.libc.inotify_rm_watch(self.fd, wd)
+
+    def isWatching(self, path):
+        return path in self.wds
+
+    def wait(self, timeout):
+        # Returns the watched directories that changed; a directory that
+        # was itself deleted drops its watch.
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size + length
+            path = self.paths.get(wd)
+            if path is None:
+                continue
+            if mask & self.IN_IGNORED:
+                self.paths.pop(wd, None)
+                self.wds.pop(path, None)
+                continue
+            if path not in changed:
+                changed.append(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class WindowsChangeBackend:
+    FILE_NOTIFY_CHANGE_FILE_NAME = 0x001
+    FILE_NOTIFY_CHANGE_DIR_NAME = 0x002
+    FILE_NOTIFY_CHANGE_SIZE = 0x008
+    FILE_NOTIFY_CHANGE_LAST_WRITE = 0x010
+    FILTER = (FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME | FILE_NOTIFY_CHANGE_SIZE
+              | FILE_NOTIFY_CHANGE_LAST_WRITE)
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    WAIT_TIMEOUT = 0x102
+    MAXIMUM_WAIT_OBJECTS = 64
+
+    def __init__(self):
+        # The SMB redirector forwards these notifications for mapped drives
+        # and UNC paths, so no polling is needed on Windows.
+        self.kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self.kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        self.kernel32.FindFirstChangeNotificationW.argtypes = [ctypes.c_wchar_p, ctypes.c_int, ctypes.c_uint32]
+        self.kernel32.FindNextChangeNotification.argtypes = [ctypes.c_void_p]
+        self.kernel32.FindCloseChangeNotification.argtypes = [ctypes.c_void_p]
+        self.kernel32.WaitForMultipleObjects.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p),
+                                                         ctypes.c_int, ctypes.c_uint32]
+        self.kernel32.WaitForMultipleObjects.restype = ctypes.c_uint32
+        self.handles = {}
+
+    def add(self, path):
+        handle = self.kernel32.FindFirstChangeNotificationW(path, False, self.FILTER)
+        if not handle or handle == self.INVALID_HANDLE_VALUE:
+            return False
+        self.handles[path] = handle
+        return True
+
+    def remove(self, path):
+        handle = self.handles.pop(path, None)
+        if handle is not None:
+            self.kernel32.FindCloseChangeNotification(handle)
+
+    def isWatching(self, path):
+        return path in self.handles
+
+    def wait(self, timeout):
+        items = list(self.handles.items())
+        if not items:
+            time.sleep(timeout)
+            return []
+        changed = []
+        groups = [items[i:i + self.MAXIMUM_WAIT_OBJECTS] for i in range(0, len(items), self.MAXIMUM_WAIT_OBJECTS)]
+        slice_ms = max(1, int(timeout * 1000 / len(groups)))
+        for group in groups:
+            array = (ctypes.c_void_p * len(group))(*[handle for path, handle in group])
+            result = self.kernel32.WaitForMultipleObjects(len(group), array, False, slice_ms)
+            if result < len(group):
+                path, handle = group[result]
+                changed.append(path)
+                self.kernel32.FindNextChangeNotification(handle)
+        return changed
+
+    def close(self):
+        for path in list(self.handles):
+            self.remove(path)
+
+
+def native_backend():
+    try:
+        if sys.platform.startswith("linux"):
+            return InotifyBackend()
+        if os.name == "nt":
+            return WindowsChangeBackend()
+    except (OSError, AttributeError):
+        pass
+    return None
+
+# ------------------------------
+# Adaptive mtime polling fallback
+# ------------------------------
+class PollingBackend:
+    # Each directory is stat'ed on its own schedule: the interval doubles
+    # while nothing changes and drops back to the minimum after a change,
+    # so quiet folders cost almost nothing and busy ones are seen quickly.
+    UNKNOWN = object()
+
+    def __init__(self, min_interval=POLL_MIN_INTERVAL, max_interval=POLL_MAX_INTERVAL, clock=time.monotonic):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.clock = clock
+        # path -> [mtime, interval, next check]
+        self.dirs = {}
+
+    def add(self, path):
+        # The first reading is taken on the watcher thread; a stat of a
+        # dropped share can hang and watch() is called from the GUI.
+        self.dirs[path] = [self.UNKNOWN, self.min_interval, self.clock()]
+        return True
+
+    def remove(self, path):
+        self.dirs.pop(path, None)
+
+    def isWatching(self, path):
+        return path in self.dirs
+
+    def check(self):
+        now = self.clock()
+        changed = []
+        for path, state in list(self.dirs.items()):
+            if now < state[2]:
+                continue
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                mtime = None
+            if state[0] is self.UNKNOWN:
+                state[0] = mtime
+            elif mtime != state[0]:
+                state[0] = mtime
+                state[1] = self.min_interval
+                changed.append(path)
+            else:
+                state[1] = min(self.max_interval, state[1] * 2)
+            state[2] = self.clock() + state[1]
+        return changed
+
+# ------------------------------
+# Change watcher over the directories the browser shows
+# ------------------------------
+class ChangeWatcher:
+    def __init__(self, debounce=DEBOUNCE, min_interval=POLL_MIN_INTERVAL, max_interval=POLL_MAX_INTERVAL,
+                 use_native=True):
+        self.debounce = debounce
+        self.lock = threading.Lock()
+        self.native = native_backend() if use_native else None
+        self.polling = PollingBackend(min_interval, max_interval)
+        # key -> path, as requested by watch()/unwatch()
+        self.watches = {}
+        # key -> (path, backend), only touched on the watcher thread
+        self.active = {}
+        self.pending = {}
+        self.listeners = []
+        self.stopEvent = threading.Event()
+        self.thread = None
+
+    def addListener(self, callback):
+        # Called from the watcher thread with the path of a directory whose
+        # contents changed.
+        with self.lock:
+            self.listeners.append(callback)
+
+    def backendFor(self, path):
+        if self.native is None:
+            return self.polling
+        if isinstance(self.native, InotifyBackend) and network_fs_type(path):
+            return self.polling
+        return self.native
+
+    def watch(self, path):
+        # Only records the request: registering a watch on a dropped share
+        # can block, so the backends are driven from the watcher thread.
+        with self.lock:
+            self.watches[listing_key(path)] = path
+
+    def unwatch(self, path, recursive=False):
+        key = listing_key(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self.lock:
+            for known in [k for k in self.watches if k == key or (recursive and k.startswith(prefix))]:
+                del self.watches[known]
+
+    def clear(self):
+        with self.lock:
+            self.watches = {}
+            self.pending = {}
+
+    def watched(self):
+        with self.lock:
+            return sorted(self.watches.values())
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self._loop, name="change-watcher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopEvent.set()
+
+    def _sync(self):
+        with self.lock:
+            wanted = dict(self.watches)
+        # A backend drops the watch of a directory that was deleted; such a
+        # key is registered again below, so a recreated folder is watched.
+        for key in [k for k, (path, backend) in self.active.items()
+                    if k not in wanted or not backend.isWatching(path)]:
+            path, backend = self.active.pop(key)
+            backend.remove(path)
+        for key, path in wanted.items():
+            if key in self.active:
+                continue
+            backend = self.backendFor(path)
+            if not backend.add(path):
+                backend = self.polling
+                backend.add(path)
+            self.active[key] = (path, backend)
+
+    def _loop(self):
+        while not self.stopEvent.is_set():
+            self._sync()
+            changed = []
+            if self.native is not None and any(b is self.native for p, b in self.active.values()):
+                changed.extend(self.native.wait(WAIT_TIMEOUT))
+            else:
+                self.stopEvent.wait(WAIT_TIMEOUT)
+            changed.extend(self.polling.check())
+            with self.lock:
+                now = time.monotonic()
+                for path in changed:
+                    if listing_key(path) in self.watches:
+                        self.pending[path] = now
+                # A copy of hundreds of files is reported once per folder.
+                due = [p for p, seen in self.pending.items() if now - seen >= self.debounce]
+                for path in due:
+                    del self.pending[path]
+                listeners = list(self.listeners)
+            for path in due:
+                for callback in listeners:
+                    callback(path)
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+def get_change_watcher():
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = ChangeWatcher()
+        return _watcher
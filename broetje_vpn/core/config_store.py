@@ -0,0 +1,159 @@
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+
+from .app_paths import base_dir
+
+CONFIG_FILE_NAME = "credentials_manager.json"
+# Writes are coalesced for this many seconds so a burst of edits costs a
+# single rewrite of the file.
+WRITE_DELAY = 0.5
+# Reads check the file's mtime at most this often to pick up external edits.
+STAT_INTERVAL = 1.0
+
+def credentials_file_path():
+    return os.path.join(base_dir(), CONFIG_FILE_NAME)
+
+# ------------------------------
+# In-memory config store with debounced, atomic write-back
+# ------------------------------
+class ConfigStore:
+    def __init__(self, path, write_delay=WRITE_DELAY):
+        self.path = path
+        self.write_delay = write_delay
+        self._lock = threading.RLock()
+        self._data = None
+        self._fileStamp = None
+        self._lastStat = 0.0
+        self._dirty = False
+        self._timer = None
+
+    def data(self):
+        with self._lock:
+            self._ensureLoaded()
+            return copy.deepcopy(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._ensureLoaded()
+            if key not in self._data:
+                return default
+            return copy.deepcopy(self._data[key])
+
+    def set(self, key, value):
+        with self._lock:
+            self._ensureLoaded()
+            self._data[key] = copy.deepcopy(value)
+            self._scheduleWrite()
+
+    def update(self, values):
+        with self._lock:
+            self._ensureLoaded()
+            for key, value in values.items():
+                self._data[key] = copy.deepcopy(value)
+            self._scheduleWrite()
+
+    def replace(self, data):
+        with self._lock:
+            self._ensureLoaded()
+            self._data = copy.deepcopy(data)
+            self._scheduleWrite()
+
+    def reload(self):
+        with self._lock:
+            self._load()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._write()
+
+    def _stamp(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _ensureLoaded(self):
+        if self._data is None:
+            self._load()
+            return
+        # Pending local edits win over the file until they are written out.
+        if self._dirty:
+            return
+        now = time.monotonic()
+        if now - self._lastStat < STAT_INTERVAL:
+            return
+        self._lastStat = now
+        if self._stamp() != self._fileStamp:
+            self._load()
+
+    def _load(self):
+        self._lastStat = time.monotonic()
+        self._fileStamp = self._stamp()
+        data = {}
+        if self._fileStamp is not None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except Exception:
+                data = {}
+        self._data = data if isinstance(data, dict) else {}
+        self._dirty = False
+
+    def _scheduleWrite(self):
+        self._dirty = True
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.write_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _write(self):
+        # Write to a temp file in the same directory and rename it over the
+        # config so a crash never leaves a half-written file behind.
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".credentials_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+        self._fileStamp = self._stamp()
+        self._lastStat = time.monotonic()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_config_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ConfigStore(credentials_file_path())
+            atexit.register(_store.flush)
+        return _store
+
+# ------------------------------
+# Helper functions for credentials JSON
+# ------------------------------
+def load_credentials():
+    return get_config_store().data()
+
+def save_credentials(data):
+    get_config_store().replace(data)
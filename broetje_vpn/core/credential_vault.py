@@ -0,0 +1,275 @@
+import base64
+import json
+import os
+import secrets
+import tempfile
+import threading
+
+from .app_paths import data_dir
+
+VAULT_FILE_NAME = "credentials_vault.json"
+KEY_FILE_NAME = "vault.key"
+VAULT_VERSION = 2
+KEYSTORE_ENV = "BROETJE_KEYSTORE"
+# Binds every sealed blob to this application and format version.
+VAULT_CONTEXT = b"broetje-vpn-vault:2"
+
+class VaultError(Exception):
+    pass
+
+class VaultKeyLostError(VaultError):
+    # The vault file is there but its key is missing, damaged or belongs to
+    # someone else; only a reset (and entering the passwords again) helps.
+    def __init__(self, reason):
+        super().__init__(f"{reason}. The saved passwords cannot be recovered; reset the credential vault "
+                         "(GUI prompt or \"cli.py vault-reset\") and enter them again.")
+
+# ------------------------------
+# Keystores that seal the vault contents
+# ------------------------------
+class DpapiKeystore:
+    # DPAPI encrypts and authenticates the whole vault with a key Windows
+    # derives from the user's logon; nothing key-like is stored by us.
+    NAME = "dpapi"
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class DataBlob(ctypes.Structure):
+            _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+        self.ctypes = ctypes
+        self.DataBlob = DataBlob
+        self.crypt32 = ctypes.WinDLL("crypt32", use_last_error=True)
+        self.kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    def _blob(self, data):
+        ctypes = self.ctypes
+        buffer = ctypes.create_string_buffer(data, len(data))
+        return self.DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char))), buffer
+
+    def _call(self, function, data):
+        ctypes = self.ctypes
+        blob_in, keep_in = self._blob(data)
+        entropy, keep_entropy = self._blob(VAULT_CONTEXT)
+        blob_out = self.DataBlob()
+        if not function(ctypes.byref(blob_in), None, ctypes.byref(entropy), None, None, 0, ctypes.byref(blob_out)):
+            raise VaultError(f"DPAPI call failed (error {ctypes.get_last_error()})")
+        try:
+            return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+        finally:
+            self.kernel32.LocalFree(blob_out.pbData)
+
+    def exists(self):
+        return True
+
+    def reset(self):
+        pass
+
+    def protect(self, data):
+        return self._call(self.crypt32.CryptProtectData, data)
+
+    def unprotect(self, blob):
+        try:
+            return self._call(self.crypt32.CryptUnprotectData, blob)
+        except VaultError as e:
+            raise VaultKeyLostError(f"Windows cannot decrypt the credential vault for this user ({str(e)})")
+
+
+class FileKeystore:
+    # AES-256-GCM (from the optional "cryptography" package) with a random
+    # key in a file only the user may read. Used off Windows and for local
+    # testing; anyone who can read the user's files can read the key too.
+    NAME = "file"
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(data_dir(), KEY_FILE_NAME)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def reset(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _cipher(self, create):
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise VaultError("The file keystore needs the 'cryptography' package (pip install cryptography)")
+        try:
+            with open(self.path, "rb") as f:
+                key = f.read()
+        except FileNotFoundError:
+            if not create:
+                raise VaultKeyLostError(f"The credential vault key {self.path} is missing")
+            key = self._create()
+        if len(key) != 32:
+            raise VaultKeyLostError(f"The credential vault key {self.path} is damaged")
+        return AESGCM(key)
+
+    def _create(self):
+        # The key is written completely before it appears under its name, so
+        # a concurrent reader never sees half of it. Linking fails if another
+        # process got there first; that process's key wins.
+        key = secrets.token_bytes(32)
+        tmp_path = f"{self.path}.{secrets.token_hex(8)}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.link(tmp_path, self.path)
+            except FileExistsError:
+                with open(self.path, "rb") as f:
+                    return f.read()
+        finally:
+            os.remove(tmp_path)
+        return key
+
+    def protect(self, data):
+        nonce = secrets.token_bytes(12)
+        return nonce + self._cipher(create=True).encrypt(nonce, data, VAULT_CONTEXT)
+
+    def unprotect(self, blob):
+        cipher = self._cipher(create=False)
+        from cryptography.exceptions import InvalidTag
+        try:
+            return cipher.decrypt(blob[:12], blob[12:], VAULT_CONTEXT)
+        except InvalidTag:
+            raise VaultKeyLostError("The credential vault does not match its key")
+
+
+def default_keystore():
+    if os.name == "nt" and os.environ.get(KEYSTORE_ENV, "").lower() != "file":
+        return DpapiKeystore()
+    return FileKeystore()
+
+# ------------------------------
+# Encrypted password vault, decrypted once per session
+# ------------------------------
+class CredentialVault:
+    def __init__(self, path=None, keystore=None):
+        self.path = path or os.path.join(data_dir(), VAULT_FILE_NAME)
+        self.keystore = keystore or default_keystore()
+        self._lock = threading.RLock()
+        self._secrets = None
+
+    def isUnlocked(self):
+        with self._lock:
+            return self._secrets is not None
+
+    def unlock(self):
+        with self._lock:
+            if self._secrets is not None:
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    blob = json.load(f)
+            except FileNotFoundError:
+                self._secrets = {}
+                return
+            except ValueError:
+                raise VaultKeyLostError("The credential vault file is corrupt")
+            if not isinstance(blob, dict) or blob.get("version") != VAULT_VERSION:
+                raise VaultKeyLostError("The credential vault was written by an unsupported version")
+            if blob.get("keystore") != self.keystore.NAME:
+                raise VaultKeyLostError(f"The credential vault was sealed with the {blob.get('keystore')} keystore")
+            try:
+                sealed = base64.b64decode(blob["data"])
+            except (KeyError, ValueError):
+                raise VaultKeyLostError("The credential vault file is corrupt")
+            plaintext = self.keystore.unprotect(sealed)
+            self._secrets = json.loads(plaintext.decode("utf-8"))
+
+    def reset(self):
+        # Throws away every saved password together with the key; the next
+        # save starts an empty vault with a new key.
+        with self._lock:
+            self._secrets = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.keystore.reset()
+
+    def lock(self):
+        with self._lock:
+            self._secrets = None
+
+    def get(self, name, default=""):
+        with self._lock:
+            self.unlock()
+            return self._secrets.get(name, default)
+
+    def names(self):
+        with self._lock:
+            self.unlock()
+            return sorted(self._secrets)
+
+    def set(self, name, password):
+        with self._lock:
+            self.unlock()
+            self._secrets[name] = password
+            self._write()
+
+    def delete(self, name):
+        with self._lock:
+            self.unlock()
+            if self._secrets.pop(name, None) is not None:
+                self._write()
+
+    def _write(self):
+        sealed = self.keystore.protect(json.dumps(self._secrets).encode("utf-8"))
+        blob = {"version": VAULT_VERSION, "keystore": self.keystore.NAME,
+                "data": base64.b64encode(sealed).decode("ascii")}
+        directory = os.path.dirname(self.path) or "."
+        # mkstemp creates the file readable by the user only.
+        fd, tmp_path = tempfile.mkstemp(prefix=".vault_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(blob, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+# ------------------------------
+# Moving plain-text passwords out of the config
+# ------------------------------
+def migrate_plaintext_passwords(store, vault, credential_keys):
+    # Returns the names of the entries that were moved.
+    moved = []
+    updates = {}
+    for key in credential_keys:
+        entry = store.get(key)
+        if not isinstance(entry, dict) or "password" not in entry:
+            continue
+        password = entry.pop("password")
+        if password:
+            vault.set(key, password)
+            moved.append(key)
+        updates[key] = entry
+    if updates:
+        store.update(updates)
+    return moved
+
+_vault = None
+_vault_lock = threading.Lock()
+
+def get_vault():
+    global _vault
+    with _vault_lock:
+        if _vault is None:
+            _vault = CredentialVault()
+        return _vault
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .app_paths import cache_dir
+from .listing_cache import IS_DIR, MTIME, NAME, SIZE, iter_directory_pages
+from .transfer import CHUNK_SIZE, PART_META_SUFFIX, PART_SUFFIX, TransferJob, copy_file
+
+MANIFEST_VERSION = 1
+# Files at least this big keep per-chunk hashes and are updated chunk-wise;
+# smaller ones are simply copied again when they change.
+DELTA_MIN_SIZE = 8 * CHUNK_SIZE
+SYNC_WORKERS = 2
+# SMB and FAT round modification times to two seconds.
+MTIME_TOLERANCE = 2.0
+
+UNCHANGED, COPIED, DELTA, DELETED, FAILED = "unchanged", "copied", "delta", "deleted", "failed"
+
+def chunk_digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def same_mtime(a, b):
+    return abs(a - b) <= MTIME_TOLERANCE
+
+def manifest_path_for(source, dest):
+    key = os.path.normcase(os.path.normpath(source)) + "\0" + os.path.normcase(os.path.normpath(dest))
+    return os.path.join(cache_dir("sync"), hashlib.sha1(key.encode("utf-8")).hexdigest() + ".z")
+
+# ------------------------------
+# Local manifest of what the last sync wrote
+# ------------------------------
+class SyncManifest:
+    # rel path -> [size, mtime, [chunk hashes]]; size and mtime are those of
+    # the source file, which the synced copy also carries.
+    def __init__(self, source, dest, path=None):
+        self.source = source
+        self.dest = dest
+        self.path = path or manifest_path_for(source, dest)
+        self.files = {}
+
+    def load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except (OSError, ValueError, zlib.error):
+            return False
+        if data.get("version") != MANIFEST_VERSION:
+            return False
+        self.files = data.get("files", {})
+        return True
+
+    def save(self):
+        blob = zlib.compress(json.dumps({"version": MANIFEST_VERSION, "source": self.source, "dest": self.dest,
+                                         "files": self.files}, separators=(",", ":")).encode("utf-8"), 6)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, self.path)
+
+# ------------------------------
+# Tree walk and per-file sync
+# ------------------------------
+def walk_tree(root, should_stop=None):
+    # Returns (files, dirs, unreadable). Size and mtime come with the
+    # directory enumeration, so the walk is one listing per folder.
+    files = {}
+    dirs = []
+    unreadable = []
+    stack = [""]
+    while stack:
+        if should_stop is not None and should_stop():
+            break
+        rel = stack.pop()
+        try:
+            for page in iter_directory_pages(os.path.join(root, rel)):
+                for entry in page:
+                    child = os.path.join(rel, entry[NAME]) if rel else entry[NAME]
+                    if entry[IS_DIR]:
+                        dirs.append(child)
+                        stack.append(child)
+                    elif not entry[NAME].endswith((PART_SUFFIX, PART_META_SUFFIX)):
+                        files[child] = (entry[SIZE], entry[MTIME])
+        except OSError:
+            unreadable.append(rel)
+    return files, dirs, unreadable
+
+def delta_copy(source_path, dest_path, known_hashes=None, chunk_size=CHUNK_SIZE):
+    # Streams the source once, hashing every chunk. With known_hashes (the
+    # chunks dest_path holds now) only differing chunks are written;
+    # without them the file is written to a .part and swapped in.
+    # Returns (hashes, bytes_read, bytes_written).
+    st = os.stat(source_path)
+    in_place = known_hashes is not None
+    target = dest_path if in_place else dest_path + PART_SUFFIX
+    hashes = []
+    read = written = 0
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(source_path, "rb", buffering=0) as src, open(target, "r+b" if in_place else "wb", buffering=0) as dst:
+        index = 0
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            digest = chunk_digest(view[:n])
+            hashes.append(digest)
+            if not in_place or index >= len(known_hashes) or known_hashes[index] != digest:
+                dst.seek(index * chunk_size)
+                dst.write(view[:n])
+                written += n
+            read += n
+            index += 1
+        dst.truncate(read)
+        os.fsync(dst.fileno())
+    os.utime(target, (st.st_atime, st.st_mtime))
+    if not in_place:
+        os.replace(target, dest_path)
+    return hashes, read, written
+
+def sync_file(source_path, dest_path, size, mtime, known, chunk_size=CHUNK_SIZE):
+    # Returns (action, manifest entry, bytes_read, bytes_written).
+    try:
+        dst = os.stat(dest_path)
+    except OSError:
+        dst = None
+    # The local copy is only trusted if it still is exactly what we wrote.
+    intact = (known is not None and dst is not None and dst.st_size == known[0]
+              and same_mtime(dst.st_mtime, known[1]))
+    if intact and known[0] == size and same_mtime(known[1], mtime):
+        return UNCHANGED, known, 0, 0
+    if known is None and dst is not None and dst.st_size == size and same_mtime(dst.st_mtime, mtime):
+        # Copied earlier by other means (e.g. Explorer); adopt it as is.
+        return UNCHANGED, [size, mtime, []], 0, 0
+    os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+    if size >= DELTA_MIN_SIZE:
+        hashes, read, written = delta_copy(source_path, dest_path, known[2] if intact and known[2] else None,
+                                           chunk_size)
+        return (DELTA if intact and known[2] else COPIED), [size, mtime, hashes], read, written
+    job = TransferJob(source_path, dest_path)
+    copy_file(job, chunk_size)
+    return COPIED, [job.size, mtime, []], job.size - job.resumedFrom, job.size - job.resumedFrom
+
+
+class SyncResult:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys((UNCHANGED, COPIED, DELTA, DELETED, FAILED), 0)
+        self.bytesRead = 0
+        self.bytesWritten = 0
+        self.errors = []
+        self.total = 0
+        self.done = 0
+        self.stopped = False
+
+    def add(self, action, read=0, written=0, error=None):
+        with self.lock:
+            self.counts[action] += 1
+            self.bytesRead += read
+            self.bytesWritten += written
+            if error is not None:
+                self.errors.append(error)
+
+    def ok(self):
+        return not self.errors and not self.stopped
+
+    def summary(self):
+        return (f"{self.counts[COPIED]} copied, {self.counts[DELTA]} updated in place, "
+                f"{self.counts[UNCHANGED]} unchanged, {self.counts[DELETED]} deleted, {self.counts[FAILED]} failed; "
+                f"{self.bytesRead / 1048576.0:.1f} MB read, {self.bytesWritten / 1048576.0:.1f} MB written")
+
+def _under(rel, prefixes):
+    return any(p == "" or rel == p or rel.startswith(p + os.sep) for p in prefixes)
+
+def sync_tree(source, dest, delete=False, on_progress=None, should_stop=None, max_workers=SYNC_WORKERS,
+              manifest=None, chunk_size=CHUNK_SIZE):
+    # One-way sync of source into dest. on_progress(done, total, rel_path)
+    # is called from the calling thread as files complete.
+    manifest = manifest or SyncManifest(source, dest)
+    manifest.load()
+    result = SyncResult()
+    files, dirs, unreadable = walk_tree(source, should_stop)
+    result.total = len(files)
+    for rel in dirs:
+        os.makedirs(os.path.join(dest, rel), exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sync") as pool:
+        futures = {pool.submit(sync_file, os.path.join(source, rel), os.path.join(dest, rel), size, mtime,
+                               manifest.files.get(rel), chunk_size): rel
+                   for rel, (size, mtime) in files.items()}
+        for future in as_completed(futures):
+            rel = futures[future]
+            if should_stop is not None and should_stop():
+                result.stopped = True
+                for pending in futures:
+                    pending.cancel()
+            if future.cancelled():
+                continue
+            try:
+                action, entry, read, written = future.result()
+                manifest.files[rel] = entry
+                result.add(action, read, written)
+            except OSError as e:
+                result.add(FAILED, error=f"{rel}: {str(e)}")
+            result.done += 1
+            if on_progress is not None:
+                on_progress(result.done, result.total, rel)
+    if not result.stopped and not (should_stop is not None and should_stop()):
+        # Files gone from the source. Folders that could not be listed are
+        # left alone rather than treated as empty.
+        for rel in [r for r in manifest.files if r not in files and not _under(r, unreadable)]:
+            known = manifest.files.pop(rel)
+            if not delete:
+                continue
+            path = os.path.join(dest, rel)
+            try:
+                st = os.stat(path)
+                # Only remove copies nobody touched since we wrote them.
+                if st.st_size == known[0] and same_mtime(st.st_mtime, known[1]):
+                    os.remove(path)
+                    result.add(DELETED)
+            except OSError:
+                pass
+    else:
+        result.stopped = True
+    for rel in unreadable:
+        result.errors.append(f"{rel or source}: folder could not be listed")
+    manifest.save()
+    return result
@@ -0,0 +1,192 @@
+import re
+import threading
+import time
+
+from .runner import get_runner
+
+# Seconds a drive scan is served from the cache before the next request
+# triggers a background rescan.
+DRIVE_CACHE_TTL = 30
+SCAN_TIMEOUT = 10
+
+# Every connection line: the status column may be OK, Disconnected,
+# Unavailable, Reconnecting, ... or empty, and all of them occupy the letter.
+# The remote may contain spaces, so it runs to the end of the line and the
+# network name column is cut off separately.
+NET_USE_PATTERN = re.compile(r"^[ \t]*(?:([A-Za-z]+)[ \t]+)?(\w:)[ \t]+(\\\\.*?)[ \t]*$")
+# Where "net use" puts the network name when the header cannot be read.
+NETWORK_COLUMN = 49
+
+# ------------------------------
+# Parsing of "net use" and "wmic logicaldisk" output
+# ------------------------------
+class DriveEntry:
+    def __init__(self, drive, remote, status=""):
+        self.drive = drive
+        self.remote = remote
+        self.status = status
+
+    def display(self):
+        return f"{self.drive}  {self.remote}"
+
+    def isConnected(self):
+        # Only "OK" counts. An empty status (net use had nothing to say, or
+        # the letter is only known from wmic) is treated like the other
+        # states: the letter is occupied but not known to work.
+        return self.status == "OK"
+
+def network_column(lines):
+    # The header row is localized, but its last column title starts where
+    # the network names do.
+    for i, line in enumerate(lines):
+        if line.startswith("-----"):
+            for header in reversed(lines[:i]):
+                if header.strip():
+                    return len(header.rstrip()) - len(header.split()[-1])
+    return NETWORK_COLUMN
+
+def parse_net_use(output):
+    lines = output.splitlines()
+    column = network_column(lines)
+    entries = []
+    for i, line in enumerate(lines):
+        match = NET_USE_PATTERN.match(line)
+        if match is None:
+            continue
+        status, drive, remote = match.groups()
+        following = lines[i + 1] if i + 1 < len(lines) else ""
+        wrapped = following[:1].isspace() and following.strip() and NET_USE_PATTERN.match(following) is None
+        # Short remotes are padded up to the network name on the same line;
+        # long ones push the network name onto a line of its own.
+        if not wrapped and match.start(3) < column < len(line) and line[column - 1].isspace():
+            remote = line[match.start(3):column].rstrip()
+        elif not wrapped:
+            # Output that does not line up with the header: the network name
+            # is whatever follows the first wide gap.
+            remote = re.split(r"[ \t]{2,}", remote)[0]
+        entries.append(DriveEntry(drive, remote, status or ""))
+    return entries
+
+def parse_wmic(output):
+    entries = []
+    for line in output.splitlines()[1:]:
+        if line.strip():
+            parts = line.split()
+            if len(parts) >= 2:
+                entries.append(DriveEntry(parts[0], " ".join(parts[1:])))
+    return entries
+
+def scan_net_use(timeout=SCAN_TIMEOUT):
+    return parse_net_use(get_runner().check_output(["net", "use"], timeout=timeout))
+
+def scan_drives(timeout=SCAN_TIMEOUT):
+    # Returns (entries, error). Drives reported by "net use" win over the
+    # same letter coming from wmic.
+    entries = []
+    error = None
+    drives_added = set()
+    try:
+        for entry in scan_net_use(timeout):
+            entries.append(entry)
+            drives_added.add(entry.drive.upper())
+    except Exception as e:
+        error = str(e)
+    try:
+        wmic_output = get_runner().check_output(
+            ["wmic", "logicaldisk", "where", "drivetype=4", "get", "DeviceID,ProviderName"],
+            timeout=timeout)
+        for entry in parse_wmic(wmic_output):
+            if entry.drive.upper() not in drives_added:
+                entries.append(entry)
+                drives_added.add(entry.drive.upper())
+    except Exception:
+        pass
+    return entries, error
+
+# ------------------------------
+# Process-wide drive inventory with a TTL cache and background rescans
+# ------------------------------
+class DriveInventory:
+    def __init__(self, ttl=DRIVE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = []
+        self._error = None
+        self._scannedAt = None
+        self._scanThread = None
+        self._rescanRequested = False
+        self._listeners = []
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._entries), self._error
+
+    def hasScanned(self):
+        with self._lock:
+            return self._scannedAt is not None
+
+    def isStale(self):
+        with self._lock:
+            return self._scannedAt is None or time.monotonic() - self._scannedAt > self.ttl
+
+    def addListener(self, callback):
+        # Listeners are called from the scanning thread with (entries, error).
+        with self._lock:
+            self._listeners.append(callback)
+
+    def removeListener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def invalidate(self):
+        with self._lock:
+            self._scannedAt = None
+
+    def refresh(self, force=False):
+        # Starts a background scan if the cache is stale (or force is set).
+        # Returns True if a scan is running afterwards.
+        if not force and not self.isStale():
+            return False
+        with self._lock:
+            if self._scanThread is not None and self._scanThread.is_alive():
+                # A scan that started before the invalidation may miss the
+                # change, so queue one more pass behind it.
+                self._rescanRequested = self._rescanRequested or force
+                return True
+            self._scanThread = threading.Thread(target=self._scanLoop, name="drive-inventory", daemon=True)
+            self._scanThread.start()
+        return True
+
+    def scanNow(self):
+        entries, error = scan_drives()
+        self._store(entries, error)
+        return entries, error
+
+    def _scanLoop(self):
+        while True:
+            self.scanNow()
+            with self._lock:
+                if not self._rescanRequested:
+                    self._scanThread = None
+                    return
+                self._rescanRequested = False
+
+    def _store(self, entries, error):
+        with self._lock:
+            self._entries = entries
+            self._error = error
+            self._scannedAt = time.monotonic()
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback(list(entries), error)
+
+_inventory = None
+_inventory_lock = threading.Lock()
+
+def get_drive_inventory():
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = DriveInventory()
+        return _inventory
@@ -0,0 +1,60 @@
+from collections import namedtuple
+
+ERROR_KEY = "error"
+
+# key is stable across scans ("drive:N:", "server:<id>"); path is what the
+# folder browser roots at.
+DriveListItem = namedtuple("DriveListItem", ["key", "display", "path"])
+
+def sort_key(item):
+    return (item.display.lower(), item.key)
+
+def drive_list_items(entries, error, custom_servers):
+    # Mapped drives (already merged from net use and wmic by scan_drives)
+    # plus the custom servers, one item per key, sorted for the dropdown.
+    items = {}
+    if error:
+        items[ERROR_KEY] = DriveListItem(ERROR_KEY, "Error retrieving drives", "")
+    for entry in entries:
+        key = "drive:" + entry.drive.upper()
+        items.setdefault(key, DriveListItem(key, entry.display(), entry.drive + "/"))
+    for server in custom_servers:
+        address = server.get("address", "")
+        key = "server:" + (server.get("id") or address.lower())
+        items.setdefault(key, DriveListItem(key, "Custom: " + server.get("description", "Custom Server"), address))
+    return sorted(items.values(), key=sort_key)
+
+def diff_sorted(old, new):
+    # Turns one sorted item list into another with as few row operations as
+    # possible. Returns (removed, inserted, changed):
+    #   removed  - [(first, last)] runs of rows in old, bottom-up
+    #   inserted - [(row, [items])] runs in the final list, top-down
+    #   changed  - final rows whose display or path changed in place
+    # An item whose sort position changed is removed and re-inserted.
+    wanted = {item.key: item for item in new}
+    survivors = []
+    removed = []
+    for row, item in enumerate(old):
+        target = wanted.get(item.key)
+        if target is not None and sort_key(target) == sort_key(item):
+            survivors.append(item)
+            continue
+        if removed and removed[-1][1] == row - 1:
+            removed[-1] = (removed[-1][0], row)
+        else:
+            removed.append((row, row))
+    removed.reverse()
+    # What is left of old is now a subsequence of new.
+    inserted = []
+    changed = []
+    pos = 0
+    for row, item in enumerate(new):
+        if pos < len(survivors) and survivors[pos].key == item.key:
+            if survivors[pos] != item:
+                changed.append(row)
+            pos += 1
+        elif inserted and inserted[-1][0] + len(inserted[-1][1]) == row:
+            inserted[-1][1].append(item)
+        else:
+            inserted.append((row, [item]))
+    return removed, inserted, changed
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import sqlite3
+import stat
+import threading
+import time
+
+from .app_paths import cache_dir
+from .listing_cache import listing_key
+from .transfer import TransferJob, copy_file, discard_part
+
+FILE_CACHE_DB_NAME = "files.sqlite3"
+DEFAULT_FILE_CACHE_MB = 2048
+# Files bigger than this share of the budget are opened straight from the
+# share; caching them would flush everything else.
+MAX_FILE_SHARE = 0.25
+# A fresh copy is completed next to the cached one and then swapped in.
+NEW_SUFFIX = ".new"
+
+class CachedCopyInUse(OSError):
+    # The cached copy could not be replaced with the current version,
+    # typically because it is open (and locked) in another program.
+    def __init__(self, local, error):
+        super().__init__(error.errno, "the cached copy is open in another program and could not be updated", local)
+        self.local = local
+
+# ------------------------------
+# Size-bounded LRU cache of opened remote files
+# ------------------------------
+class FileCache:
+    def __init__(self, root=None, max_bytes=DEFAULT_FILE_CACHE_MB * 1024 * 1024):
+        self.root = root or cache_dir("files")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.root, FILE_CACHE_DB_NAME), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, source TEXT, local TEXT, size INTEGER, mtime REAL, "
+            "stored REAL, accessed REAL)")
+        self._conn.commit()
+
+    def localPath(self, source):
+        # Keeps the original name so the default application is picked by
+        # its extension.
+        digest = hashlib.sha1(listing_key(source).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, digest, os.path.basename(source))
+
+    def lookup(self, source):
+        # Returns (local, size, mtime, stored) or None.
+        with self._lock:
+            row = self._conn.execute("SELECT local, size, mtime, stored FROM files WHERE path = ?",
+                                     (listing_key(source),)).fetchone()
+        if row is None or not os.path.exists(row[0]):
+            return None
+        return row
+
+    def touch(self, source):
+        with self._lock:
+            self._conn.execute("UPDATE files SET accessed = ? WHERE path = ?", (time.time(), listing_key(source)))
+            self._conn.commit()
+
+    def store(self, source, st):
+        local = self.localPath(source)
+        staging = local + NEW_SUFFIX
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        job = TransferJob(source, staging)
+        try:
+            copy_file(job)
+        except OSError:
+            discard_part(staging)
+            raise
+        # Cached copies are read-only so nobody edits one believing it is
+        # the file on the share.
+        os.chmod(staging, stat.S_IREAD)
+        try:
+            if os.path.exists(local):
+                os.chmod(local, stat.S_IREAD | stat.S_IWRITE)
+            os.replace(staging, local)
+        except OSError as e:
+            os.chmod(staging, stat.S_IREAD | stat.S_IWRITE)
+            os.remove(staging)
+            raise CachedCopyInUse(local, e)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, source, local, size, mtime, stored, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", (listing_key(source), source, local, st.st_size, st.st_mtime, now, now))
+            self._conn.commit()
+        self.evict()
+        return local
+
+    def evict(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT path, local, size FROM files ORDER BY accessed DESC").fetchall()
+            total = 0
+            dropped = []
+            for path, local, size in rows:
+                total += size
+                if total > self.max_bytes:
+                    dropped.append((path, local))
+            for path, local in dropped:
+                # The file goes first; one that is still open somewhere
+                # keeps its row and is evicted on a later pass.
+                try:
+                    os.chmod(local, stat.S_IREAD | stat.S_IWRITE)
+                    os.remove(local)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue
+                try:
+                    os.rmdir(os.path.dirname(local))
+                except OSError:
+                    pass
+                self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._conn.commit()
+
+    def totalBytes(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+
+    def open(self, source, refresh=False):
+        # Returns (path to open, stored timestamp or None). The timestamp is
+        # set only when the share could not be reached and an older copy is
+        # served instead. Validation is a single stat of the remote file.
+        # Raises CachedCopyInUse when a newer version exists but the cached
+        # copy is locked; its .local is still worth opening.
+        cached = self.lookup(source)
+        try:
+            st = os.stat(source)
+        except OSError:
+            if cached is None:
+                raise
+            self.touch(source)
+            return cached[0], cached[3]
+        if st.st_size > self.max_bytes * MAX_FILE_SHARE:
+            return source, None
+        if cached is not None and not refresh and cached[1] == st.st_size and cached[2] == st.st_mtime:
+            self.touch(source)
+            return cached[0], None
+        try:
+            return self.store(source, st), None
+        except CachedCopyInUse:
+            raise
+        except OSError:
+            # The link dropped mid-copy; an older copy still beats nothing.
+            if cached is None:
+                raise
+            return cached[0], cached[3]
+
+_file_cache = None
+_file_cache_lock = threading.Lock()
+
+def get_file_cache(max_bytes=None):
+    global _file_cache
+    with _file_cache_lock:
+        if _file_cache is None:
+            _file_cache = FileCache()
+        if max_bytes is not None:
+            _file_cache.max_bytes = max_bytes
+        return _file_cache
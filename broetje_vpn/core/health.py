@@ -0,0 +1,230 @@
+import itertools
+import math
+import os
+import socket
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, wait
+
+PROBE_INTERVAL = 10
+PROBE_TIMEOUT = 3.0
+VPN_PORT = 443
+# One hour of samples at the default interval.
+RING_CAPACITY = 360
+THROUGHPUT_BYTES = 64 * 1024
+THROUGHPUT_SCAN_LIMIT = 50
+DEGRADED_RTT_MS = 150.0
+
+UP, DEGRADED, DOWN, UNKNOWN = "up", "degraded", "down", "unknown"
+
+# ------------------------------
+# Compact time-series ring buffer
+# ------------------------------
+class TimeSeriesRing:
+    # Parallel typed arrays instead of a list of objects: a full ring for one
+    # target is a few KB. Missing values are stored as NaN.
+    def __init__(self, capacity=RING_CAPACITY):
+        self.capacity = capacity
+        self.timestamps = array("d", [0.0] * capacity)
+        self.rtt = array("d", [math.nan] * capacity)
+        self.throughput = array("d", [math.nan] * capacity)
+        self.reachable = array("b", [0] * capacity)
+        self.count = 0
+        self.head = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp, reachable, rtt_ms=math.nan, kbps=math.nan):
+        with self.lock:
+            i = self.head
+            self.timestamps[i] = timestamp
+            self.reachable[i] = 1 if reachable else 0
+            self.rtt[i] = rtt_ms
+            self.throughput[i] = kbps
+            self.head = (i + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def _ordered(self, values):
+        start = (self.head - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return list(values[start:start + self.count])
+        return list(values[start:]) + list(values[:self.head])
+
+    def series(self, field):
+        with self.lock:
+            return self._ordered(getattr(self, field))
+
+    def latest(self):
+        with self.lock:
+            if not self.count:
+                return None
+            i = (self.head - 1) % self.capacity
+            return (self.timestamps[i], bool(self.reachable[i]), self.rtt[i], self.throughput[i])
+
+    def recentRtt(self, samples=6):
+        values = [v for v in self.series("rtt")[-samples:] if not math.isnan(v)]
+        return sum(values) / len(values) if values else math.nan
+
+# ------------------------------
+# Probes
+# ------------------------------
+def probe_server(host, port=VPN_PORT, timeout=PROBE_TIMEOUT):
+    # TCP handshake time to the VPN endpoint; returns (reachable, rtt_ms, kbps).
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    except OSError:
+        return False, math.nan, math.nan
+    return True, (time.perf_counter() - start) * 1000.0, math.nan
+
+_share_rounds = itertools.count()
+
+def probe_share(path, read_bytes=THROUGHPUT_BYTES, round_no=None):
+    # A stat of the share root is one SMB round trip; reading 64 KiB of a
+    # file gives a small-transfer throughput figure. The SMB client caches
+    # what it has read, so every round reads a different slice (rotating
+    # over the files found, then over offsets within them) instead of the
+    # same head of the same file.
+    start = time.perf_counter()
+    try:
+        os.stat(path)
+    except OSError:
+        return False, math.nan, math.nan
+    rtt_ms = (time.perf_counter() - start) * 1000.0
+    kbps = math.nan
+    if round_no is None:
+        round_no = next(_share_rounds)
+    try:
+        candidates = []
+        with os.scandir(path) as it:
+            for n, dirent in enumerate(it):
+                if n >= THROUGHPUT_SCAN_LIMIT:
+                    break
+                if dirent.is_file():
+                    size = dirent.stat().st_size
+                    if size > 0:
+                        candidates.append((dirent.path, size))
+        if candidates:
+            candidates.sort()
+            file_path, size = candidates[round_no % len(candidates)]
+            slots = max(1, size // read_bytes)
+            offset = (round_no // len(candidates)) % slots * read_bytes
+            start = time.perf_counter()
+            with open(file_path, "rb", buffering=0) as f:
+                f.seek(offset)
+                received = len(f.read(read_bytes))
+            elapsed = time.perf_counter() - start
+            if elapsed > 0 and received:
+                kbps = received / 1024.0 / elapsed
+    except OSError:
+        pass
+    return True, rtt_ms, kbps
+
+# ------------------------------
+# Background health monitor
+# ------------------------------
+class HealthMonitor:
+    def __init__(self, interval=PROBE_INTERVAL, capacity=RING_CAPACITY, timeout=PROBE_TIMEOUT):
+        self.interval = interval
+        self.capacity = capacity
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.servers = []
+        self.shares = []
+        self.rings = {}
+        # Probes that outlived their round; target -> future.
+        self.inFlight = {}
+        self.listeners = []
+        self.stopEvent = threading.Event()
+        self.thread = None
+        # SMB calls cannot be given a timeout, so probes run on their own
+        # pool and a hung share only costs one worker.
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+
+    def setTargets(self, servers=None, shares=None):
+        with self.lock:
+            if servers is not None:
+                self.servers = [s for s in servers if s]
+            if shares is not None:
+                self.shares = [s for s in shares if s]
+
+    def addListener(self, callback):
+        # Called from the monitor thread with (target, ring) after each probe.
+        with self.lock:
+            self.listeners.append(callback)
+
+    def targets(self):
+        with self.lock:
+            return sorted(self.rings)
+
+    def ring(self, target):
+        with self.lock:
+            ring = self.rings.get(target)
+            if ring is None:
+                ring = self.rings[target] = TimeSeriesRing(self.capacity)
+            return ring
+
+    def status(self, target):
+        ring = self.rings.get(target)
+        latest = ring.latest() if ring is not None else None
+        if latest is None:
+            return UNKNOWN
+        if not latest[1]:
+            return DOWN
+        rtt = ring.recentRtt()
+        if not math.isnan(rtt) and rtt > DEGRADED_RTT_MS:
+            return DEGRADED
+        return UP
+
+    def probeOnce(self):
+        with self.lock:
+            targets = [(s, probe_server) for s in self.servers] + [(s, probe_share) for s in self.shares]
+        futures = {}
+        for target, probe in targets:
+            previous = self.inFlight.get(target)
+            if previous is not None and not previous.done():
+                # Still hung from an earlier round; another probe would only
+                # tie up a second worker on the same share.
+                continue
+            self.inFlight.pop(target, None)
+            futures[self.pool.submit(probe, target)] = target
+        done, pending = wait(futures, timeout=self.timeout + 1.0)
+        for future in pending:
+            # Queued probes are dropped; running ones cannot be interrupted
+            # and are skipped until they return.
+            if not future.cancel():
+                self.inFlight[futures[future]] = future
+        results = {futures[future]: future for future in done}
+        now = time.time()
+        for target, _ in targets:
+            reachable, rtt_ms, kbps = False, math.nan, math.nan
+            if target in results:
+                try:
+                    reachable, rtt_ms, kbps = results[target].result()
+                except Exception:
+                    pass
+            ring = self.ring(target)
+            ring.append(now, reachable, rtt_ms, kbps)
+            with self.lock:
+                listeners = list(self.listeners)
+            for callback in listeners:
+                callback(target, ring)
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self._loop, name="health-monitor", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopEvent.set()
+
+    def _loop(self):
+        while not self.stopEvent.is_set():
+            self.probeOnce()
+            self.stopEvent.wait(self.interval)
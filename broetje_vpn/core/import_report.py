@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from .app_paths import base_dir
+
+DEFAULT_TOP = 20
+
+# ------------------------------
+# Import-time report (python -X importtime)
+# ------------------------------
+def parse_importtime(text):
+    # "import time: self [us] | cumulative | imported package" lines, one per module.
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # the header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+def measure_imports(module, python=None, cwd=None):
+    # A fresh interpreter, so modules already loaded here do not hide their cost.
+    # The checkout goes first on its path, so the report works from any
+    # working directory.
+    root = base_dir()
+    env = dict(os.environ)
+    env.pop("PYTHONIMPORTTIME", None)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (root, env.get("PYTHONPATH")) if p)
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=cwd or root, env=env
+    )
+    rows = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise ImportError(errors[-1] if errors else f"import {module} failed")
+    return rows
+
+def import_report(module, top=DEFAULT_TOP, python=None, cwd=None):
+    rows = measure_imports(module, python=python, cwd=cwd)
+    total = max((cumulative for _, _, cumulative, _ in rows), default=0)
+    lines = [f"import {module}: {total / 1000.0:.1f} ms, {len(rows)} modules",
+             f"{'module':<48}{'self ms':>10}{'cum ms':>10}"]
+    for name, self_us, cumulative_us, _ in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"{name:<48}{self_us / 1000.0:>10.1f}{cumulative_us / 1000.0:>10.1f}")
+    return lines
@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from .app_paths import cache_dir
+
+LISTING_DB_NAME = "listings.sqlite3"
+# Upper bound on remembered directories; the least recently fetched ones
+# are dropped first.
+MAX_CACHED_LISTINGS = 5000
+PRUNE_EVERY = 200
+LISTING_PAGE_SIZE = 500
+
+# A listing entry is a plain tuple (name, is_dir, size, mtime) so that big
+# directories stay cheap to keep in memory and to serialise.
+NAME, IS_DIR, SIZE, MTIME = range(4)
+
+def listing_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def directory_mtime(path):
+    return os.stat(path).st_mtime
+
+def entry_from_dirent(dirent):
+    try:
+        is_dir = dirent.is_dir()
+        st = dirent.stat()
+        return (dirent.name, is_dir, 0 if is_dir else st.st_size, st.st_mtime)
+    except OSError:
+        return (dirent.name, False, 0, 0.0)
+
+def sort_entries(entries):
+    entries.sort(key=lambda e: (not e[IS_DIR], e[NAME].lower()))
+    return entries
+
+def iter_directory_pages(path, page_size=LISTING_PAGE_SIZE):
+    # On Windows os.scandir returns size and mtime with the directory
+    # enumeration itself, so no extra SMB round trip per entry is needed.
+    page = []
+    with os.scandir(path) as it:
+        for dirent in it:
+            page.append(entry_from_dirent(dirent))
+            if len(page) >= page_size:
+                yield page
+                page = []
+    yield page
+
+def list_directory(path):
+    entries = []
+    for page in iter_directory_pages(path):
+        entries.extend(page)
+    return sort_entries(entries)
+
+# ------------------------------
+# Persistent listing cache keyed by directory path and mtime
+# ------------------------------
+class ListingCache:
+    def __init__(self, db_path=None, max_entries=MAX_CACHED_LISTINGS):
+        self.db_path = db_path or os.path.join(cache_dir(), LISTING_DB_NAME)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            "path TEXT PRIMARY KEY, mtime REAL, fetched REAL, entries BLOB)")
+        self._conn.commit()
+
+    def get(self, path):
+        # Returns (mtime, entries) or None.
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, entries FROM listings WHERE path = ?", (listing_key(path),)).fetchone()
+        if row is None:
+            return None
+        try:
+            entries = [tuple(e) for e in json.loads(zlib.decompress(row[1]).decode("utf-8"))]
+        except Exception:
+            return None
+        return row[0], entries
+
+    def put(self, path, mtime, entries):
+        blob = zlib.compress(json.dumps(entries, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (path, mtime, fetched, entries) VALUES (?, ?, ?, ?)",
+                (listing_key(path), mtime, time.time(), blob))
+            self._puts += 1
+            if self._puts % PRUNE_EVERY == 0:
+                self._prune()
+            self._conn.commit()
+
+    def touch(self, path):
+        with self._lock:
+            self._conn.execute("UPDATE listings SET fetched = ? WHERE path = ?", (time.time(), listing_key(path)))
+            self._conn.commit()
+
+    def discard(self, path):
+        with self._lock:
+            self._conn.execute("DELETE FROM listings WHERE path = ?", (listing_key(path),))
+            self._conn.commit()
+
+    def _prune(self):
+        self._conn.execute(
+            "DELETE FROM listings WHERE path NOT IN "
+            "(SELECT path FROM listings ORDER BY fetched DESC LIMIT ?)", (self.max_entries,))
+
+def fetch_listing(path, cache, known_mtime=None):
+    # Returns (changed, mtime, entries). When the directory mtime still
+    # matches known_mtime the listing is not re-read at all.
+    mtime = directory_mtime(path)
+    if known_mtime is not None and mtime == known_mtime:
+        cache.touch(path)
+        return False, mtime, None
+    entries = list_directory(path)
+    cache.put(path, mtime, entries)
+    return True, mtime, entries
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_listing_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ListingCache()
+        return _cache
@@ -0,0 +1,188 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .profiles import get_profile_registry
+from .runner import get_runner
+
+# Number of "net use" processes allowed to run at the same time. Mappings to
+# different drive letters are independent, so they only need a small pool.
+MAX_MAPPING_WORKERS = 4
+MAPPING_TIMEOUT = 15
+DISCONNECT_TIMEOUT = 10
+SYSTEM_ERROR_PATTERN = re.compile(r"System error (\d+)")
+# "net use" system errors that mean the credentials were rejected (wrong
+# password, bad user name, expired or disabled account, locked out).
+# Retrying those with the same password only counts towards a lockout.
+AUTH_ERRORS = {86, 1326, 1327, 1330, 1331, 1907, 1909}
+PASSWORD_MASK = "********"
+
+# ------------------------------
+# A single drive mapping and its outcome
+# ------------------------------
+class MappingJob:
+    def __init__(self, drive, path, username, password):
+        self.drive = drive
+        self.path = path
+        self.username = username
+        self.password = password
+
+    def connectCommand(self):
+        return ["net", "use", self.drive, self.path, f"/user:{self.username}", self.password]
+
+    def disconnectCommand(self):
+        return ["net", "use", self.drive, "/delete", "/Y"]
+
+    def displayCommand(self):
+        # The connect command as it may appear in the console, the log file
+        # or CLI output: never with the password.
+        cmd = self.connectCommand()
+        return " ".join(cmd[:-1] + [PASSWORD_MASK if self.password else ""]).rstrip()
+
+    def mask(self, text):
+        # For exception texts, which can repeat the whole command line.
+        return text.replace(self.password, PASSWORD_MASK) if self.password else text
+
+
+class MappingResult:
+    def __init__(self, drive, path):
+        self.drive = drive
+        self.path = path
+        self.ok = False
+        self.systemError = None
+        self.messages = []
+
+    def text(self):
+        return "\n".join(self.messages)
+
+    def authFailed(self):
+        return self.systemError in AUTH_ERRORS
+
+# ------------------------------
+# Building the mapping jobs for a profile (see profiles.py)
+# ------------------------------
+def mapping_username(status, username):
+    return get_profile_registry().get(status).mappingUsername(username)
+
+def profile_folders(status, data):
+    return get_profile_registry().get(status).folders(data)
+
+def build_mapping_jobs(status, data, username, password):
+    profile = get_profile_registry().resolve(status)
+    if profile is None:
+        raise ValueError(f"Unknown network folder selection: {status}")
+    final_username = profile.mappingUsername(username)
+    return [MappingJob(mapping.get("drive"), mapping.get("path"), final_username, password)
+            for mapping in profile.folders(data)]
+
+# ------------------------------
+# Mapping engine
+# ------------------------------
+def release_drive(job, result, timeout=DISCONNECT_TIMEOUT):
+    # "net use /delete" only returns once the redirector has dropped the
+    # connection, so the drive letter is free for remapping right after it.
+    cmd = job.disconnectCommand()
+    result.messages.append(f"Disconnecting drive {job.drive.replace('/', '')}...")
+    try:
+        proc = get_runner().run(cmd, timeout=timeout)
+        result.messages.append(f"Disconnected drive {job.drive.replace('/', '')}. Return code: {proc.returncode}")
+        return proc.returncode == 0
+    except Exception as e:
+        result.messages.append(f"Exception disconnecting drive {job.drive.replace('/', '')}: {str(e)}")
+        return False
+
+def run_release_job(job):
+    result = MappingResult(job.drive, job.path)
+    result.ok = release_drive(job, result)
+    return result
+
+def run_mapping_job(job, timeout=MAPPING_TIMEOUT, disconnect_first=False, on_released=None):
+    result = MappingResult(job.drive, job.path)
+    if disconnect_first:
+        release_drive(job, result)
+        if on_released is not None:
+            on_released(job.drive)
+    cmd = job.connectCommand()
+    result.messages.append("Executing: " + job.displayCommand())
+    try:
+        proc = get_runner().run(cmd, timeout=timeout)
+        result.messages.append("Return code: " + str(proc.returncode))
+        if proc.stdout.strip():
+            result.messages.append("Output: " + proc.stdout.strip())
+        if proc.stderr.strip():
+            result.messages.append("Error: " + proc.stderr.strip())
+        result.ok = proc.returncode == 0
+        match = SYSTEM_ERROR_PATTERN.search(proc.stderr + proc.stdout)
+        if match:
+            result.systemError = int(match.group(1))
+    except Exception as e:
+        result.messages.append("Exception: " + job.mask(str(e)))
+    if result.ok:
+        result.messages.append(f"Drive {job.drive} mapped to {job.path}.")
+    else:
+        result.messages.append(f"Error mapping drive {job.drive}.")
+    return result
+
+# ------------------------------
+# Reconciling the desired mappings with the live "net use" state
+# ------------------------------
+KEEP, MAP, REMAP = "keep", "map", "remap"
+
+def same_remote(a, b):
+    return a.rstrip("\\").lower() == b.rstrip("\\").lower()
+
+def plan_reconciliation(jobs, live_entries):
+    # Returns [(job, action)]: drives connected ("OK") to the same share are
+    # kept, free letters are mapped directly, and every other occupied
+    # letter (Disconnected, Unavailable, Reconnecting, no status, or pointing
+    # elsewhere) is released and remapped.
+    live = {entry.drive.upper(): entry for entry in live_entries}
+    plan = []
+    for job in jobs:
+        entry = live.get(job.drive.rstrip("/").upper())
+        if entry is None:
+            plan.append((job, MAP))
+        elif entry.isConnected() and same_remote(entry.remote, job.path):
+            plan.append((job, KEEP))
+        else:
+            plan.append((job, REMAP))
+    return plan
+
+def keep_result(job):
+    result = MappingResult(job.drive, job.path)
+    result.ok = True
+    result.messages.append(f"Drive {job.drive} is already connected to {job.path}; left untouched.")
+    return result
+
+def reconcile_drives(plan, on_result=None, max_workers=MAX_MAPPING_WORKERS, on_released=None):
+    tasks = []
+    for job, action in plan:
+        if action == KEEP:
+            tasks.append((keep_result, job))
+        else:
+            tasks.append((run_mapping_job, job, MAPPING_TIMEOUT, action == REMAP, on_released))
+    return _run_pool(tasks, on_result, max_workers)
+
+def _run_pool(tasks, on_result, max_workers):
+    results = []
+    if not tasks:
+        return results
+    workers = max(1, min(max_workers, len(tasks)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="net-use") as pool:
+        futures = [pool.submit(*task) for task in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+def release_drives(jobs, on_result=None, max_workers=MAX_MAPPING_WORKERS):
+    return _run_pool([(run_release_job, job) for job in jobs], on_result, max_workers)
+
+def map_drives(jobs, on_result=None, max_workers=MAX_MAPPING_WORKERS, disconnect_first=False, on_released=None):
+    # Runs every job on a bounded pool and reports each result as soon as its
+    # drive finishes. A failing share does not stop the remaining mappings.
+    # With disconnect_first each drive is released and remapped back to back,
+    # without waiting for the other drives.
+    return _run_pool([(run_mapping_job, job, MAPPING_TIMEOUT, disconnect_first, on_released) for job in jobs],
+                     on_result, max_workers)
@@ -0,0 +1,283 @@
+import heapq
+import os
+import sqlite3
+import threading
+import time
+
+from .app_paths import cache_dir
+from .listing_cache import IS_DIR, NAME, fetch_listing, get_listing_cache, listing_key
+
+VISITS_DB_NAME = "visits.sqlite3"
+MAX_VISITS = 2000
+PRUNE_EVERY = 100
+# A visit weighs half as much after a week.
+VISIT_HALF_LIFE = 7 * 24 * 3600.0
+HOT_PATHS = 8
+# Per navigation: child folders listed per parent, and folders overall.
+MAX_CHILDREN = 32
+MAX_PREFETCH = 96
+DEFAULT_PREFETCH_WORKERS = 2
+DEFAULT_PREFETCH_KBPS = 256
+# Rough SMB2 cost of a listing: one directory-info record plus the UTF-16
+# name per entry, and a round trip for the mtime check.
+ENTRY_BYTES = 104
+STAT_BYTES = 512
+# A folder checked this recently is served from the listing cache as is.
+RECHECK_AFTER = 120.0
+# Prefetch waits for the tree's own listings, but never longer than this.
+MAX_YIELD = 2.0
+# Queue tiers: the selected folder, its children, hot folders, their children.
+SELECTED, SELECTED_CHILD, HOT, HOT_CHILD = range(4)
+
+def is_under(path, roots):
+    key = listing_key(path)
+    for root in roots:
+        root_key = listing_key(root)
+        if key == root_key or key.startswith(root_key.rstrip(os.sep) + os.sep):
+            return True
+    return False
+
+def listing_bytes(entries):
+    return STAT_BYTES + sum(ENTRY_BYTES + 2 * len(e[NAME]) for e in entries)
+
+# ------------------------------
+# Persistent folder visit history (count and last visit per folder)
+# ------------------------------
+class VisitHistory:
+    def __init__(self, db_path=None, max_entries=MAX_VISITS):
+        self.db_path = db_path or os.path.join(cache_dir(), VISITS_DB_NAME)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._records = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Visits are recorded on the GUI thread; losing the last few on a
+        # crash is cheaper than an fsync per expanded folder.
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS visits ("
+            "path TEXT PRIMARY KEY, original TEXT, count INTEGER, last REAL)")
+        self._conn.commit()
+
+    def record(self, path, now=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO visits (path, original, count, last) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(path) DO UPDATE SET count = count + 1, last = excluded.last, "
+                "original = excluded.original",
+                (listing_key(path), path, now or time.time()))
+            self._records += 1
+            if self._records % PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM visits WHERE path NOT IN "
+                    "(SELECT path FROM visits ORDER BY last DESC LIMIT ?)", (self.max_entries,))
+            self._conn.commit()
+
+    def hotPaths(self, roots, limit=HOT_PATHS, now=None):
+        # Most frequently and recently visited folders below any of roots.
+        if not roots:
+            return []
+        now = now or time.time()
+        with self._lock:
+            rows = self._conn.execute("SELECT original, count, last FROM visits").fetchall()
+        scored = [(count * 0.5 ** (max(0.0, now - last) / VISIT_HALF_LIFE), original)
+                  for original, count, last in rows if is_under(original, roots)]
+        scored.sort(reverse=True)
+        return [original for _, original in scored[:limit]]
+
+# ------------------------------
+# Token bucket for the prefetch bandwidth budget
+# ------------------------------
+class ByteBudget:
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self._stamp = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def delay(self):
+        # Seconds until the next listing may start; 0 when unlimited.
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def spend(self, amount):
+        if self.rate > 0:
+            self._refill()
+            self.tokens -= amount
+
+# ------------------------------
+# Low-priority listing prefetch for likely-next folders
+# ------------------------------
+class Prefetcher:
+    def __init__(self, cache=None, history=None, max_workers=DEFAULT_PREFETCH_WORKERS,
+                 kbps=DEFAULT_PREFETCH_KBPS):
+        self.cache = cache or get_listing_cache()
+        self.history = history or VisitHistory()
+        self.maxWorkers = max_workers
+        self.budget = ByteBudget(kbps * 1024)
+        # Optional callable; while it returns True the tree is listing a
+        # folder itself and prefetch holds back.
+        self.foregroundBusy = None
+        self._cond = threading.Condition()
+        self._queue = []
+        self._queued = set()
+        self._seq = 0
+        self._recent = {}
+        self._generation = 0
+        self._workers = []
+        self._active = 0
+        self._stopped = False
+        self.stats = {"listed": 0, "unchanged": 0, "cached": 0, "failed": 0, "bytes": 0}
+
+    def configure(self, max_workers=None, kbps=None):
+        with self._cond:
+            if max_workers is not None:
+                self.maxWorkers = max(1, max_workers)
+            if kbps is not None:
+                self.budget = ByteBudget(kbps * 1024)
+
+    def visit(self, path):
+        try:
+            self.history.record(path)
+        except sqlite3.Error:
+            pass
+
+    def navigate(self, path, roots=()):
+        # New target: whatever was queued for the previous folder is dropped.
+        try:
+            hot = self.history.hotPaths(roots)
+        except sqlite3.Error:
+            hot = []
+        with self._cond:
+            self._reset()
+            self._enqueue(path, SELECTED)
+            for hot_path in hot:
+                self._enqueue(hot_path, HOT)
+            self._ensureWorkers()
+            self._cond.notify_all()
+
+    def cancel(self):
+        with self._cond:
+            self._reset()
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._reset()
+            self._cond.notify_all()
+
+    def pending(self):
+        with self._cond:
+            return len(self._queue)
+
+    def wait(self, timeout=None):
+        # Blocks until the current round is done; False on timeout.
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._active, timeout)
+
+    def _reset(self):
+        self._generation += 1
+        self._queue = []
+        self._queued = set()
+
+    def _enqueue(self, path, tier):
+        key = listing_key(path)
+        if key in self._queued or len(self._queued) >= MAX_PREFETCH:
+            return
+        self._queued.add(key)
+        self._seq += 1
+        heapq.heappush(self._queue, (tier, self._seq, self._generation, path))
+
+    def _ensureWorkers(self):
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while len(self._workers) < self.maxWorkers:
+            worker = threading.Thread(target=self._run, name="listing-prefetch", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and not self._queue:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                wait = self.budget.delay()
+                if wait > 0:
+                    self._cond.wait(min(wait, 1.0))
+                    continue
+                tier, _, generation, path = heapq.heappop(self._queue)
+                self._active += 1
+            try:
+                self._prefetch(tier, generation, path)
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._cond.notify_all()
+
+    def _prefetch(self, tier, generation, path):
+        self._yieldToForeground(generation)
+        if generation != self._generation:
+            return
+        entries = self._list(path)
+        if entries is None or tier not in (SELECTED, HOT):
+            return
+        with self._cond:
+            if generation != self._generation:
+                return
+            children = [e for e in entries if e[IS_DIR]][:MAX_CHILDREN]
+            for entry in children:
+                self._enqueue(os.path.join(path, entry[NAME]), tier + 1)
+
+    def _yieldToForeground(self, generation):
+        busy = self.foregroundBusy
+        deadline = time.monotonic() + MAX_YIELD
+        while busy is not None and busy() and generation == self._generation and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def _list(self, path):
+        key = listing_key(path)
+        now = time.monotonic()
+        cached = self.cache.get(path)
+        with self._cond:
+            checked = self._recent.get(key)
+            if cached is not None and checked is not None and now - checked < RECHECK_AFTER:
+                self.stats["cached"] += 1
+                return cached[1]
+        try:
+            changed, _, entries = fetch_listing(path, self.cache, cached[0] if cached is not None else None)
+        except OSError:
+            with self._cond:
+                self.stats["failed"] += 1
+            return None
+        if changed:
+            spent = listing_bytes(entries)
+            outcome = "listed"
+        else:
+            entries = cached[1]
+            spent = STAT_BYTES
+            outcome = "unchanged"
+        with self._cond:
+            self.stats[outcome] += 1
+            self.budget.spend(spent)
+            self.stats["bytes"] += spent
+            self._recent[key] = now
+            if len(self._recent) > MAX_VISITS:
+                self._recent = {k: t for k, t in self._recent.items() if now - t < RECHECK_AFTER}
+        return entries
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+def get_prefetcher():
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = Prefetcher()
+        return _prefetcher
@@ -0,0 +1,145 @@
+import threading
+
+from .config_store import get_config_store
+
+# Sites known out of the box. A "profiles" list in the config adds sites or
+# overrides fields of these (matched by "key"), so another site needs no
+# code change; "enabled": false hides one.
+BUILTIN_PROFILES = [
+    {
+        "key": "german",
+        "label": "German",
+        "short_label": "German",
+        "aliases": ["de", "germany"],
+        "server": "vpn.broetje-automation.de",
+        "username": "banet.loc\\",
+        "mapping_domain": "",
+        "credential_key": "german",
+        "folder_key": "german_network_folders",
+        "folders": [
+            {"drive": "N:", "path": r"\\banet.loc\baw"},
+            {"drive": "I:", "path": r"\\banet.loc\derae.user\home"}
+        ],
+        "rdp_url": "https://rds.banet.loc/RDWeb/Pages/en-US/Default.aspx",
+        "flag": "germany-flag.jpg"
+    },
+    {
+        "key": "us",
+        "label": "American",
+        "short_label": "US",
+        "aliases": ["american", "usa"],
+        "server": "vpn.ba-us.com",
+        "username": "ba-us.com\\",
+        "mapping_domain": "BA-US",
+        "credential_key": "american",
+        "folder_key": "american_network_folders",
+        "folders": [
+            {"drive": "Z:", "path": r"\\fs02\uschi"}
+        ],
+        "rdp_url": "https://rds.ba-us.com/RDWeb/Pages/en-US/Default.aspx",
+        "flag": "usa-flag.jpg"
+    }
+]
+DEFAULT_PROFILE = "us"
+UNKNOWN_FLAG = "Question_mark.jpg"
+
+# ------------------------------
+# A site: VPN server, username rule, drive mappings, RDP URL and flag
+# ------------------------------
+class Profile:
+    def __init__(self, spec):
+        self.key = spec["key"]
+        self.label = spec.get("label") or self.key
+        self.shortLabel = spec.get("short_label") or self.label
+        self.aliases = [a.lower() for a in spec.get("aliases", [])]
+        self.defaultServer = spec.get("server", "")
+        self.defaultUsername = spec.get("username", "")
+        self.mappingDomain = spec.get("mapping_domain", "")
+        self.credentialKey = spec.get("credential_key") or self.key
+        self.folderKey = spec.get("folder_key") or f"{self.key}_network_folders"
+        self.defaultFolders = spec.get("folders", [])
+        self.rdpUrl = spec.get("rdp_url", "")
+        self.flag = spec.get("flag") or UNKNOWN_FLAG
+
+    def mappingUsername(self, username):
+        # Sites in another domain get "DOMAIN\user" whatever prefix was typed.
+        if self.mappingDomain:
+            user = username.split("\\")[-1]
+            return f"{self.mappingDomain}\\{user}"
+        return username
+
+    def folders(self, data):
+        return data.get(self.folderKey, []) or self.defaultFolders
+
+    def savedCredentials(self, data, vault=None):
+        # Returns (server, username, password) with the site defaults filled
+        # in. Passwords live in the credential vault; a password still in the
+        # config (not migrated yet) is only used without one.
+        saved = data.get(self.credentialKey) or {}
+        password = saved.get("password", "")
+        if vault is not None:
+            password = vault.get(self.credentialKey, password)
+        return saved.get("server", self.defaultServer), saved.get("username", self.defaultUsername), password
+
+# ------------------------------
+# Registry with O(1) lookup by key or alias
+# ------------------------------
+class ProfileRegistry:
+    def __init__(self, overrides=None):
+        specs = {}
+        for spec in BUILTIN_PROFILES + list(overrides or []):
+            key = spec.get("key")
+            if not key:
+                continue
+            merged = dict(specs.get(key, {}))
+            merged.update(spec)
+            specs[key] = merged
+        self._specs = {key: spec for key, spec in specs.items() if spec.get("enabled", True)}
+        self._aliases = {}
+        for key, spec in self._specs.items():
+            for alias in [key] + list(spec.get("aliases", [])):
+                self._aliases.setdefault(alias.lower(), key)
+        # Profile objects are only built for the sites actually used.
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def keys(self):
+        return list(self._specs)
+
+    def get(self, key):
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is None:
+                profile = self._profiles[key] = Profile(self._specs[key])
+            return profile
+
+    def resolve(self, name):
+        key = self._aliases.get(name.lower())
+        return self.get(key) if key is not None else None
+
+    def profiles(self):
+        return [self.get(key) for key in self._specs]
+
+    def defaultKey(self, preferred=DEFAULT_PROFILE):
+        if preferred in self._specs:
+            return preferred
+        return next(iter(self._specs), None)
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_profile_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ProfileRegistry(get_config_store().get("profiles", []))
+        return _registry
+
+def reload_profile_registry():
+    global _registry
+    with _registry_lock:
+        _registry = None
+    return get_profile_registry()
@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .mapping import run_mapping_job
+
+CHECK_INTERVAL = 15
+BASE_DELAY = 5.0
+MAX_DELAY = 300.0
+# At most this many "net use" remaps run at once, however many drives drop.
+MAX_CONCURRENT_REMAPS = 2
+
+# ------------------------------
+# Per-drive exponential backoff
+# ------------------------------
+class BackoffState:
+    def __init__(self):
+        self.attempts = 0
+        self.nextAttempt = 0.0
+        self.inFlight = False
+
+
+def backoff_delay(attempts, base=BASE_DELAY, cap=MAX_DELAY, rng=random):
+    # "Equal jitter": half of the exponential delay is fixed and half is
+    # random, so drives that dropped together do not retry in lockstep.
+    delay = min(cap, base * (2 ** attempts))
+    return delay / 2.0 + rng.uniform(0, delay / 2.0)
+
+# ------------------------------
+# Watchdog that remaps armed drives that are not reported as OK
+# ------------------------------
+class ReconnectWatchdog:
+    def __init__(self, inventory, check_interval=CHECK_INTERVAL, base_delay=BASE_DELAY, max_delay=MAX_DELAY,
+                 max_concurrent=MAX_CONCURRENT_REMAPS, clock=time.monotonic, rng=None):
+        self.inventory = inventory
+        self.check_interval = check_interval
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_concurrent = max_concurrent
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.lock = threading.Lock()
+        self.desired = {}
+        self.profileDrives = {}
+        self.states = {}
+        self.inFlight = 0
+        self.listeners = []
+        self.pool = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="reconnect")
+        self.stopEvent = threading.Event()
+        self.thread = None
+        inventory.addListener(self.onInventory)
+
+    def addListener(self, callback):
+        # Called from worker threads with (message, level).
+        with self.lock:
+            self.listeners.append(callback)
+
+    def notify(self, message, level="INFO"):
+        with self.lock:
+            listeners = list(self.listeners)
+        for callback in listeners:
+            callback(message, level)
+
+    def arm(self, profile, jobs):
+        # The jobs that mapped successfully in the last connect of a profile,
+        # including credentials; they replace that profile's earlier jobs and
+        # leave the other profiles' drives armed.
+        with self.lock:
+            for drive in self.profileDrives.pop(profile, set()):
+                self.desired.pop(drive, None)
+            drives = set()
+            for job in jobs:
+                drive = job.drive.rstrip("/").upper()
+                self.desired[drive] = job
+                drives.add(drive)
+            self.profileDrives[profile] = drives
+            self._dropStates()
+
+    def disarm(self, profile=None):
+        # One profile, or everything (e.g. after a deliberate disconnect).
+        with self.lock:
+            if profile is None:
+                self.desired, self.profileDrives = {}, {}
+            else:
+                for drive in self.profileDrives.pop(profile, set()):
+                    self.desired.pop(drive, None)
+            self._dropStates()
+
+    def _dropStates(self):
+        for drives in self.profileDrives.values():
+            drives &= set(self.desired)
+        self.states = {drive: state for drive, state in self.states.items() if drive in self.desired}
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self._loop, name="reconnect-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopEvent.set()
+
+    def _loop(self):
+        while not self.stopEvent.wait(self.check_interval):
+            with self.lock:
+                armed = bool(self.desired)
+            if armed:
+                # The scan result comes back through onInventory.
+                self.inventory.refresh(force=True)
+
+    def onInventory(self, entries, error):
+        if error:
+            return
+        live = {entry.drive.upper(): entry for entry in entries}
+        now = self.clock()
+        due = []
+        with self.lock:
+            for drive, job in self.desired.items():
+                entry = live.get(drive)
+                state = self.states.get(drive)
+                # A failed remap leaves the letter unmapped, so a drive we are
+                # already recovering keeps its backoff until it shows up OK.
+                broken = not entry.isConnected() if entry is not None else state is not None
+                if not broken:
+                    if state is not None and not state.inFlight:
+                        del self.states[drive]
+                    continue
+                if state is None:
+                    state = self.states[drive] = BackoffState()
+                if state.inFlight or now < state.nextAttempt or self.inFlight >= self.max_concurrent:
+                    continue
+                state.inFlight = True
+                self.inFlight += 1
+                due.append(job)
+        for job in due:
+            self.notify(f"Drive {job.drive} is not connected; reconnecting in the background...", "WARNING")
+            self.pool.submit(self._remap, job)
+
+    def _remap(self, job):
+        drive = job.drive.rstrip("/").upper()
+        try:
+            result = run_mapping_job(job, disconnect_first=True)
+        except Exception as e:
+            result = None
+            self.notify(f"Reconnect of {job.drive} failed: {job.mask(str(e))}", "ERROR")
+        rejected = result is not None and result.authFailed()
+        with self.lock:
+            self.inFlight -= 1
+            state = self.states.get(drive)
+            delay = None
+            if rejected:
+                # Every drive mapped with these credentials would fail the same
+                # way; stop them all until the next manual connect re-arms them.
+                stale = [d for d, j in self.desired.items()
+                         if j.username == job.username and j.password == job.password]
+                for d in stale:
+                    del self.desired[d]
+                self._dropStates()
+            elif state is not None:
+                state.inFlight = False
+                if result is not None and result.ok:
+                    del self.states[drive]
+                else:
+                    delay = backoff_delay(state.attempts, self.base_delay, self.max_delay, self.rng)
+                    state.attempts += 1
+                    state.nextAttempt = self.clock() + delay
+        if result is not None and result.ok:
+            self.notify(f"Drive {job.drive} reconnected to {job.path}.")
+        elif rejected:
+            self.notify(f"Reconnect of {job.drive} was refused (system error {result.systemError}): the saved "
+                        f"credentials were rejected. Automatic reconnects for {', '.join(stale)} are stopped "
+                        "until you connect again.", "ERROR")
+        elif delay is not None:
+            self.notify(f"Reconnect of {job.drive} failed; next attempt in {delay:.0f} s.", "ERROR")
+        self.inventory.invalidate()
+        self.inventory.refresh(force=True)
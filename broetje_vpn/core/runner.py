@@ -0,0 +1,213 @@
+import os
+import random
+import subprocess
+import threading
+import time
+
+RUNNER_ENV = "BROETJE_RUNNER"
+SIM_LATENCY_ENV = "BROETJE_SIM_LATENCY_MS"
+
+# ------------------------------
+# Command runner interface and the real subprocess backend
+# ------------------------------
+class CommandRunner:
+    def run(self, cmd, timeout=None):
+        raise NotImplementedError
+
+    def check_output(self, cmd, timeout=None):
+        result = self.run(cmd, timeout=timeout)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+        return result.stdout
+
+    def popen(self, cmd):
+        raise NotImplementedError
+
+
+class SubprocessRunner(CommandRunner):
+    def run(self, cmd, timeout=None):
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+    def check_output(self, cmd, timeout=None):
+        return subprocess.check_output(cmd, text=True, timeout=timeout)
+
+    def popen(self, cmd):
+        return subprocess.Popen(cmd)
+
+# ------------------------------
+# Simulated backend: models a Windows box on a slow VPN link
+# ------------------------------
+class SimulatedProcess:
+    def __init__(self, args):
+        self.args = args
+        self.returncode = None
+        self.pid = random.randint(1000, 60000)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+class SimulatedRunner(CommandRunner):
+    # Latency (base seconds, jitter seconds) per command family.
+    DEFAULT_LATENCY = {
+        "net use list": (0.15, 0.05),
+        "net use map": (0.6, 0.2),
+        "net use delete": (0.3, 0.1),
+        "wmic": (0.8, 0.3),
+        "tasklist": (0.2, 0.05),
+        "taskkill": (0.2, 0.05),
+        "other": (0.05, 0.01),
+    }
+
+    def __init__(self, latency=None, failure_rate=0.0, timeout_rate=0.0, unreachable=None,
+                 drives=None, time_scale=1.0, seed=None):
+        self.latency = dict(self.DEFAULT_LATENCY)
+        self.latency.update(latency or {})
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        # UNC prefixes that always fail with "network path was not found".
+        self.unreachable = [u.lower() for u in (unreachable or [])]
+        self.time_scale = time_scale
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # drive letter -> [remote, status]
+        self.drives = {d.upper(): [r, "OK"] for d, r in (drives or {}).items()}
+        self.processes = set()
+        self.calls = []
+
+    @classmethod
+    def from_env(cls):
+        scale = float(os.environ.get(SIM_LATENCY_ENV, "1000")) / 1000.0
+        return cls(time_scale=scale)
+
+    def classify(self, cmd):
+        name = os.path.basename(cmd[0]).lower() if cmd else ""
+        if name == "net" and len(cmd) >= 2 and cmd[1].lower() == "use":
+            if len(cmd) == 2:
+                return "net use list"
+            if any(a.lower() == "/delete" for a in cmd):
+                return "net use delete"
+            return "net use map"
+        if name in ("wmic", "tasklist", "taskkill"):
+            return name
+        return "other"
+
+    def sampleLatency(self, kind):
+        base, jitter = self.latency.get(kind, self.latency["other"])
+        with self.lock:
+            value = base + self.random.uniform(-jitter, jitter)
+        return max(0.0, value) * self.time_scale
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+    def run(self, cmd, timeout=None):
+        kind = self.classify(cmd)
+        delay = self.sampleLatency(kind)
+        hung = self.roll(self.timeout_rate)
+        if timeout is not None and (hung or delay > timeout):
+            time.sleep(timeout)
+            self.record(kind, timeout, None)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        time.sleep(delay)
+        if self.roll(self.failure_rate):
+            result = subprocess.CompletedProcess(cmd, 2, "", "System error 64 has occurred.\n\nThe specified network name is no longer available.\n")
+        else:
+            result = self.execute(kind, cmd)
+        self.record(kind, delay, result.returncode)
+        return result
+
+    def record(self, kind, seconds, returncode):
+        with self.lock:
+            self.calls.append((kind, seconds, returncode))
+
+    def popen(self, cmd):
+        args = cmd if isinstance(cmd, (list, tuple)) else [cmd]
+        with self.lock:
+            self.processes.add(os.path.basename(args[0].replace("\\", "/")).lower())
+        return SimulatedProcess(args)
+
+    def execute(self, kind, cmd):
+        if kind == "net use list":
+            return subprocess.CompletedProcess(cmd, 0, self.netUseOutput(), "")
+        if kind == "net use map":
+            drive, remote = cmd[2].upper(), cmd[3]
+            if any(remote.lower().startswith(u) for u in self.unreachable):
+                return subprocess.CompletedProcess(cmd, 2, "", "System error 53 has occurred.\n\nThe network path was not found.\n")
+            with self.lock:
+                if drive in self.drives:
+                    return subprocess.CompletedProcess(cmd, 2, "", "System error 85 has occurred.\n\nThe local device name is already in use.\n")
+                self.drives[drive] = [remote, "OK"]
+            return subprocess.CompletedProcess(cmd, 0, "The command completed successfully.\n", "")
+        if kind == "net use delete":
+            drive = cmd[2].upper()
+            with self.lock:
+                existed = self.drives.pop(drive, None) is not None
+            if existed:
+                return subprocess.CompletedProcess(cmd, 0, f"{drive} was deleted successfully.\n", "")
+            return subprocess.CompletedProcess(cmd, 2, "", "The network connection could not be found.\n")
+        if kind == "wmic":
+            lines = ["DeviceID  ProviderName"]
+            with self.lock:
+                for drive, (remote, status) in sorted(self.drives.items()):
+                    lines.append(f"{drive:<10}{remote}")
+            return subprocess.CompletedProcess(cmd, 0, "\n".join(lines) + "\n", "")
+        if kind == "tasklist":
+            image = cmd[-1].split()[-1].lower() if len(cmd) > 1 else ""
+            with self.lock:
+                running = image in self.processes
+            if running:
+                return subprocess.CompletedProcess(cmd, 0, f"{image}  4242 Console  1  25,000 K\n", "")
+            return subprocess.CompletedProcess(cmd, 0, "INFO: No tasks are running which match the specified criteria.\n", "")
+        if kind == "taskkill":
+            image = cmd[cmd.index("/IM") + 1].lower() if "/IM" in cmd else ""
+            with self.lock:
+                running = image in self.processes
+                self.processes.discard(image)
+            if running:
+                return subprocess.CompletedProcess(cmd, 0, f'SUCCESS: The process "{image}" has been terminated.\n', "")
+            return subprocess.CompletedProcess(cmd, 128, "", f'ERROR: The process "{image}" not found.\n')
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def netUseOutput(self):
+        lines = ["New connections will be remembered.", "", "",
+                 "Status       Local     Remote                    Network", "",
+                 "-" * 79]
+        with self.lock:
+            for drive, (remote, status) in sorted(self.drives.items()):
+                # Like the real tool, long remotes push the network name onto
+                # its own line.
+                if len(remote) < 26:
+                    lines.append(f"{status:<13}{drive:<10}{remote:<26}Microsoft Windows Network")
+                else:
+                    lines.append(f"{status:<13}{drive:<10}{remote}")
+                    lines.append(f"{'':<49}Microsoft Windows Network")
+        lines.append("The command completed successfully.")
+        return "\n".join(lines) + "\n"
+
+    def setDriveStatus(self, drive, status):
+        with self.lock:
+            if drive.upper() in self.drives:
+                self.drives[drive.upper()][1] = status
+
+_runner = None
+_runner_lock = threading.Lock()
+
+def get_runner():
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            if os.environ.get(RUNNER_ENV, "").lower() == "simulated":
+                _runner = SimulatedRunner.from_env()
+            else:
+                _runner = SubprocessRunner()
+        return _runner
+
+def set_runner(runner):
+    global _runner
+    with _runner_lock:
+        _runner = runner
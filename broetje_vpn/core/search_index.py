@@ -0,0 +1,237 @@
+import bisect
+import json
+import os
+import re
+import threading
+import zlib
+
+from .app_paths import cache_dir
+
+INDEX_FILE_NAME = "search_index.z"
+INDEX_VERSION = 1
+# Shares such as N:\ are huge; the walk stops this many levels below a root.
+MAX_INDEX_DEPTH = 8
+MAX_CANDIDATES = 5000
+SEARCH_LIMIT = 50
+
+def _norm(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def collapse_roots(roots):
+    # Drops roots that are already covered by another root in the list.
+    unique = []
+    for root in sorted({os.path.normpath(r) for r in roots if r}, key=lambda r: len(r)):
+        key = _norm(root).rstrip(os.sep) + os.sep
+        if not any(key.startswith(_norm(u).rstrip(os.sep) + os.sep) for u in unique):
+            unique.append(root)
+    return unique
+
+# ------------------------------
+# Incremental filename index over mapped drives and custom server roots
+# ------------------------------
+class FileIndex:
+    def __init__(self, index_path=None, max_depth=MAX_INDEX_DEPTH):
+        self.index_path = index_path or os.path.join(cache_dir(), INDEX_FILE_NAME)
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+        # dir path -> [mtime, [file names], [sub directory names]]
+        self._dirs = {}
+        self._paths = []
+        self._names = []
+        self._isDir = []
+        self._pathHaystack = ""
+        self._nameHaystack = ""
+        self._offsets = []
+        self._nameOffsets = []
+        self._stale = True
+
+    def __len__(self):
+        with self._lock:
+            self._rebuild()
+            return len(self._paths)
+
+    def load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except (OSError, ValueError, zlib.error):
+            return False
+        if data.get("version") != INDEX_VERSION:
+            return False
+        with self._lock:
+            self._dirs = data.get("dirs", {})
+            self._stale = True
+        return True
+
+    def save(self):
+        with self._lock:
+            blob = zlib.compress(json.dumps({"version": INDEX_VERSION, "dirs": self._dirs},
+                                            separators=(",", ":")).encode("utf-8"), 6)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, self.index_path)
+
+    def updateRoots(self, roots, should_stop=None):
+        # Re-lists only directories whose mtime changed since the last pass;
+        # unchanged directories cost a single stat. Returns the number of
+        # directories that had to be re-read.
+        rescanned = 0
+        for root in collapse_roots(roots):
+            if should_stop is not None and should_stop():
+                break
+            rescanned += self.updateRoot(root, should_stop)
+        return rescanned
+
+    def updateRoot(self, root, should_stop=None):
+        # A directory that cannot be reached (e.g. the VPN dropped) keeps its
+        # indexed contents; only folders missing from a fresh listing of
+        # their parent are forgotten.
+        rescanned = 0
+        stack = [(os.path.normpath(root), 0)]
+        while stack:
+            if should_stop is not None and should_stop():
+                return rescanned
+            path, depth = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            with self._lock:
+                known = self._dirs.get(path)
+            if known is None or known[0] != mtime:
+                files, subdirs = [], []
+                try:
+                    with os.scandir(path) as it:
+                        for dirent in it:
+                            try:
+                                (subdirs if dirent.is_dir() else files).append(dirent.name)
+                            except OSError:
+                                files.append(dirent.name)
+                except OSError:
+                    continue
+                gone = set(known[2]) - set(subdirs) if known is not None else ()
+                known = [mtime, files, subdirs]
+                with self._lock:
+                    self._dirs[path] = known
+                    for name in gone:
+                        self._dropTree(os.path.join(path, name))
+                    self._stale = True
+                rescanned += 1
+            if depth < self.max_depth:
+                for name in known[2]:
+                    stack.append((os.path.join(path, name), depth + 1))
+        return rescanned
+
+    def _dropTree(self, path):
+        key = _norm(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        for p in [p for p in self._dirs if _norm(p) == key or _norm(p).startswith(prefix)]:
+            del self._dirs[p]
+
+    def updateDirectory(self, path):
+        # Refreshes a single directory, e.g. after a change notification.
+        path = os.path.normpath(path)
+        try:
+            mtime = os.stat(path).st_mtime
+            files, subdirs = [], []
+            with os.scandir(path) as it:
+                for dirent in it:
+                    (subdirs if dirent.is_dir() else files).append(dirent.name)
+        except OSError:
+            return
+        with self._lock:
+            if path in self._dirs or os.path.dirname(path) in self._dirs:
+                known = self._dirs.get(path)
+                for name in set(known[2]) - set(subdirs) if known is not None else ():
+                    self._dropTree(os.path.join(path, name))
+                self._dirs[path] = [mtime, files, subdirs]
+                self._stale = True
+
+    def _rebuild(self):
+        if not self._stale:
+            return
+        paths, names, is_dir = [], [], []
+        for directory, (mtime, files, subdirs) in self._dirs.items():
+            for name in subdirs:
+                paths.append(os.path.join(directory, name))
+                names.append(name)
+                is_dir.append(True)
+            for name in files:
+                paths.append(os.path.join(directory, name))
+                names.append(name)
+                is_dir.append(False)
+        # Both haystacks are single newline-joined strings so a query is a
+        # str.find / regex scan in C instead of a Python loop over entries.
+        self._paths, self._names, self._isDir = paths, names, is_dir
+        self._pathHaystack, self._offsets = self._joined(p.lower() for p in paths)
+        self._nameHaystack, self._nameOffsets = self._joined(n.lower() for n in names)
+        self._stale = False
+
+    def _joined(self, values):
+        offsets = []
+        parts = []
+        pos = 0
+        for value in values:
+            offsets.append(pos)
+            parts.append(value)
+            pos += len(value) + 1
+        return "\n".join(parts), offsets
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        # Returns [(path, is_dir)]: substring matches on the full path first,
+        # then fuzzy (in-order characters) matches on the file name.
+        terms = query.lower().split()
+        if not terms:
+            return []
+        with self._lock:
+            self._rebuild()
+            results = self._substringSearch(terms, limit)
+            if len(results) < limit:
+                seen = {r[0] for r in results}
+                for hit in self._fuzzySearch("".join(terms), limit):
+                    if hit[0] not in seen and len(results) < limit:
+                        results.append(hit)
+        return results
+
+    def _substringSearch(self, terms, limit):
+        longest = max(terms, key=len)
+        haystack = self._pathHaystack
+        candidates = []
+        seen = set()
+        pos = haystack.find(longest)
+        while pos != -1 and len(candidates) < MAX_CANDIDATES:
+            idx = bisect.bisect_right(self._offsets, pos) - 1
+            if idx not in seen:
+                seen.add(idx)
+                lowered = self._paths[idx].lower()
+                if all(t in lowered for t in terms):
+                    in_name = longest in self._names[idx].lower()
+                    candidates.append(((0 if in_name else 1, len(lowered)), idx))
+            # Skip to the next entry; one hit per path is enough.
+            nxt = self._offsets[idx + 1] if idx + 1 < len(self._offsets) else len(haystack)
+            pos = haystack.find(longest, nxt)
+        candidates.sort()
+        return [(self._paths[idx], self._isDir[idx]) for _, idx in candidates[:limit]]
+
+    def _fuzzySearch(self, query, limit):
+        pattern = re.compile("[^\n]*?".join(re.escape(c) for c in query))
+        hits = []
+        for match in pattern.finditer(self._nameHaystack):
+            idx = bisect.bisect_right(self._nameOffsets, match.start()) - 1
+            hits.append(((match.end() - match.start(), len(self._names[idx])), idx))
+            if len(hits) >= MAX_CANDIDATES:
+                break
+        hits.sort()
+        return [(self._paths[idx], self._isDir[idx]) for _, idx in hits[:limit]]
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_file_index():
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = FileIndex()
+            _index.load()
+        return _index
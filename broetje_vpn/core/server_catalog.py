@@ -0,0 +1,223 @@
+import bisect
+import csv
+import json
+import os
+import threading
+import uuid
+
+from .config_store import get_config_store
+
+CONFIG_KEY = "custom_servers"
+
+def new_server_id():
+    return uuid.uuid4().hex[:12]
+
+def address_key(address):
+    # UNC paths are case-insensitive and often pasted with a trailing slash.
+    return address.strip().rstrip("\\/").lower()
+
+def normalize_entry(raw):
+    if not isinstance(raw, dict):
+        return None
+    description = str(raw.get("description", "")).strip()
+    address = str(raw.get("address", "")).strip()
+    if not description or not address:
+        return None
+    return {"description": description, "address": address}
+
+# ------------------------------
+# Import / export files (JSON list or two-column CSV)
+# ------------------------------
+def read_server_file(path):
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            rows = [row for row in csv.reader(f) if len(row) >= 2]
+        if rows and rows[0][0].strip().lower() == "description":
+            rows = rows[1:]
+        raw = [{"description": row[0], "address": row[1]} for row in rows]
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        # A whole credentials_manager.json works as well.
+        if isinstance(raw, dict):
+            raw = raw.get(CONFIG_KEY, [])
+        if not isinstance(raw, list):
+            raise ValueError("expected a list of servers")
+    return [entry for entry in map(normalize_entry, raw) if entry is not None]
+
+def write_server_file(path, entries):
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["description", "address"])
+            writer.writerows([e["description"], e["address"]] for e in entries)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"description": e["description"], "address": e["address"]} for e in entries], f, indent=4)
+
+# ------------------------------
+# Custom server catalog with stable ids and a substring filter index
+# ------------------------------
+class ServerCatalog:
+    def __init__(self, store=None):
+        self.store = store or get_config_store()
+        self._lock = threading.Lock()
+        self._order = []
+        self._entries = {}
+        self._generation = 0
+        self._haystack = ""
+        self._offsets = []
+        self._stale = True
+        self._lastFilter = None
+        self.load()
+
+    def __len__(self):
+        return len(self._order)
+
+    def load(self):
+        with self._lock:
+            self._order, self._entries = [], {}
+            assigned = False
+            for raw in self.store.get(CONFIG_KEY, []):
+                entry = normalize_entry(raw)
+                if entry is None:
+                    continue
+                # Keep whatever else an entry carries; only the id is ours.
+                entry = dict(raw, **entry)
+                if not entry.get("id") or entry["id"] in self._entries:
+                    entry["id"] = new_server_id()
+                    assigned = True
+                self._order.append(entry["id"])
+                self._entries[entry["id"]] = entry
+            self._changed()
+            if assigned:
+                self._save()
+
+    def ids(self):
+        return list(self._order)
+
+    def entry(self, server_id):
+        # The stored dict itself (used for every row the view paints); do not modify it.
+        return self._entries.get(server_id)
+
+    def entries(self):
+        return [dict(self._entries[i]) for i in self._order]
+
+    def add(self, description, address):
+        with self._lock:
+            server_id = new_server_id()
+            self._entries[server_id] = {"description": description, "address": address, "id": server_id}
+            self._order.append(server_id)
+            self._changed()
+            self._save()
+            return server_id
+
+    def update(self, server_id, description, address):
+        with self._lock:
+            entry = self._entries.get(server_id)
+            if entry is None:
+                return False
+            entry["description"] = description
+            entry["address"] = address
+            self._changed()
+            self._save()
+            return True
+
+    def remove(self, server_ids):
+        with self._lock:
+            doomed = {i for i in server_ids if i in self._entries}
+            if not doomed:
+                return []
+            self._order = [i for i in self._order if i not in doomed]
+            for server_id in doomed:
+                del self._entries[server_id]
+            self._changed()
+            self._save()
+            return list(doomed)
+
+    def importEntries(self, entries):
+        # Appends everything whose address is not in the catalog yet; one
+        # config write for the whole batch. Returns (added ids, skipped).
+        with self._lock:
+            known = {address_key(e["address"]) for e in self._entries.values()}
+            added, skipped = [], 0
+            for raw in entries:
+                entry = normalize_entry(raw)
+                key = address_key(entry["address"]) if entry is not None else None
+                if key is None or key in known:
+                    skipped += 1
+                    continue
+                known.add(key)
+                entry["id"] = new_server_id()
+                self._entries[entry["id"]] = entry
+                self._order.append(entry["id"])
+                added.append(entry["id"])
+            if added:
+                self._changed()
+                self._save()
+            return added, skipped
+
+    def matches(self, server_id, query):
+        entry = self._entries.get(server_id)
+        if entry is None:
+            return False
+        text = self._text(entry)
+        return all(term in text for term in query.lower().split())
+
+    def filter(self, query):
+        # Ids in catalog order whose description or address contains every term.
+        terms = query.lower().split()
+        with self._lock:
+            if not terms:
+                return list(self._order)
+            last = self._lastFilter
+            if last is not None and last[0] == self._generation and query.lower().startswith(last[1]):
+                # Typing narrows the previous result; only those need checking.
+                hits = [i for i in last[2] if all(t in self._text(self._entries[i]) for t in terms)]
+            else:
+                hits = self._search(terms)
+            self._lastFilter = (self._generation, query.lower(), hits)
+            return list(hits)
+
+    def _text(self, entry):
+        # Newlines separate entries in the haystack, so none may appear inside one.
+        text = entry["description"] + "\t" + entry["address"]
+        return text.replace("\n", " ").replace("\r", " ").lower()
+
+    def _search(self, terms):
+        self._rebuild()
+        longest = max(terms, key=len)
+        haystack = self._haystack
+        hits = []
+        pos = haystack.find(longest)
+        while pos != -1:
+            idx = bisect.bisect_right(self._offsets, pos) - 1
+            server_id = self._order[idx]
+            if all(t in self._text(self._entries[server_id]) for t in terms):
+                hits.append(server_id)
+            # One hit per entry is enough; continue after it.
+            nxt = self._offsets[idx + 1] if idx + 1 < len(self._offsets) else len(haystack)
+            pos = haystack.find(longest, nxt)
+        return hits
+
+    def _rebuild(self):
+        if not self._stale:
+            return
+        # One newline-joined string, so a lookup is a str.find in C instead
+        # of a Python loop over every entry.
+        offsets, parts, pos = [], [], 0
+        for server_id in self._order:
+            text = self._text(self._entries[server_id])
+            offsets.append(pos)
+            parts.append(text)
+            pos += len(text) + 1
+        self._haystack, self._offsets = "\n".join(parts), offsets
+        self._stale = False
+
+    def _changed(self):
+        self._generation += 1
+        self._stale = True
+        self._lastFilter = None
+
+    def _save(self):
+        self.store.set(CONFIG_KEY, [self._entries[i] for i in self._order])
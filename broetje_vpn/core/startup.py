@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+PROFILE_ENV = "BROETJE_PROFILE_STARTUP"
+
+# ------------------------------
+# Startup phase timing
+# ------------------------------
+class StartupTimer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases = []
+        self.reported = False
+
+    def enable(self):
+        self.enabled = True
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000.0, (now - self.started) * 1000.0))
+        self._last = now
+
+    def elapsed(self, phase):
+        for name, _, total in self.phases:
+            if name == phase:
+                return total
+        return None
+
+    def lines(self):
+        lines = [f"{'phase':<28}{'step ms':>10}{'total ms':>10}"]
+        for phase, step, total in self.phases:
+            lines.append(f"{phase:<28}{step:>10.1f}{total:>10.1f}")
+        return lines
+
+    def report(self, out=None):
+        self.reported = True
+        if not self.enabled:
+            return
+        out = out or sys.stderr
+        print("Startup profile:", file=out)
+        for line in self.lines():
+            print("  " + line, file=out)
+
+# Created at import so the first mark also covers the imports that follow it.
+_timer = StartupTimer(enabled=bool(os.environ.get(PROFILE_ENV)))
+
+def get_startup_timer():
+    return _timer
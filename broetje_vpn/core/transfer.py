@@ -0,0 +1,365 @@
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .reconnect_watchdog import backoff_delay
+
+# SMB2 servers negotiate reads of 1 MiB and more, so a 1 MiB chunk keeps
+# the pipe full with few round trips.
+CHUNK_SIZE = 1024 * 1024
+MAX_TRANSFER_WORKERS = 2
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+PROGRESS_INTERVAL = 0.1
+THROUGHPUT_WINDOW = 5.0
+PART_SUFFIX = ".part"
+PART_META_SUFFIX = ".part.json"
+
+QUEUED, RUNNING, RETRYING, DONE, FAILED, CANCELLED = "queued", "running", "retrying", "done", "failed", "cancelled"
+# The destination file already existed; nothing was copied.
+SKIPPED = "skipped"
+
+class TransferCancelled(Exception):
+    pass
+
+# ------------------------------
+# A single file copy with a resumable .part file
+# ------------------------------
+_job_ids = itertools.count(1)
+
+class TransferJob:
+    def __init__(self, source, dest):
+        self.id = next(_job_ids)
+        self.source = source
+        self.dest = dest
+        self.size = 0
+        self.copied = 0
+        # Bytes taken over from a .part left behind by an earlier attempt.
+        self.resumedFrom = 0
+        self.attempts = 0
+        self.state = QUEUED
+        self.error = None
+        self.cancelEvent = threading.Event()
+
+    def name(self):
+        return os.path.basename(self.source)
+
+    def percent(self):
+        if not self.size:
+            return 100 if self.state == DONE else 0
+        return int(self.copied * 100 / self.size)
+
+
+def dest_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+def is_inside(path, folder):
+    # True for folder itself and anything below it (links resolved).
+    path = os.path.normcase(os.path.realpath(path))
+    folder = os.path.normcase(os.path.realpath(folder))
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
+
+def part_paths(dest):
+    return dest + PART_SUFFIX, dest + PART_META_SUFFIX
+
+def source_stamp(source, st):
+    return {"source": source, "size": st.st_size, "mtime": st.st_mtime}
+
+def resume_offset(dest, stamp):
+    # A .part is only trusted if it was written from the very same version
+    # of the source file; anything else starts over.
+    part, meta = part_paths(dest)
+    try:
+        with open(meta, "r", encoding="utf-8") as f:
+            if json.load(f) != stamp:
+                return 0
+        return min(os.path.getsize(part), stamp["size"])
+    except (OSError, ValueError):
+        return 0
+
+def discard_part(dest):
+    for path in part_paths(dest):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def copy_file(job, chunk_size=CHUNK_SIZE, on_progress=None):
+    st = os.stat(job.source)
+    job.size = st.st_size
+    stamp = source_stamp(job.source, st)
+    part, meta = part_paths(job.dest)
+    os.makedirs(os.path.dirname(job.dest) or ".", exist_ok=True)
+    offset = resume_offset(job.dest, stamp)
+    if not offset:
+        with open(meta, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+    job.resumedFrom = job.copied = offset
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    # Unbuffered handles: the chunk buffer is the only copy of the data.
+    with open(job.source, "rb", buffering=0) as src, open(part, "r+b" if offset else "wb", buffering=0) as dst:
+        src.seek(offset)
+        dst.seek(offset)
+        dst.truncate()
+        while True:
+            if job.cancelEvent.is_set():
+                raise TransferCancelled()
+            n = src.readinto(buf)
+            if not n:
+                break
+            dst.write(view[:n])
+            job.copied += n
+            if on_progress is not None:
+                on_progress(job, n)
+        os.fsync(dst.fileno())
+    os.utime(part, (st.st_atime, st.st_mtime))
+    os.replace(part, job.dest)
+    try:
+        os.remove(meta)
+    except OSError:
+        pass
+
+# ------------------------------
+# Sliding-window throughput meter
+# ------------------------------
+class ThroughputMeter:
+    def __init__(self, window=THROUGHPUT_WINDOW, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self.samples = deque()
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def add(self, nbytes):
+        now = self.clock()
+        with self.lock:
+            self.samples.append((now, nbytes))
+            self.total += nbytes
+            self._trim(now)
+
+    def _trim(self, now):
+        while self.samples and now - self.samples[0][0] > self.window:
+            self.total -= self.samples.popleft()[1]
+
+    def rate(self):
+        # Bytes per second over the window.
+        now = self.clock()
+        with self.lock:
+            self._trim(now)
+            if not self.samples:
+                return 0.0
+            span = max(now - self.samples[0][0], 1.0)
+            return self.total / span
+
+# ------------------------------
+# Transfer queue on a bounded thread pool
+# ------------------------------
+class TransferQueue:
+    def __init__(self, max_workers=MAX_TRANSFER_WORKERS, chunk_size=CHUNK_SIZE, retries=MAX_RETRIES,
+                 retry_base=RETRY_BASE_DELAY, retry_max=RETRY_MAX_DELAY):
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.listeners = []
+        self.errorListeners = []
+        # Destination -> id of the unfinished job writing it; two jobs must
+        # never share one .part file.
+        self.activeDests = {}
+        self.lastNotified = {}
+        self.meter = ThroughputMeter()
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transfer")
+        # Walking a remote tree is slow too, so expansion gets its own thread
+        # and file copies start while the walk is still running.
+        self.scanPool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transfer-scan")
+
+    def addListener(self, callback):
+        # Called from worker threads with the TransferJob whose state or
+        # progress changed.
+        with self.lock:
+            self.listeners.append(callback)
+
+    def addErrorListener(self, callback):
+        # Called from the scan thread with a message when expanding the
+        # submitted sources fails.
+        with self.lock:
+            self.errorListeners.append(callback)
+
+    def reportError(self, message):
+        with self.lock:
+            listeners = list(self.errorListeners)
+        for callback in listeners:
+            callback(message)
+
+    def notify(self, job, force=True):
+        now = time.monotonic()
+        with self.lock:
+            if not force and now - self.lastNotified.get(job.id, 0.0) < PROGRESS_INTERVAL:
+                return
+            self.lastNotified[job.id] = now
+            listeners = list(self.listeners)
+        for callback in listeners:
+            callback(job)
+
+    def submit(self, sources, dest_dir):
+        # Files and folders in sources are copied into dest_dir, keeping the
+        # folder structure below each source.
+        future = self.scanPool.submit(self._expand, list(sources), dest_dir)
+        future.add_done_callback(self._expanded)
+        return future
+
+    def _expanded(self, future):
+        error = future.exception()
+        if error is not None:
+            self.reportError(f"Could not queue the copy: {error}")
+
+    def _expand(self, sources, dest_dir):
+        jobs = []
+        for source in sources:
+            source = os.path.normpath(source)
+            target = os.path.join(dest_dir, os.path.basename(source))
+            if not os.path.isdir(source):
+                jobs.append(self.enqueue(source, target))
+                continue
+            if is_inside(dest_dir, source):
+                # The walk would keep finding the copies it just made.
+                self.reportError(f"Cannot copy {source} into itself ({dest_dir}).")
+                continue
+            onerror = lambda e: self.reportError(f"Could not list {e.filename}: {e.strerror or e}")
+            for root, dirs, files in os.walk(source, onerror=onerror):
+                dest_root = os.path.join(target, os.path.relpath(root, source))
+                os.makedirs(dest_root, exist_ok=True)
+                for name in files:
+                    if name.endswith(PART_SUFFIX) or name.endswith(PART_META_SUFFIX):
+                        continue
+                    jobs.append(self.enqueue(os.path.join(root, name), os.path.join(dest_root, name)))
+        return jobs
+
+    def enqueue(self, source, dest):
+        job = TransferJob(source, dest)
+        with self.lock:
+            self.jobs[job.id] = job
+            reason = self._claim(job)
+        if reason is not None:
+            self._skip(job, reason)
+            return job
+        self.notify(job)
+        self.pool.submit(self._run, job)
+        return job
+
+    def _claim(self, job):
+        # Called with the lock held; returns why the job cannot run, if so.
+        # Existing files are never overwritten.
+        key = dest_key(job.dest)
+        if key in self.activeDests:
+            return "another copy to the same destination is already queued"
+        if os.path.exists(job.dest):
+            return "the destination file already exists"
+        self.activeDests[key] = job.id
+        return None
+
+    def _skip(self, job, reason):
+        job.error = reason
+        self._finish(job, SKIPPED)
+
+    def _progress(self, job, nbytes):
+        self.meter.add(nbytes)
+        self.notify(job, force=False)
+
+    def _run(self, job):
+        if job.cancelEvent.is_set():
+            return self._finish(job, CANCELLED)
+        # Another program may have created the file since it was queued.
+        if os.path.exists(job.dest):
+            return self._skip(job, "the destination file already exists")
+        while True:
+            job.state = RUNNING
+            job.attempts += 1
+            self.notify(job)
+            try:
+                copy_file(job, self.chunk_size, self._progress)
+                return self._finish(job, DONE)
+            except TransferCancelled:
+                discard_part(job.dest)
+                return self._finish(job, CANCELLED)
+            except OSError as e:
+                job.error = str(e)
+                if job.attempts > self.retries:
+                    # The .part stays on disk so a later retry resumes it.
+                    return self._finish(job, FAILED)
+                job.state = RETRYING
+                self.notify(job)
+                delay = backoff_delay(job.attempts - 1, self.retry_base, self.retry_max)
+                if job.cancelEvent.wait(delay):
+                    discard_part(job.dest)
+                    return self._finish(job, CANCELLED)
+
+    def _finish(self, job, state):
+        job.state = state
+        if state == DONE:
+            job.error = None
+        with self.lock:
+            key = dest_key(job.dest)
+            if self.activeDests.get(key) == job.id:
+                del self.activeDests[key]
+        self.notify(job)
+        with self.lock:
+            self.lastNotified.pop(job.id, None)
+
+    def cancel(self, job_id=None):
+        with self.lock:
+            jobs = list(self.jobs.values()) if job_id is None else [self.jobs[job_id]]
+        for job in jobs:
+            if job.state in (QUEUED, RUNNING, RETRYING):
+                job.cancelEvent.set()
+
+    def retryFailed(self):
+        with self.lock:
+            failed = [job for job in self.jobs.values() if job.state == FAILED]
+        for job in failed:
+            with self.lock:
+                reason = self._claim(job)
+            if reason is not None:
+                self._skip(job, reason)
+                continue
+            job.state = QUEUED
+            job.attempts = 0
+            self.notify(job)
+            self.pool.submit(self._run, job)
+        return len(failed)
+
+    def clearFinished(self):
+        with self.lock:
+            self.jobs = {i: job for i, job in self.jobs.items() if job.state not in (DONE, CANCELLED, SKIPPED)}
+
+    def counts(self):
+        counts = dict.fromkeys((QUEUED, RUNNING, RETRYING, DONE, FAILED, CANCELLED, SKIPPED), 0)
+        with self.lock:
+            for job in self.jobs.values():
+                counts[job.state] += 1
+        return counts
+
+    def isBusy(self):
+        counts = self.counts()
+        return bool(counts[QUEUED] or counts[RUNNING] or counts[RETRYING])
+
+    def throughput(self):
+        return self.meter.rate()
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_transfer_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = TransferQueue()
+        return _queue
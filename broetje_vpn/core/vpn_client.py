@@ -0,0 +1,17 @@
+from .runner import get_runner
+
+VPN_CLIENT_PATH = r"C:\Program Files (x86)\WatchGuard\WatchGuard Mobile VPN with SSL\wgsslvpnc.exe"
+VPN_CLIENT_IMAGE = "wgsslvpnc.exe"
+
+# ------------------------------
+# WatchGuard Mobile VPN client process control
+# ------------------------------
+def is_vpn_client_running():
+    tasklist = get_runner().check_output(["tasklist", "/FI", f"IMAGENAME eq {VPN_CLIENT_IMAGE}"])
+    return VPN_CLIENT_IMAGE in tasklist
+
+def launch_vpn_client():
+    return get_runner().popen([VPN_CLIENT_PATH])
+
+def terminate_vpn_client(timeout=10):
+    return get_runner().run(["taskkill", "/IM", VPN_CLIENT_IMAGE, "/F"], timeout=timeout)
@@ -0,0 +1,33 @@
+import sys
+# Imported ahead of PyQt5 so the startup profile includes the Qt imports.
+from ..core.startup import get_startup_timer
+from PyQt5.QtWidgets import QApplication
+from ..core.config_store import get_config_store
+from ..core.runner import SimulatedRunner, set_runner
+from .main_window import MainWindow
+
+get_startup_timer().mark("imports")
+
+def main(argv=None):
+    argv = list(sys.argv if argv is None else argv)
+    if "--import-report" in argv:
+        from ..core.import_report import import_report
+        for line in import_report("broetje_vpn.ui.main_window"):
+            print(line)
+        return 0
+    timer = get_startup_timer()
+    if "--profile-startup" in argv:
+        argv.remove("--profile-startup")
+        timer.enable()
+    if "--simulate" in argv:
+        argv.remove("--simulate")
+        set_runner(SimulatedRunner.from_env())
+    app = QApplication(argv)
+    timer.mark("QApplication")
+    window = MainWindow()
+    timer.mark("MainWindow constructed")
+    window.resize(1500, 1000)
+    window.show()
+    timer.mark("window shown")
+    app.aboutToQuit.connect(get_config_store().flush)
+    return app.exec_()
@@ -0,0 +1,141 @@
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from PyQt5.QtWidgets import QWidget, QLineEdit, QHBoxLayout, QVBoxLayout, QPlainTextEdit, QComboBox
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+
+# ------------------------------
+# Bounded output console with batched appends
+# ------------------------------
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+DEFAULT_CONSOLE_LINES = 5000
+CONSOLE_FLUSH_INTERVAL = 16
+
+class LogConsole(QWidget):
+    flushRequested = pyqtSignal()
+
+    def __init__(self, maxLines=DEFAULT_CONSOLE_LINES, parent=None):
+        super().__init__(parent)
+        # Records are (timestamp, level index, text). The ring buffer keeps
+        # the last maxLines records for re-filtering; pending holds what has
+        # not been rendered yet. Both are safe to append to from any thread.
+        self.records = deque(maxlen=maxLines)
+        self.pending = deque()
+        self.flushScheduled = False
+        self.lock = threading.Lock()
+        self.minLevel = LOG_LEVELS.index("INFO")
+        self.textFilter = ""
+        self.fileLogger = None
+        self.initUI(maxLines)
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(CONSOLE_FLUSH_INTERVAL)
+        self.flushTimer.timeout.connect(self.flush)
+        self.flushRequested.connect(self.flushTimer.start, Qt.QueuedConnection)
+
+    def initUI(self, maxLines):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        filterLayout = QHBoxLayout()
+        self.levelCombo = QComboBox()
+        self.levelCombo.addItems(LOG_LEVELS)
+        self.levelCombo.setCurrentIndex(self.minLevel)
+        self.levelCombo.currentIndexChanged.connect(self.setMinLevel)
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText("Filter output...")
+        self.filterEdit.setClearButtonEnabled(True)
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(200)
+        self.filterTimer.timeout.connect(lambda: self.setTextFilter(self.filterEdit.text()))
+        self.filterEdit.textChanged.connect(lambda: self.filterTimer.start())
+        filterLayout.addWidget(self.levelCombo)
+        filterLayout.addWidget(self.filterEdit)
+        layout.addLayout(filterLayout)
+        self.view = QPlainTextEdit()
+        self.view.setObjectName("outputBox")
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(maxLines)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+    def append(self, text, level="INFO"):
+        levelIndex = LOG_LEVELS.index(level)
+        record = (datetime.now(), levelIndex, str(text))
+        if self.fileLogger is not None:
+            self.fileLogger.log(getattr(logging, level), record[2])
+        with self.lock:
+            self.pending.append(record)
+            if self.flushScheduled:
+                return
+            self.flushScheduled = True
+        self.flushRequested.emit()
+
+    def flush(self):
+        with self.lock:
+            batch = list(self.pending)
+            self.pending.clear()
+            self.flushScheduled = False
+        if not batch:
+            return
+        self.records.extend(batch)
+        visible = [self.formatRecord(r) for r in batch if self.accepts(r)]
+        if visible:
+            # One insert per frame instead of one layout pass per message.
+            self.view.appendPlainText("\n".join(visible))
+            scrollBar = self.view.verticalScrollBar()
+            scrollBar.setValue(scrollBar.maximum())
+
+    def accepts(self, record):
+        if record[1] < self.minLevel:
+            return False
+        return not self.textFilter or self.textFilter in record[2].lower()
+
+    def formatRecord(self, record):
+        timestamp, levelIndex, text = record
+        prefix = timestamp.strftime("%H:%M:%S")
+        if levelIndex != LOG_LEVELS.index("INFO"):
+            prefix += " " + LOG_LEVELS[levelIndex]
+        return f"{prefix}  {text}"
+
+    def rerender(self):
+        self.flush()
+        self.view.setPlainText("\n".join(self.formatRecord(r) for r in self.records if self.accepts(r)))
+        scrollBar = self.view.verticalScrollBar()
+        scrollBar.setValue(scrollBar.maximum())
+
+    def setMinLevel(self, levelIndex):
+        self.minLevel = levelIndex
+        self.rerender()
+
+    def setTextFilter(self, text):
+        self.textFilter = text.strip().lower()
+        self.rerender()
+
+    def setMaxLines(self, maxLines):
+        self.records = deque(self.records, maxlen=maxLines)
+        self.view.setMaximumBlockCount(maxLines)
+
+    def setLogFile(self, path, maxBytes=1024 * 1024, backupCount=3):
+        if self.fileLogger is not None:
+            for handler in list(self.fileLogger.handlers):
+                self.fileLogger.removeHandler(handler)
+                handler.close()
+            self.fileLogger = None
+        if not path:
+            return
+        handler = RotatingFileHandler(path, maxBytes=maxBytes, backupCount=backupCount, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        logger = logging.getLogger("broetje_vpn.console")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.fileLogger = logger
+
+    def clear(self):
+        with self.lock:
+            self.pending.clear()
+        self.records.clear()
+        self.view.clear()
@@ -0,0 +1,200 @@
+from PyQt5.QtWidgets import (
+    QWidget, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout, QTabWidget, QFormLayout,
+    QMessageBox, QDialog
+)
+from PyQt5.QtCore import pyqtSignal
+from ..core.profiles import ProfileRegistry
+from ..core.config_store import get_config_store
+
+# ------------------------------
+# One lazily built credentials tab per site profile
+# ------------------------------
+class ProfileTab(QWidget):
+    def __init__(self, profile, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.built = False
+
+    def ensureBuilt(self, data=None, vault=None):
+        # The form is only created when the tab is first shown; it is filled
+        # once from the parsed config and then keeps whatever the user typed.
+        if self.built:
+            return
+        self.built = True
+        profile = self.profile
+        layout = QFormLayout()
+        self.serverEdit = QLineEdit(profile.defaultServer)
+        self.usernameEdit = QLineEdit(profile.defaultUsername)
+        self.passwordEdit = QLineEdit()
+        self.passwordEdit.setEchoMode(QLineEdit.Password)
+        layout.addRow("Server:", self.serverEdit)
+        layout.addRow("Username:", self.usernameEdit)
+        layout.addRow("Password:", self.passwordEdit)
+        buttonsLayout = QHBoxLayout()
+        self.connectButton = QPushButton(f"Connect to {profile.shortLabel} Network Folders")
+        self.rdpButton = QPushButton(f"{profile.shortLabel} RDP Launch")
+        buttonsLayout.addWidget(self.connectButton)
+        buttonsLayout.addWidget(self.rdpButton)
+        layout.addRow(buttonsLayout)
+        customFolderLayout = QHBoxLayout()
+        self.addFolderButton = QPushButton("Add Custom Network Folder")
+        customFolderLayout.addWidget(self.addFolderButton)
+        layout.addRow(customFolderLayout)
+        credButtonsLayout = QHBoxLayout()
+        self.saveButton = QPushButton("Save Credentials")
+        self.clearButton = QPushButton("Clear Credentials")
+        credButtonsLayout.addWidget(self.saveButton)
+        credButtonsLayout.addWidget(self.clearButton)
+        layout.addRow(credButtonsLayout)
+        self.setLayout(layout)
+        if data is not None:
+            self.fill(data, vault)
+
+    def fill(self, data, vault=None):
+        if not self.built:
+            return
+        server, username, password = self.profile.savedCredentials(data, vault)
+        self.serverEdit.setText(server)
+        self.usernameEdit.setText(username)
+        self.passwordEdit.setText(password)
+
+    def values(self):
+        return self.serverEdit.text(), self.usernameEdit.text(), self.passwordEdit.text()
+
+# ------------------------------
+# Credentials Widget with JSON save/clear, autofill, and new network folder buttons
+# ------------------------------
+class CredentialsWidget(QWidget):
+    connectServersRequested = pyqtSignal(str)
+    rdpLaunchRequested = pyqtSignal(str)
+    serverSelectionChanged = pyqtSignal(str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.profileTabs = {}
+        self.credentialsLoaded = False
+        self.initUI()
+        # Until the config store has been parsed in the background only the
+        # built-in sites are known; MainWindow then calls setProfiles.
+        self.setProfiles(ProfileRegistry())
+        
+    def initUI(self):
+        layout = QVBoxLayout()
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+        self.setLayout(layout)
+        self.tabs.currentChanged.connect(self.onTabChanged)
+
+    def setProfiles(self, registry):
+        self.registry = registry
+        current = self.currentProfileKey()
+        self.tabs.blockSignals(True)
+        for key in [k for k in self.profileTabs if k not in registry]:
+            tab = self.profileTabs.pop(key)
+            self.tabs.removeTab(self.tabs.indexOf(tab))
+        for key in registry.keys():
+            profile = registry.get(key)
+            tab = self.profileTabs.get(key)
+            if tab is None:
+                tab = self.profileTabs[key] = ProfileTab(profile)
+                self.tabs.addTab(tab, f"{profile.label} Credentials")
+            else:
+                tab.profile = profile
+        self.tabs.blockSignals(False)
+        selected = current if current in registry else registry.defaultKey()
+        if selected is not None:
+            self.tabs.setCurrentWidget(self.profileTabs[selected])
+            self.onTabChanged(self.tabs.currentIndex())
+
+    def currentProfileKey(self):
+        tab = self.tabs.currentWidget()
+        return tab.profile.key if tab is not None else None
+
+    def savedData(self):
+        # Before the background config load only the site defaults are known.
+        return get_config_store().data() if self.credentialsLoaded else {}
+
+    def unlockedVault(self):
+        # Only handed out once the background load has unlocked it, so the
+        # GUI thread never reads or decrypts the vault file.
+        if not self.credentialsLoaded:
+            return None
+        from ..core.credential_vault import get_vault
+        vault = get_vault()
+        return vault if vault.isUnlocked() else None
+
+    def profileValues(self, key):
+        # (server, username, password); a tab never opened answers from the config.
+        tab = self.profileTabs[key]
+        if tab.built:
+            return tab.values()
+        return tab.profile.savedCredentials(self.savedData(), self.unlockedVault())
+
+    def setConnectEnabled(self, key, enabled):
+        tab = self.profileTabs.get(key)
+        if tab is not None and tab.built:
+            tab.connectButton.setEnabled(enabled)
+        
+    def onTabChanged(self, index):
+        tab = self.tabs.widget(index)
+        if tab is None:
+            return
+        if not tab.built:
+            tab.ensureBuilt(self.savedData(), self.unlockedVault())
+            key = tab.profile.key
+            tab.connectButton.clicked.connect(lambda: self.connectServersRequested.emit(key))
+            tab.rdpButton.clicked.connect(lambda: self.rdpLaunchRequested.emit(key))
+            tab.saveButton.clicked.connect(lambda: self.saveCredentials(key))
+            tab.clearButton.clicked.connect(lambda: self.clearCredentials(key))
+            tab.addFolderButton.clicked.connect(lambda: self.addNetworkFolder(key))
+        self.serverSelectionChanged.emit(tab.profile.key)
+    
+    def addNetworkFolder(self, key):
+        from .dialogs import AddNetworkFolderDialog
+        profile = self.profileTabs[key].profile
+        dialog = AddNetworkFolderDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            drive, path = dialog.getValues()
+            if drive and path:
+                store = get_config_store()
+                folders = store.get(profile.folderKey, [])
+                folders.append({"drive": drive, "path": path})
+                store.set(profile.folderKey, folders)
+                QMessageBox.information(self, "Network Folder", f"{profile.shortLabel} network folder added.")
+    
+    def saveCredentials(self, key):
+        tab = self.profileTabs[key]
+        server, username, password = tab.values()
+        # Only the non-secret part goes into the config file.
+        get_config_store().set(tab.profile.credentialKey, {
+            "server": server,
+            "username": username
+        })
+        vault = self.unlockedVault()
+        if vault is None:
+            QMessageBox.warning(self, "Save Credentials",
+                                f"{tab.profile.label} server and username saved. The credential vault is not "
+                                "available, so the password was not saved.")
+            return
+        from ..core.credential_vault import VaultError
+        try:
+            vault.set(tab.profile.credentialKey, password)
+        except (VaultError, OSError) as e:
+            QMessageBox.warning(self, "Save Credentials", f"{tab.profile.label} server and username saved, but "
+                                f"the password could not be saved:\n{str(e)}")
+            return
+        QMessageBox.information(self, "Save Credentials", f"{tab.profile.label} credentials saved.")
+    
+    def clearCredentials(self, key):
+        tab = self.profileTabs[key]
+        tab.serverEdit.clear()
+        tab.usernameEdit.clear()
+        tab.passwordEdit.clear()
+        QMessageBox.information(self, "Clear Credentials", f"{tab.profile.label} credentials cleared.")
+    
+    def loadSavedCredentials(self):
+        self.credentialsLoaded = True
+        data = self.savedData()
+        vault = self.unlockedVault()
+        for tab in self.profileTabs.values():
+            tab.fill(data, vault)
@@ -0,0 +1,314 @@
+import os
+from PyQt5.QtWidgets import (
+    QLineEdit, QPushButton, QVBoxLayout, QFormLayout, QMessageBox, QDialog, QListView,
+    QAbstractItemView, QDialogButtonBox, QFileDialog
+)
+from PyQt5.QtCore import Qt, QAbstractListModel, QDir, QModelIndex
+from ..core.server_catalog import ServerCatalog, read_server_file, write_server_file
+
+# ------------------------------
+# Dialog for adding a new server (existing, used in CustomServerDialog)
+# ------------------------------
+class AddServerDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Add New Server")
+        self.resize(1000, 150)  # Doubled width compared to a standard dialog
+        self.applyModeStyle(parent)
+        self.initUI()
+
+    def applyModeStyle(self, parent):
+        if parent is not None and hasattr(parent, "darkMode") and parent.darkMode:
+            style = """
+                QDialog { background-color: #333333; color: #FFFFFF; }
+                QLabel { color: #FFFFFF; }
+                QLineEdit { background-color: #333333; color: #FFFFFF; border: 1px solid #FFFFFF; }
+                QDialogButtonBox { background-color: #333333; color: #FFFFFF; }
+                QMenu { background-color: #333333; color: #000000; }
+            """
+        else:
+            style = """
+                QDialog { background-color: #FFFFFF; color: #000000; }
+                QLabel { color: #000000; }
+                QLineEdit { background-color: #FFFFFF; color: #000000; border: 1px solid #000000; }
+                QDialogButtonBox { background-color: #FFFFFF; color: #000000; }
+                QMenu { background-color: #FFFFFF; color: #000000; }
+            """
+        self.setStyleSheet(style)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        formLayout = QFormLayout()
+        self.descriptionLineEdit = QLineEdit()
+        self.addressLineEdit = QLineEdit()
+        formLayout.addRow("Description:", self.descriptionLineEdit)
+        formLayout.addRow("Server UNC Path:", self.addressLineEdit)
+        layout.addLayout(formLayout)
+        buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        layout.addWidget(buttonBox)
+        self.setLayout(layout)
+        buttonBox.accepted.connect(self.accept)
+        buttonBox.rejected.connect(self.reject)
+
+    def getValues(self):
+        return self.descriptionLineEdit.text().strip(), self.addressLineEdit.text().strip()
+
+# ------------------------------
+# Dialog for adding a new network folder mapping
+# ------------------------------
+class AddNetworkFolderDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Add Custom Network Folder")
+        self.resize(1000, 150)
+        self.applyModeStyle(parent)
+        self.initUI()
+
+    def applyModeStyle(self, parent):
+        if parent is not None and hasattr(parent, "darkMode") and parent.darkMode:
+            style = """
+                QDialog { background-color: #333333; color: #FFFFFF; }
+                QLabel { color: #FFFFFF; }
+                QLineEdit { background-color: #333333; color: #FFFFFF; border: 1px solid #FFFFFF; }
+                QDialogButtonBox { background-color: #333333; color: #FFFFFF; }
+            """
+        else:
+            style = """
+                QDialog { background-color: #FFFFFF; color: #000000; }
+                QLabel { color: #000000; }
+                QLineEdit { background-color: #FFFFFF; color: #000000; border: 1px solid #000000; }
+                QDialogButtonBox { background-color: #FFFFFF; color: #000000; }
+            """
+        self.setStyleSheet(style)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        formLayout = QFormLayout()
+        self.driveLineEdit = QLineEdit()
+        self.driveLineEdit.setPlaceholderText("e.g., N:")
+        self.pathLineEdit = QLineEdit()
+        self.pathLineEdit.setPlaceholderText("e.g., \\\\banet.loc\\baw")
+        formLayout.addRow("Drive Letter:", self.driveLineEdit)
+        formLayout.addRow("UNC Path:", self.pathLineEdit)
+        layout.addLayout(formLayout)
+        buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        layout.addWidget(buttonBox)
+        self.setLayout(layout)
+        buttonBox.accepted.connect(self.accept)
+        buttonBox.rejected.connect(self.reject)
+
+    def getValues(self):
+        drive = self.driveLineEdit.text().strip()
+        path = self.pathLineEdit.text().strip()
+        return drive, path
+
+# ------------------------------
+# List model over the server catalog; only the visible (filtered) ids are held
+# ------------------------------
+# More removal runs than this and a filter change resets the view instead.
+MAX_REMOVE_RUNS = 32
+
+class ServerListModel(QAbstractListModel):
+    IdRole = Qt.UserRole + 1
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.query = ""
+        self.rows = catalog.filter(self.query)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        entry = self.catalog.entry(self.rows[index.row()])
+        if entry is None:
+            return None
+        if role == Qt.DisplayRole:
+            return entry["description"]
+        if role in (Qt.ToolTipRole, Qt.UserRole):
+            return entry["address"]
+        if role == self.IdRole:
+            return entry["id"]
+        return None
+
+    def serverId(self, row):
+        return self.rows[row] if 0 <= row < len(self.rows) else None
+
+    def setFilter(self, query):
+        rows = self.catalog.filter(query)
+        self.query = query
+        keep = set(rows)
+        if len(keep) <= len(self.rows) and keep.issubset(self.rows) and \
+                self._removeWhere(lambda server_id: server_id not in keep):
+            return
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def addServer(self, description, address):
+        server_id = self.catalog.add(description, address)
+        self._appendMatching([server_id])
+        return server_id
+
+    def updateServer(self, server_id, description, address):
+        self.catalog.update(server_id, description, address)
+        if server_id not in self.rows:
+            return
+        if self.catalog.matches(server_id, self.query):
+            index = self.index(self.rows.index(server_id))
+            self.dataChanged.emit(index, index)
+        else:
+            self._removeWhere(lambda i: i == server_id, limit=None)
+
+    def removeServers(self, server_ids):
+        removed = set(self.catalog.remove(server_ids))
+        self._removeWhere(lambda i: i in removed, limit=None)
+
+    def importServers(self, entries):
+        added, skipped = self.catalog.importEntries(entries)
+        self._appendMatching(added)
+        return len(added), skipped
+
+    def _appendMatching(self, server_ids):
+        # New entries always go to the end of the catalog, so one insert covers a batch.
+        rows = [i for i in server_ids if self.catalog.matches(i, self.query)]
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def _removeWhere(self, drop, limit=MAX_REMOVE_RUNS):
+        runs = []
+        row = 0
+        while row < len(self.rows):
+            if drop(self.rows[row]):
+                start = row
+                while row + 1 < len(self.rows) and drop(self.rows[row + 1]):
+                    row += 1
+                runs.append((start, row))
+            row += 1
+        if limit is not None and len(runs) > limit:
+            return False
+        # Bottom-up so the earlier runs keep their row numbers.
+        for start, end in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self.rows[start:end + 1]
+            self.endRemoveRows()
+        return True
+
+# ------------------------------
+# Custom dialog for custom server locations (existing)
+# ------------------------------
+class CustomServerDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Custom Server Locations")
+        self.resize(1000, 300)
+        if parent is not None:
+            self.setStyleSheet(parent.styleSheet())
+        self.catalog = ServerCatalog()
+        if not len(self.catalog):
+            self.catalog.add("PW Carrier Projects",
+                             r"\\banet.loc\uschi\BA_Chicago\USABH_old_do_not_change\70 Projects\07_Pratt&Whitney")
+        self.model = ServerListModel(self.catalog, self)
+        self.initUI()
+    
+    def initUI(self):
+        layout = QVBoxLayout()
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText("Type to filter by description or path...")
+        self.filterEdit.textChanged.connect(self.model.setFilter)
+        layout.addWidget(self.filterEdit)
+        self.listView = QListView()
+        # Every row has the same height, so the view only lays out what is on screen.
+        self.listView.setUniformItemSizes(True)
+        self.listView.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.listView.setModel(self.model)
+        if self.parent() is not None and hasattr(self.parent(), "darkMode") and self.parent().darkMode:
+            self.listView.setStyleSheet("QListView { color: #FFFFFF; background-color: #333333; } QMenu { background-color: #333333; color: #000000; }")
+        else:
+            self.listView.setStyleSheet("QListView { color: #000000; background-color: #FFFFFF; } QMenu { background-color: #FFFFFF; color: #000000; }")
+        layout.addWidget(self.listView)
+        buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        addButton = QPushButton("Add New Server")
+        deleteButton = QPushButton("Delete Selected")
+        editButton = QPushButton("Edit Selected")
+        importButton = QPushButton("Import...")
+        exportButton = QPushButton("Export...")
+        for button in (addButton, deleteButton, editButton, importButton, exportButton):
+            buttonBox.addButton(button, QDialogButtonBox.ActionRole)
+        layout.addWidget(buttonBox)
+        self.setLayout(layout)
+        addButton.clicked.connect(self.addServer)
+        deleteButton.clicked.connect(self.deleteServer)
+        editButton.clicked.connect(self.editServer)
+        importButton.clicked.connect(self.importServers)
+        exportButton.clicked.connect(self.exportServers)
+        buttonBox.accepted.connect(self.accept)
+        buttonBox.rejected.connect(self.reject)
+    
+    def addServer(self):
+        dialog = AddServerDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            desc, addr = dialog.getValues()
+            if desc and addr:
+                self.model.addServer(desc, addr)
+    
+    def editServer(self):
+        server_id = self.model.serverId(self.listView.currentIndex().row())
+        if server_id is None or not self.listView.selectionModel().hasSelection():
+            QMessageBox.warning(self, "No Selection", "Please select a server to edit.")
+            return
+        current_server = self.catalog.entry(server_id)
+        # Use AddServerDialog for editing, but prepopulate with the current values
+        dialog = AddServerDialog(self)
+        dialog.setWindowTitle("Edit Server")
+        dialog.descriptionLineEdit.setText(current_server["description"])
+        dialog.addressLineEdit.setText(current_server["address"])
+        if dialog.exec_() == QDialog.Accepted:
+            new_desc, new_addr = dialog.getValues()
+            if new_desc and new_addr:
+                self.model.updateServer(server_id, new_desc, new_addr)
+    
+    def deleteServer(self):
+        rows = self.listView.selectionModel().selectedRows()
+        if not rows:
+            return
+        self.model.removeServers([self.model.serverId(index.row()) for index in rows])
+
+    def importServers(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Servers", QDir.homePath(),
+                                              "Server lists (*.json *.csv);;All files (*)")
+        if not path:
+            return
+        try:
+            entries = read_server_file(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Import Servers", f"Could not read {path}:\n{str(e)}")
+            return
+        added, skipped = self.model.importServers(entries)
+        message = f"{added} server(s) imported."
+        if skipped:
+            message += f" {skipped} skipped (already listed or incomplete)."
+        QMessageBox.information(self, "Import Servers", message)
+
+    def exportServers(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Servers",
+                                              os.path.join(QDir.homePath(), "custom_servers.json"),
+                                              "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            write_server_file(path, self.catalog.entries())
+        except OSError as e:
+            QMessageBox.warning(self, "Export Servers", f"Could not write {path}:\n{str(e)}")
+            return
+        QMessageBox.information(self, "Export Servers", f"{len(self.catalog)} server(s) exported.")
+    
+    def getSelectedServer(self):
+        server_id = self.model.serverId(self.listView.currentIndex().row())
+        return self.catalog.entry(server_id)["address"] if server_id is not None else None
@@ -0,0 +1,794 @@
+import os
+from datetime import datetime
+from PyQt5.QtWidgets import (
+    QWidget, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout, QFileIconProvider, QTreeView,
+    QMessageBox, QComboBox, QDialog, QListWidget, QListWidgetItem, QMenu, QFileDialog
+)
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QDir, QObject, QModelIndex, QRunnable, QThreadPool, pyqtSignal, QTimer,
+    QThread
+)
+from ..core.drive_inventory import get_drive_inventory
+from ..core.drive_list import diff_sorted, drive_list_items
+from ..core.config_store import get_config_store
+from ..core.listing_cache import (
+    NAME, IS_DIR, SIZE, MTIME, directory_mtime, get_listing_cache, iter_directory_pages,
+    listing_key, sort_entries
+)
+from ..core.runner import get_runner
+
+# ------------------------------
+# Drive dropdown model that applies only the rows that changed between scans
+# ------------------------------
+class DriveListModel(QAbstractListModel):
+    KeyRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return None
+        item = self.items[index.row()]
+        if role == Qt.DisplayRole:
+            return item.display
+        if role == Qt.UserRole:
+            return item.path
+        if role == self.KeyRole:
+            return item.key
+        return None
+
+    def key(self, row):
+        return self.items[row].key if 0 <= row < len(self.items) else None
+
+    def rowOf(self, key):
+        for row, item in enumerate(self.items):
+            if item.key == key:
+                return row
+        return -1
+
+    def setItems(self, items):
+        removed, inserted, changed = diff_sorted(self.items, items)
+        for first, last in removed:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.items[first:last + 1]
+            self.endRemoveRows()
+        for row, run in inserted:
+            self.beginInsertRows(QModelIndex(), row, row + len(run) - 1)
+            self.items[row:row] = run
+            self.endInsertRows()
+        for row in changed:
+            self.items[row] = items[row]
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        return bool(removed or inserted or changed)
+
+# ------------------------------
+# Custom QComboBox that shows the cached drive list when clicked and asks for a rescan
+# ------------------------------
+class DriveComboBox(QComboBox):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setPlaceholderText("Connected Drives")
+        self.setModel(DriveListModel(self))
+    def showPopup(self):
+        if hasattr(self.parent(), "refreshDriveList"):
+            self.parent().refreshDriveList()
+        super().showPopup()
+
+# ------------------------------
+# Folder tree model that lists directories on worker threads
+# ------------------------------
+def format_size(size):
+    for unit in ("bytes", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size} {unit}" if unit == "bytes" else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+class ListingSignals(QObject):
+    pageReady = pyqtSignal(str, int, object, bool)
+    unchanged = pyqtSignal(str, int)
+    failed = pyqtSignal(str, int, str)
+
+class ListingTask(QRunnable):
+    def __init__(self, path, generation, known_mtime, cache, signals):
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.known_mtime = known_mtime
+        self.cache = cache
+        self.signals = signals
+
+    def run(self):
+        try:
+            mtime = directory_mtime(self.path)
+            if self.known_mtime is not None and mtime == self.known_mtime:
+                self.cache.touch(self.path)
+                self.signals.unchanged.emit(self.path, self.generation)
+                return
+            entries = []
+            # Pages are handed to the model as they arrive so huge folders
+            # start filling in before the enumeration has finished.
+            for page in iter_directory_pages(self.path):
+                if page:
+                    entries.extend(page)
+                    self.signals.pageReady.emit(self.path, self.generation, page, False)
+            self.signals.pageReady.emit(self.path, self.generation, [], True)
+            self.cache.put(self.path, mtime, sort_entries(entries))
+        except Exception as e:
+            self.signals.failed.emit(self.path, self.generation, str(e))
+
+class FolderTreeModel(QStandardItemModel):
+    PathRole = Qt.UserRole + 1
+    IsDirRole = Qt.UserRole + 2
+    StateRole = Qt.UserRole + 3
+    SortRole = Qt.UserRole + 4
+    UNLOADED, LOADING, LOADED = range(3)
+
+    listingFailed = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHorizontalHeaderLabels(["Name", "Size", "Date Modified"])
+        self.setSortRole(self.SortRole)
+        self.cache = get_listing_cache()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self.signals = ListingSignals(self)
+        self.signals.pageReady.connect(self.onPageReady)
+        self.signals.unchanged.connect(self.onUnchanged)
+        self.signals.failed.connect(self.onFailed)
+        self.iconProvider = QFileIconProvider()
+        self.readOnly = True
+        self._rootPath = ""
+        self._rootState = self.UNLOADED
+        self._generation = 0
+        self._items = {}
+        self._loads = {}
+
+    def setReadOnly(self, readOnly):
+        self.readOnly = readOnly
+
+    def rootPath(self):
+        return self._rootPath
+
+    def isLoading(self):
+        # Also polled from the prefetch threads, which hold back meanwhile.
+        return bool(self._loads)
+
+    def setRootPath(self, path):
+        self._generation += 1
+        self.removeRows(0, self.rowCount())
+        self._items = {}
+        self._loads = {}
+        self._rootPath = path
+        self._rootState = self.UNLOADED
+        self.fetchMore(QModelIndex())
+
+    def itemForIndex(self, index):
+        if not index.isValid():
+            return self.invisibleRootItem()
+        return self.itemFromIndex(index.sibling(index.row(), 0))
+
+    def pathForItem(self, item):
+        if item is self.invisibleRootItem():
+            return self._rootPath
+        return item.data(self.PathRole)
+
+    def filePath(self, index):
+        return self.pathForItem(self.itemForIndex(index))
+
+    def isDir(self, index):
+        if not index.isValid():
+            return True
+        return bool(self.itemForIndex(index).data(self.IsDirRole))
+
+    def stateOf(self, item):
+        if item is self.invisibleRootItem():
+            return self._rootState
+        return item.data(self.StateRole)
+
+    def setState(self, item, state):
+        if item is self.invisibleRootItem():
+            self._rootState = state
+        else:
+            item.setData(state, self.StateRole)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() == 0:
+            item = self.itemFromIndex(parent)
+            if item.data(self.IsDirRole) and item.data(self.StateRole) != self.LOADED:
+                return True
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent):
+        if parent.isValid() and parent.column() != 0:
+            return False
+        item = self.itemForIndex(parent)
+        if item is not self.invisibleRootItem() and not item.data(self.IsDirRole):
+            return False
+        return self.stateOf(item) == self.UNLOADED
+
+    def fetchMore(self, parent):
+        item = self.itemForIndex(parent)
+        path = self.pathForItem(item)
+        if not path:
+            return
+        self.setState(item, self.LOADING)
+        key = listing_key(path)
+        self._items[key] = item
+        # A cached listing is shown immediately; the worker then checks the
+        # directory mtime and only re-reads the folder if it changed.
+        known_mtime = None
+        cached = self.cache.get(path)
+        if cached is not None:
+            known_mtime, entries = cached
+            # On a refresh the rows are already there; only add what is new.
+            self.mergeEntries(item, path, entries, self.childNames(item))
+        self._loads[key] = ({}, self.childNames(item))
+        self.pool.start(ListingTask(path, self._generation, known_mtime, self.cache, self.signals))
+
+    def childNames(self, item):
+        names = {}
+        for row in range(item.rowCount()):
+            child = item.child(row, 0)
+            names[child.text()] = child
+        return names
+
+    def makeRow(self, parentPath, entry):
+        is_dir = bool(entry[IS_DIR])
+        nameItem = QStandardItem(self.iconProvider.icon(
+            QFileIconProvider.Folder if is_dir else QFileIconProvider.File), entry[NAME])
+        nameItem.setData(os.path.join(parentPath, entry[NAME]), self.PathRole)
+        nameItem.setData(is_dir, self.IsDirRole)
+        nameItem.setData(self.UNLOADED if is_dir else self.LOADED, self.StateRole)
+        nameItem.setData(("0" if is_dir else "1") + entry[NAME].lower(), self.SortRole)
+        nameItem.setEditable(not self.readOnly)
+        sizeItem = QStandardItem("" if is_dir else format_size(entry[SIZE]))
+        sizeItem.setData(entry[SIZE], self.SortRole)
+        sizeItem.setEditable(False)
+        dateItem = QStandardItem(datetime.fromtimestamp(entry[MTIME]).strftime("%d.%m.%Y %H:%M") if entry[MTIME] else "")
+        dateItem.setData(entry[MTIME], self.SortRole)
+        dateItem.setEditable(False)
+        return [nameItem, sizeItem, dateItem]
+
+    def mergeEntries(self, item, path, entries, existing, seen=None):
+        rows = []
+        for entry in entries:
+            name = entry[NAME]
+            if seen is not None:
+                seen[name] = True
+            child = existing.get(name)
+            if child is None:
+                rows.append(self.makeRow(path, entry))
+                continue
+            row = child.row()
+            if not entry[IS_DIR]:
+                item.child(row, 1).setText(format_size(entry[SIZE]))
+            item.child(row, 2).setText(datetime.fromtimestamp(entry[MTIME]).strftime("%d.%m.%Y %H:%M") if entry[MTIME] else "")
+        for row in rows:
+            item.appendRow(row)
+
+    def onPageReady(self, path, generation, page, final):
+        if generation != self._generation:
+            return
+        key = listing_key(path)
+        item = self._items.get(key)
+        load = self._loads.get(key)
+        if item is None or load is None:
+            return
+        seen, existing = load
+        self.mergeEntries(item, path, page, existing, seen)
+        if not final:
+            return
+        for row in reversed(range(item.rowCount())):
+            child = item.child(row, 0)
+            if child.text() not in seen:
+                self.forget(child.data(self.PathRole))
+                item.removeRow(row)
+        item.sortChildren(0)
+        self.setState(item, self.LOADED)
+        del self._loads[key]
+
+    def onUnchanged(self, path, generation):
+        if generation != self._generation:
+            return
+        key = listing_key(path)
+        item = self._items.get(key)
+        if item is not None:
+            self.setState(item, self.LOADED)
+        self._loads.pop(key, None)
+
+    def onFailed(self, path, generation, message):
+        if generation != self._generation:
+            return
+        key = listing_key(path)
+        item = self._items.get(key)
+        if item is not None:
+            self.setState(item, self.LOADED)
+        self._loads.pop(key, None)
+        self.listingFailed.emit(path, message)
+
+    def refreshPath(self, path, force=False):
+        # Re-lists a directory that is already shown, e.g. after files were
+        # copied into it; rows are merged in place. force skips the mtime
+        # shortcut, which misses in-place edits of files.
+        item = self._items.get(listing_key(path))
+        if item is None or self.stateOf(item) != self.LOADED:
+            return
+        if force:
+            self.cache.discard(path)
+        self.setState(item, self.UNLOADED)
+        self.fetchMore(QModelIndex() if item is self.invisibleRootItem() else item.index())
+
+    def forget(self, path):
+        key = listing_key(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        for known in [k for k in self._items if k == key or k.startswith(prefix)]:
+            del self._items[known]
+            self._loads.pop(known, None)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role == Qt.EditRole and index.isValid() and index.column() == 0:
+            item = self.itemFromIndex(index)
+            newName = str(value).strip()
+            if self.readOnly or not newName or newName == item.text():
+                return False
+            oldPath = item.data(self.PathRole)
+            newPath = os.path.join(os.path.dirname(oldPath), newName)
+            try:
+                os.rename(oldPath, newPath)
+            except OSError as e:
+                self.listingFailed.emit(oldPath, str(e))
+                return False
+            self.forget(oldPath)
+            item.setText(newName)
+            item.setData(newPath, self.PathRole)
+            item.setData(("0" if item.data(self.IsDirRole) else "1") + newName.lower(), self.SortRole)
+            if item.data(self.IsDirRole):
+                item.removeRows(0, item.rowCount())
+                item.setData(self.UNLOADED, self.StateRole)
+            return True
+        return super().setData(index, value, role)
+
+# ------------------------------
+# Worker thread for (re)building the search index
+# ------------------------------
+class IndexWorker(QThread):
+    finished_signal = pyqtSignal(int)
+    def __init__(self, roots):
+        super().__init__()
+        self.roots = roots
+    def run(self):
+        from ..core.search_index import get_file_index
+        index = get_file_index()
+        rescanned = index.updateRoots(self.roots, should_stop=self.isInterruptionRequested)
+        try:
+            index.save()
+        except OSError:
+            pass
+        self.finished_signal.emit(rescanned)
+
+# ------------------------------
+# Worker thread for a delta sync of a folder tree
+# ------------------------------
+class SyncWorker(QThread):
+    progress_signal = pyqtSignal(int, int, str)
+    finished_signal = pyqtSignal(object)
+    def __init__(self, source, dest, delete=False):
+        super().__init__()
+        self.source = source
+        self.dest = dest
+        self.delete = delete
+    def run(self):
+        try:
+            from ..core.delta_sync import sync_tree
+            result = sync_tree(self.source, self.dest, delete=self.delete, on_progress=self.progress_signal.emit,
+                               should_stop=self.isInterruptionRequested)
+        except OSError as e:
+            result = e
+        self.finished_signal.emit(result)
+
+# ------------------------------
+# Worker thread that opens a remote file through the local file cache
+# ------------------------------
+class FileOpenWorker(QThread):
+    # (source, local path or "", stale-since timestamp or None, error); an
+    # error together with a local path means "opened, but with a problem".
+    finished_signal = pyqtSignal(str, str, object, str)
+    def __init__(self, source, maxMegabytes=None, refresh=False):
+        super().__init__()
+        self.source = source
+        self.maxMegabytes = maxMegabytes
+        self.refresh = refresh
+    def run(self):
+        from ..core.file_cache import CachedCopyInUse, get_file_cache
+        # Without a configured limit the cache keeps its default size.
+        maxBytes = self.maxMegabytes * 1024 * 1024 if self.maxMegabytes else None
+        try:
+            local, staleSince = get_file_cache(maxBytes).open(self.source, refresh=self.refresh)
+            self.finished_signal.emit(self.source, local, staleSince, "")
+        except CachedCopyInUse as e:
+            self.finished_signal.emit(self.source, e.local, None, e.strerror)
+        except OSError as e:
+            self.finished_signal.emit(self.source, "", None, str(e))
+
+# ------------------------------
+# Folder Browser Widget with Drive List Dropdown (and custom servers merged)
+# ------------------------------
+class FolderBrowserWidget(QWidget):
+    drivesUpdated = pyqtSignal(object, object)
+    syncRequested = pyqtSignal(str, str)
+    directoryChanged = pyqtSignal(str)
+    INDEX_INTERVAL = 10 * 60 * 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.inventory = get_drive_inventory()
+        # Scans finish on the inventory's thread; the signal hands them to the GUI thread.
+        self.drivesUpdated.connect(self.populateDriveList)
+        self.inventory.addListener(self.drivesUpdated.emit)
+        self.indexWorker = None
+        self.indexedOnce = False
+        self.openWorkers = []
+        # Key of the dropdown entry the tree is rooted at; the model updates
+        # move rows around, and only a different key means a new root.
+        self.selectedDriveKey = None
+        self.updatingDriveList = False
+        # The watcher, the prefetcher, the search index and the transfer queue
+        # are imported on first use, so creating the widget does not pay for them.
+        self.watcher = None
+        self.prefetcher = None
+        self.directoryChanged.connect(lambda path: self.model.refreshPath(path, force=True))
+        self.initUI()
+        self.prefetchTarget = None
+        self.prefetchTimer = QTimer(self)
+        self.prefetchTimer.setSingleShot(True)
+        self.prefetchTimer.setInterval(300)
+        self.prefetchTimer.timeout.connect(self.startPrefetch)
+        
+    def initUI(self):
+        layout = QVBoxLayout()
+        quickLinksLayout = QHBoxLayout()
+        self.customServersButton = QPushButton("Custom Servers")
+        self.customServersButton.clicked.connect(self.showCustomServersDialog)
+        openLocationButton = QPushButton("Open File Location")
+        openLocationButton.clicked.connect(self.openFileLocation)
+        quickLinksLayout.addWidget(self.customServersButton)
+        quickLinksLayout.addWidget(openLocationButton)
+        layout.addLayout(quickLinksLayout)
+        self.driveComboBox = DriveComboBox(self)
+        self.driveComboBox.currentIndexChanged.connect(self.driveSelected)
+        layout.addWidget(self.driveComboBox)
+        self.searchBox = QLineEdit()
+        self.searchBox.setPlaceholderText("Search mapped drives and custom servers...")
+        self.searchBox.setClearButtonEnabled(True)
+        self.searchBox.textChanged.connect(lambda: self.searchTimer.start())
+        self.searchBox.returnPressed.connect(self.runSearch)
+        layout.addWidget(self.searchBox)
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(150)
+        self.searchTimer.timeout.connect(self.runSearch)
+        self.searchResults = QListWidget()
+        self.searchResults.itemActivated.connect(self.openSearchResult)
+        self.searchResults.hide()
+        layout.addWidget(self.searchResults)
+        self.indexTimer = QTimer(self)
+        self.indexTimer.setInterval(self.INDEX_INTERVAL)
+        self.indexTimer.timeout.connect(self.updateSearchIndex)
+        self.indexTimer.start()
+        self.model = FolderTreeModel(self)
+        self.model.setReadOnly(False)
+        self.model.listingFailed.connect(self.listingFailed)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setColumnWidth(0, 200)
+        self.tree.setEditTriggers(QTreeView.DoubleClicked | QTreeView.EditKeyPressed)
+        self.tree.setSelectionMode(QTreeView.ExtendedSelection)
+        self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree.customContextMenuRequested.connect(self.showTreeMenu)
+        self.tree.expanded.connect(lambda index: self.changeWatcher().watch(self.model.filePath(index)))
+        self.tree.collapsed.connect(
+            lambda index: self.changeWatcher().unwatch(self.model.filePath(index), recursive=True))
+        self.tree.expanded.connect(lambda index: self.directoryVisited(self.model.filePath(index)))
+        self.tree.selectionModel().currentChanged.connect(self.treeCurrentChanged)
+        layout.addWidget(self.tree)
+        self.setLayout(layout)
+
+    def startBackgroundTasks(self):
+        # Called once the main window has painted: the home folder listing and
+        # the drive scan both run on worker threads.
+        if not self.model.rootPath():
+            self.setRoot(QDir.homePath())
+        self.refreshDriveList()
+        if get_config_store().get("watch_changes", True):
+            self.changeWatcher().start()
+
+    def changeWatcher(self):
+        # Only the root and the expanded folders are watched.
+        if self.watcher is None:
+            from ..core.change_watcher import get_change_watcher
+            self.watcher = get_change_watcher()
+            self.watcher.addListener(self.onWatchedChange)
+        return self.watcher
+
+    def folderPrefetcher(self):
+        # Lists likely-next folders into the listing cache so expanding them
+        # shows rows without waiting for the share. Unset limits keep the
+        # prefetcher's defaults.
+        if self.prefetcher is None:
+            from ..core.prefetch import get_prefetcher
+            store = get_config_store()
+            self.prefetcher = get_prefetcher()
+            self.prefetcher.configure(max_workers=store.get("prefetch_workers"), kbps=store.get("prefetch_kbps"))
+            self.prefetcher.foregroundBusy = self.model.isLoading
+        return self.prefetcher
+        
+    def openFileLocation(self):
+        current_path = self.model.rootPath()
+        norm_path = os.path.normpath(current_path)
+        if os.path.exists(norm_path):
+            os.startfile(norm_path)
+        else:
+            QMessageBox.warning(self, "Error", f"The current location does not exist or is not accessible:\n{norm_path}")
+    
+    def driveSelected(self, index):
+        if index < 0 or self.updatingDriveList:
+            return
+        key = self.driveComboBox.model().key(index)
+        if key == self.selectedDriveKey:
+            return
+        self.selectedDriveKey = key
+        path = self.driveComboBox.itemData(index)
+        if path:
+            self.setRoot(path)
+        else:
+            text = self.driveComboBox.currentText()
+            drive = text.split()[0]
+            self.setRoot(drive + "/")
+    
+    def setRoot(self, path):
+        watcher = self.changeWatcher()
+        watcher.clear()
+        watcher.watch(path)
+        self.model.setRootPath(path)
+        self.directoryVisited(path)
+
+    def directoryVisited(self, path):
+        self.folderPrefetcher().visit(path)
+        self.schedulePrefetch(path)
+
+    def treeCurrentChanged(self, current, previous):
+        if current.isValid() and self.model.isDir(current):
+            self.schedulePrefetch(self.model.filePath(current))
+
+    def schedulePrefetch(self, path):
+        # Queued work for the previous folder is dropped right away; the new
+        # round starts once the selection has settled.
+        self.folderPrefetcher().cancel()
+        self.prefetchTarget = path
+        self.prefetchTimer.start()
+
+    def startPrefetch(self):
+        if not self.prefetchTarget or not get_config_store().get("prefetch_enabled", True):
+            return
+        roots = [s.get("address", "") for s in get_config_store().get("custom_servers", [])]
+        self.folderPrefetcher().navigate(self.prefetchTarget, [r for r in roots if r])
+
+    def onWatchedChange(self, path):
+        # Runs on the watcher thread, so the index re-list stays off the GUI.
+        from ..core.search_index import get_file_index
+        get_file_index().updateDirectory(path)
+        self.directoryChanged.emit(path)
+
+    def listingFailed(self, path, message):
+        window = self.window()
+        if hasattr(window, "outputBox"):
+            window.outputBox.append(f"Could not list {path}: {message}", "WARNING")
+        
+    def refreshDriveList(self, force=False):
+        # Shows the cached inventory right away; a background scan updates the
+        # list in place through drivesUpdated once it finishes.
+        self.populateDriveList()
+        self.inventory.refresh(force=force)
+
+    def invalidateDriveList(self):
+        self.inventory.invalidate()
+        self.refreshDriveList(force=True)
+
+    def populateDriveList(self, *args):
+        if args and not self.indexedOnce:
+            self.updateSearchIndex()
+        entries, error = self.inventory.snapshot()
+        items = drive_list_items(entries, error, get_config_store().get("custom_servers", []))
+        model = self.driveComboBox.model()
+        # Rows shifting under the current entry make QComboBox report a new
+        # index; none of that may re-root the tree.
+        self.updatingDriveList = True
+        try:
+            if not model.setItems(items):
+                return
+        finally:
+            self.updatingDriveList = False
+        row = model.rowOf(self.selectedDriveKey) if self.selectedDriveKey is not None else -1
+        if row != self.driveComboBox.currentIndex():
+            self.driveComboBox.blockSignals(True)
+            self.driveComboBox.setCurrentIndex(row)
+            self.driveComboBox.blockSignals(False)
+    
+    def searchRoots(self):
+        entries, error = self.inventory.snapshot()
+        roots = [entry.drive + os.sep for entry in entries if entry.isConnected()]
+        roots += [s.get("address", "") for s in get_config_store().get("custom_servers", [])]
+        return [r for r in roots if r]
+
+    def updateSearchIndex(self):
+        if self.indexWorker is not None and self.indexWorker.isRunning():
+            return
+        self.indexWorker = IndexWorker(self.searchRoots())
+        self.indexWorker.finished_signal.connect(self.searchIndexUpdated)
+        self.indexWorker.start()
+
+    def searchIndexUpdated(self, rescanned):
+        self.indexedOnce = True
+        if self.searchBox.text().strip():
+            self.runSearch()
+
+    def runSearch(self):
+        text = self.searchBox.text().strip()
+        self.searchResults.clear()
+        if not text:
+            self.searchResults.hide()
+            return
+        from ..core.search_index import get_file_index
+        for path, is_dir in get_file_index().search(text):
+            item = QListWidgetItem(("[Folder] " if is_dir else "") + path)
+            item.setData(Qt.UserRole, path)
+            item.setData(Qt.UserRole + 1, is_dir)
+            self.searchResults.addItem(item)
+        if self.searchResults.count() == 0:
+            self.searchResults.addItem("No matches" + ("" if self.indexedOnce else " yet, indexing is still running"))
+        self.searchResults.show()
+
+    def openSearchResult(self, item):
+        path = item.data(Qt.UserRole)
+        if not path:
+            return
+        self.setRoot(path if item.data(Qt.UserRole + 1) else os.path.dirname(path))
+
+    def selectedPaths(self):
+        return [self.model.filePath(index) for index in self.tree.selectionModel().selectedRows(0)]
+
+    def targetDirectory(self, index):
+        if not index.isValid():
+            return self.model.rootPath()
+        path = self.model.filePath(index)
+        return path if self.model.isDir(index) else os.path.dirname(path)
+
+    def showTreeMenu(self, pos):
+        index = self.tree.indexAt(pos)
+        paths = self.selectedPaths()
+        from ..core.transfer import FAILED, get_transfer_queue
+        queue = get_transfer_queue()
+        counts = queue.counts()
+        menu = QMenu(self)
+        isFile = index.isValid() and not self.model.isDir(index)
+        cacheEnabled = get_config_store().get("file_cache_enabled", False)
+        openAction = menu.addAction("Open")
+        openAction.setEnabled(isFile)
+        refreshOpenAction = None
+        if cacheEnabled:
+            refreshOpenAction = menu.addAction("Open latest from server")
+            refreshOpenAction.setEnabled(isFile)
+        menu.addSeparator()
+        copyAction = menu.addAction("Copy to local folder...")
+        copyAction.setEnabled(bool(paths))
+        uploadFilesAction = menu.addAction("Upload files here...")
+        uploadFolderAction = menu.addAction("Upload folder here...")
+        syncAction = menu.addAction("Sync to local folder...")
+        syncAction.setEnabled(self.model.isDir(index) and bool(self.targetDirectory(index)))
+        menu.addSeparator()
+        retryAction = menu.addAction(f"Retry failed transfers ({counts[FAILED]})")
+        retryAction.setEnabled(counts[FAILED] > 0)
+        cancelAction = menu.addAction("Cancel transfers")
+        cancelAction.setEnabled(queue.isBusy())
+        action = menu.exec_(self.tree.viewport().mapToGlobal(pos))
+        if action is None:
+            return
+        target = self.targetDirectory(index)
+        if action is openAction or action is refreshOpenAction:
+            self.openFile(self.model.filePath(index), refresh=action is refreshOpenAction)
+        elif action is copyAction:
+            dest = QFileDialog.getExistingDirectory(self, "Copy to", QDir.homePath())
+            if dest:
+                self.startTransfer(paths, dest)
+        elif action is uploadFilesAction:
+            files, _ = QFileDialog.getOpenFileNames(self, f"Upload files to {target}", QDir.homePath())
+            if files:
+                self.startTransfer(files, target)
+        elif action is uploadFolderAction:
+            folder = QFileDialog.getExistingDirectory(self, f"Upload folder to {target}", QDir.homePath())
+            if folder:
+                self.startTransfer([folder], target)
+        elif action is syncAction:
+            self.chooseSyncTarget(target)
+        elif action is retryAction:
+            queue.retryFailed()
+        elif action is cancelAction:
+            queue.cancel()
+
+    def openFile(self, path, refresh=False):
+        store = get_config_store()
+        if not store.get("file_cache_enabled", False):
+            self.launchFile(path)
+            return
+        # Validating and copying touch the share, so they run off the GUI
+        # thread; a dropped tunnel can make a single stat hang for a while.
+        worker = FileOpenWorker(path, store.get("file_cache_max_mb"), refresh)
+        worker.finished_signal.connect(self.fileReady)
+        worker.finished.connect(lambda: self.openWorkers.remove(worker))
+        self.openWorkers.append(worker)
+        worker.start()
+
+    def fileReady(self, source, local, staleSince, error):
+        window = self.window()
+        log = window.outputBox.append if hasattr(window, "outputBox") else (lambda *args: None)
+        if error and not local:
+            log(f"Could not open {source}: {error}", "ERROR")
+            return
+        if error:
+            log(f"{source} changed on the share, but {error}; opened the older copy.", "WARNING")
+            QMessageBox.warning(self, "Cached Copy In Use",
+                                f"A newer version of\n{source}\nis on the share, but the local copy is still open "
+                                "in another program and could not be replaced.\n\nClose it there and open the "
+                                "file again to get the current version.")
+        elif staleSince is not None:
+            stored = datetime.fromtimestamp(staleSince).strftime("%d.%m.%Y %H:%M")
+            log(f"{source} is not reachable; opened the cached copy from {stored} (read-only, may be out of date).",
+                "WARNING")
+            QMessageBox.warning(self, "Offline Copy",
+                                f"The share is not reachable.\n\nOpened the cached copy of\n{source}\n"
+                                f"from {stored}. It may be out of date and is read-only.")
+        self.launchFile(local)
+
+    def launchFile(self, path):
+        try:
+            if hasattr(os, "startfile"):
+                os.startfile(os.path.normpath(path))
+            else:
+                get_runner().popen(["xdg-open", path])
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not open:\n{path}\n\n{str(e)}")
+
+    def chooseSyncTarget(self, source):
+        # The last local folder used for a source is remembered, so a repeat
+        # sync only needs a confirmation.
+        store = get_config_store()
+        targets = store.get("sync_targets", {})
+        dest = QFileDialog.getExistingDirectory(self, f"Sync {source} to",
+                                                targets.get(source) or QDir.homePath())
+        if not dest:
+            return
+        targets[source] = dest
+        store.set("sync_targets", targets)
+        self.syncRequested.emit(source, dest)
+
+    def startTransfer(self, sources, dest):
+        window = self.window()
+        if hasattr(window, "outputBox"):
+            window.outputBox.append(f"Queued copy of {len(sources)} item(s) to {dest}.")
+        from ..core.transfer import get_transfer_queue
+        get_transfer_queue().submit(sources, dest)
+
+    def showCustomServersDialog(self):
+        from .dialogs import CustomServerDialog
+        dialog = CustomServerDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            self.refreshDriveList()
+            QMessageBox.information(self, "Custom Server", "Custom server added. Please select it from the drop down.")
@@ -0,0 +1,92 @@
+import os
+from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt
+from ..core.profiles import UNKNOWN_FLAG, ProfileRegistry
+from ..core.app_paths import asset_path, cache_dir
+
+# ------------------------------
+# Cache of decoded and scaled header images
+# ------------------------------
+LOGO_IMAGE = "Broetje Logo.png"
+LOGO_SIZE = 500
+FLAG_SIZE = 400
+
+class ImageCache:
+    def __init__(self):
+        self._pixmaps = {}
+
+    def pixmap(self, name, size):
+        key = (name, size)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+        source = asset_path(name)
+        cachedFile = self.diskCachePath(source, size)
+        pixmap = QPixmap()
+        # The pre-scaled copy skips both the JPEG decode at full size and the
+        # smooth scaling pass; it is keyed by the source's mtime and size.
+        if cachedFile is None or not pixmap.load(cachedFile):
+            pixmap = QPixmap(source)
+            if not pixmap.isNull():
+                pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                if cachedFile is not None:
+                    pixmap.save(cachedFile, "PNG")
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def diskCachePath(self, source, size):
+        try:
+            st = os.stat(source)
+            directory = cache_dir("images")
+        except OSError:
+            return None
+        base = os.path.splitext(os.path.basename(source))[0].replace(" ", "_")
+        return os.path.join(directory, f"{base}_{size}_{st.st_mtime_ns}_{st.st_size}.png")
+
+    def prerender(self, names, size):
+        for name in names:
+            self.pixmap(name, size)
+
+_image_cache = None
+
+def get_image_cache():
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
+
+# ------------------------------
+# Header Widget
+# ------------------------------
+class HeaderWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("header")
+        self.registry = ProfileRegistry()
+        self.initUI()
+
+    def setProfiles(self, registry):
+        self.registry = registry
+
+    def prerenderImages(self):
+        # Warms the remaining flags so the first tab switch decodes nothing.
+        get_image_cache().prerender([p.flag for p in self.registry.profiles()] + [UNKNOWN_FLAG], FLAG_SIZE)
+    
+    def initUI(self):
+        layout = QHBoxLayout()
+        self.companyLogoLabel = QLabel()
+        self.companyLogoLabel.setPixmap(get_image_cache().pixmap(LOGO_IMAGE, LOGO_SIZE))
+        self.companyLogoLabel.setContentsMargins(80, 20, 20, 20)
+        layout.addWidget(self.companyLogoLabel, alignment=Qt.AlignLeft)
+        layout.addStretch()
+        self.statusLabel = QLabel()
+        self.loadStatusImage(self.registry.defaultKey())
+        self.statusLabel.setContentsMargins(20, 20, 150, 20)
+        layout.addWidget(self.statusLabel, alignment=Qt.AlignRight)
+        self.setLayout(layout)
+        
+    def loadStatusImage(self, status):
+        profile = self.registry.resolve(status) if status else None
+        name = profile.flag if profile is not None else UNKNOWN_FLAG
+        self.statusLabel.setPixmap(get_image_cache().pixmap(name, FLAG_SIZE))
@@ -0,0 +1,97 @@
+import math
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QColor, QPainter, QPen
+from PyQt5.QtCore import Qt, QPointF
+
+# ------------------------------
+# VPN health indicator with an RTT sparkline
+# ------------------------------
+class HealthIndicator(QWidget):
+    UNKNOWN_COLOR = "#888888"
+    SPARKLINE_SAMPLES = 60
+
+    def __init__(self, monitor=None, parent=None):
+        super().__init__(parent)
+        self.monitor = None
+        self.statusColors = {}
+        self.target = None
+        self.setMinimumSize(420, 28)
+        if monitor is not None:
+            self.setMonitor(monitor)
+
+    def setMonitor(self, monitor):
+        # The health module is only imported once there is a monitor to show.
+        from ..core.health import DEGRADED, DOWN, UP
+        self.monitor = monitor
+        self.statusColors = {UP: "#00C000", DEGRADED: "#FFA500", DOWN: "#FF0000"}
+        self.refresh()
+
+    def setTarget(self, target):
+        self.target = target
+        self.refresh()
+
+    def refresh(self):
+        if self.monitor is None:
+            self.setToolTip("No health data yet")
+            self.update()
+            return
+        lines = []
+        for target in self.monitor.targets():
+            latest = self.monitor.ring(target).latest()
+            if latest is None:
+                continue
+            _, reachable, rtt, kbps = latest
+            text = f"{target}: {self.monitor.status(target)}"
+            if reachable and not math.isnan(rtt):
+                text += f", {rtt:.0f} ms"
+            if reachable and not math.isnan(kbps):
+                text += f", {kbps:.0f} KB/s"
+            lines.append(text)
+        self.setToolTip("\n".join(lines) or "No health data yet")
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        monitor = self.monitor if self.target else None
+        color = self.UNKNOWN_COLOR
+        if monitor is not None:
+            color = self.statusColors.get(monitor.status(self.target), color)
+        height = self.height()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(4, height // 2 - 6, 12, 12)
+        ring = monitor.rings.get(self.target) if monitor is not None else None
+        latest = ring.latest() if ring is not None else None
+        label = self.target or "VPN"
+        if latest is not None and latest[1] and not math.isnan(latest[2]):
+            label += f"  {latest[2]:.0f} ms"
+        elif latest is not None and not latest[1]:
+            label += "  unreachable"
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        textWidth = self.width() // 2
+        painter.drawText(22, 0, textWidth, height, Qt.AlignVCenter | Qt.AlignLeft, label)
+        if ring is None:
+            return
+        values = ring.series("rtt")[-self.SPARKLINE_SAMPLES:]
+        finite = [v for v in values if not math.isnan(v)]
+        if not finite:
+            return
+        left, width = 22 + textWidth, self.width() - textWidth - 26
+        top, bottom = 4, height - 4
+        peak = max(max(finite), 1.0)
+        step = width / max(1, self.SPARKLINE_SAMPLES - 1)
+        painter.setPen(QPen(QColor(color), 1.5))
+        segment = []
+        for i, value in enumerate(values):
+            x = left + step * (self.SPARKLINE_SAMPLES - len(values) + i)
+            if math.isnan(value):
+                # Unreachable samples break the line and leave a tick.
+                if len(segment) > 1:
+                    painter.drawPolyline(*segment)
+                segment = []
+                painter.drawLine(QPointF(x, bottom), QPointF(x, bottom - 3))
+                continue
+            segment.append(QPointF(x, bottom - (bottom - top) * value / peak))
+        if len(segment) > 1:
+            painter.drawPolyline(*segment)
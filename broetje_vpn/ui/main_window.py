@@ -0,0 +1,574 @@
+import os
+import shutil
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QSplitter, QCheckBox,
+    QProgressBar, QMessageBox
+)
+from PyQt5.QtCore import Qt, QDir, pyqtSignal, QTimer, QThread
+from ..core.startup import get_startup_timer
+from ..core.profiles import get_profile_registry
+from ..core.mapping import (
+    KEEP, build_mapping_jobs, map_drives, plan_reconciliation, reconcile_drives
+)
+from ..core.vpn_client import is_vpn_client_running, launch_vpn_client, terminate_vpn_client
+from ..core.drive_inventory import get_drive_inventory, scan_net_use
+from ..core.config_store import get_config_store
+from ..core.runner import get_runner
+from .console import DEFAULT_CONSOLE_LINES, LogConsole
+from .credentials import CredentialsWidget
+from .folder_browser import format_size, SyncWorker, FolderBrowserWidget
+from .header import HeaderWidget
+from .health_indicator import HealthIndicator
+
+# ------------------------------
+# Worker thread for mapping drives (verbose output, one result per drive)
+# ------------------------------
+class MappingWorker(QThread):
+    drive_released_signal = pyqtSignal(str)
+    drive_result_signal = pyqtSignal(str, bool, str)
+    plan_signal = pyqtSignal(str)
+    # (profile, message, ok, results, jobs)
+    finished_signal = pyqtSignal(str, str, bool, object, object)
+    def __init__(self, profile, jobs, disconnect_first=False, reconcile=False):
+        super().__init__()
+        self.profile = profile
+        self.jobs = jobs
+        self.disconnect_first = disconnect_first
+        self.reconcile = reconcile
+        self.results = []
+    def run(self):
+        plan = None
+        if self.reconcile:
+            # One "net use" call decides which drives actually need work.
+            try:
+                plan = plan_reconciliation(self.jobs, scan_net_use())
+            except Exception as e:
+                self.plan_signal.emit(f"Could not read current mappings ({str(e)}); remapping all drives.")
+        if plan is not None:
+            changed = [f"{job.drive} ({action})" for job, action in plan if action != KEEP]
+            self.plan_signal.emit("Drives to update: " + (", ".join(changed) if changed else "none"))
+            results = reconcile_drives(plan, on_result=self.reportResult,
+                                       on_released=self.drive_released_signal.emit)
+        else:
+            results = map_drives(self.jobs, on_result=self.reportResult,
+                                 disconnect_first=self.disconnect_first or self.reconcile,
+                                 on_released=self.drive_released_signal.emit)
+        self.results = results
+        failed = [r.drive for r in results if not r.ok]
+        if failed:
+            msg = "Mapping finished with errors on: " + ", ".join(failed)
+        else:
+            msg = "Mapping finished successfully."
+        self.finished_signal.emit(self.profile, msg, not failed, results, self.jobs)
+    def reportResult(self, result):
+        self.drive_result_signal.emit(result.drive, result.ok, result.text())
+
+# ------------------------------
+# Worker thread that parses the config store off the GUI thread
+# ------------------------------
+class ConfigLoadWorker(QThread):
+    finished_signal = pyqtSignal()
+    vault_error_signal = pyqtSignal(str)
+    vault_key_lost_signal = pyqtSignal(str)
+    vault_migrated_signal = pyqtSignal(int)
+    def run(self):
+        store = get_config_store()
+        store.data()
+        # Unlocking reads and decrypts the vault file, so the one unlock per
+        # session happens off the GUI thread as well.
+        from ..core.credential_vault import VaultError, VaultKeyLostError, get_vault, migrate_plaintext_passwords
+        vault = get_vault()
+        try:
+            migrated = migrate_plaintext_passwords(
+                store, vault, [p.credentialKey for p in get_profile_registry().profiles()])
+            vault.unlock()
+            if migrated:
+                self.vault_migrated_signal.emit(len(migrated))
+        except VaultKeyLostError as e:
+            self.vault_key_lost_signal.emit(str(e))
+        except (VaultError, OSError) as e:
+            self.vault_error_signal.emit(str(e))
+        self.finished_signal.emit()
+
+# ------------------------------
+# Main Window with File Browser, Network Folder Connect, RDP Launch, VPN Controls, and Custom Servers
+# ------------------------------
+class MainWindow(QMainWindow):
+    healthUpdated = pyqtSignal(str)
+    transferUpdated = pyqtSignal(object)
+    transferError = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        # The health monitor, the reconnect watchdog and the transfer queue
+        # are imported and created in startDeferredInit, after the first paint.
+        self.healthMonitor = None
+        self.reconnectWatchdog = None
+        self.transferQueue = None
+        self.transferDirs = set()
+        self.syncWorker = None
+        self.darkMode = True
+        self.setWindowTitle("VPN Manager - Dark Mode")
+        # One mapping worker per profile, so profiles can connect side by side.
+        self.mappingWorkers = {}
+        self.firstPaintDone = False
+        self.pendingStartupTasks = set()
+        self.initUI()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.firstPaintDone:
+            self.firstPaintDone = True
+            get_startup_timer().mark("first paint")
+            QTimer.singleShot(0, self.startDeferredInit)
+
+    def startDeferredInit(self):
+        timer = get_startup_timer()
+        self.pendingStartupTasks = {"credentials", "drive list"}
+        self.configLoader = ConfigLoadWorker()
+        self.configLoader.finished_signal.connect(self.configLoaded)
+        self.configLoader.vault_error_signal.connect(self.vaultError)
+        self.configLoader.vault_key_lost_signal.connect(self.vaultKeyLost)
+        self.configLoader.vault_migrated_signal.connect(self.vaultMigrated)
+        self.configLoader.start()
+        self.folderBrowser.drivesUpdated.connect(self.initialDrivesLoaded)
+        self.folderBrowser.startBackgroundTasks()
+        self.header.prerenderImages()
+        self.startTransferQueue()
+        self.startReconnectWatchdog()
+        self.startHealthMonitor()
+        timer.mark("background tasks started")
+
+    def startTransferQueue(self):
+        from ..core.transfer import get_transfer_queue
+        self.transferQueue = get_transfer_queue()
+        self.transferQueue.addListener(self.transferUpdated.emit)
+        self.transferQueue.addErrorListener(self.transferError.emit)
+
+    def startReconnectWatchdog(self):
+        from ..core.reconnect_watchdog import ReconnectWatchdog
+        self.reconnectWatchdog = ReconnectWatchdog(get_drive_inventory())
+        # LogConsole.append is thread-safe, so watchdog messages go straight in.
+        self.reconnectWatchdog.addListener(self.outputBox.append)
+        if get_config_store().get("auto_reconnect", True):
+            self.reconnectWatchdog.start()
+
+    def startHealthMonitor(self):
+        from ..core.health import HealthMonitor
+        monitor = HealthMonitor()
+        interval = get_config_store().get("health_interval", monitor.interval)
+        if not interval:
+            return
+        monitor.interval = interval
+        monitor.addListener(lambda target, ring: self.healthUpdated.emit(target))
+        self.healthMonitor = monitor
+        self.healthIndicator.setMonitor(monitor)
+        self.updateHealthServers()
+        self.selectHealthTarget(self.credentialsWidget.currentProfileKey())
+        monitor.start()
+
+    def updateHealthServers(self):
+        if self.healthMonitor is None:
+            return
+        widget = self.credentialsWidget
+        self.healthMonitor.setTargets(servers=[widget.profileValues(key)[0].strip() for key in widget.profileTabs])
+
+    def updateHealthShares(self, entries, error):
+        if self.healthMonitor is None:
+            return
+        self.healthMonitor.setTargets(shares=[entry.drive + os.sep for entry in entries if entry.isConnected()])
+
+    def selectHealthTarget(self, status):
+        self.updateHealthServers()
+        if status in self.credentialsWidget.profileTabs:
+            self.healthIndicator.setTarget(self.credentialsWidget.profileValues(status)[0].strip())
+
+    def configLoaded(self):
+        store = get_config_store()
+        self.outputBox.setMaxLines(store.get("console_max_lines", DEFAULT_CONSOLE_LINES))
+        self.outputBox.setLogFile(store.get("console_log_file"))
+        # Sites added through the "profiles" config key show up from here on.
+        registry = get_profile_registry()
+        self.header.setProfiles(registry)
+        self.credentialsWidget.setProfiles(registry)
+        self.credentialsWidget.loadSavedCredentials()
+        self.startupTaskDone("credentials")
+
+    def vaultError(self, error):
+        self.outputBox.append(f"Credential vault unavailable, saved passwords cannot be used: {error}", "ERROR")
+
+    def vaultMigrated(self, count):
+        self.outputBox.append(f"{count} saved password(s) were moved from the config file into the encrypted vault.")
+
+    def vaultKeyLost(self, error):
+        self.outputBox.append(f"Credential vault unavailable: {error}", "ERROR")
+        answer = QMessageBox.question(
+            self, "Reset Credential Vault",
+            "The saved passwords cannot be decrypted because the vault key is missing or damaged.\n\n"
+            "Reset the vault? All saved passwords are deleted and have to be entered again.",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if answer != QMessageBox.Yes:
+            return
+        from ..core.credential_vault import VaultError, get_vault
+        vault = get_vault()
+        try:
+            vault.reset()
+            vault.unlock()
+        except (VaultError, OSError) as e:
+            self.outputBox.append(f"Resetting the credential vault failed: {str(e)}", "ERROR")
+            return
+        self.outputBox.append("Credential vault reset. Enter and save the passwords again.", "WARNING")
+        self.credentialsWidget.loadSavedCredentials()
+
+    def initialDrivesLoaded(self, *args):
+        self.folderBrowser.drivesUpdated.disconnect(self.initialDrivesLoaded)
+        self.startupTaskDone("drive list")
+
+    def startupTaskDone(self, task):
+        timer = get_startup_timer()
+        timer.mark(task + " loaded")
+        self.pendingStartupTasks.discard(task)
+        if not self.pendingStartupTasks and not timer.reported:
+            timer.report()
+            if timer.enabled:
+                for line in timer.lines():
+                    self.outputBox.append(line, "DEBUG")
+        
+    def initUI(self):
+        centralWidget = QWidget()
+        mainLayout = QVBoxLayout()
+        self.header = HeaderWidget()
+        mainLayout.addWidget(self.header)
+        toggleLayout = QHBoxLayout()
+        toggleLayout.addStretch()
+        self.forceRemapToggle = QCheckBox("Force full remap")
+        toggleLayout.addWidget(self.forceRemapToggle)
+        self.modeToggle = QCheckBox("Dark Mode")
+        self.modeToggle.setChecked(True)
+        self.modeToggle.stateChanged.connect(self.toggleMode)
+        toggleLayout.addWidget(self.modeToggle)
+        mainLayout.addLayout(toggleLayout)
+        splitter = QSplitter(Qt.Horizontal)
+        self.folderBrowser = FolderBrowserWidget()
+        self.credentialsWidget = CredentialsWidget()
+        splitter.addWidget(self.folderBrowser)
+        splitter.addWidget(self.credentialsWidget)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        mainLayout.addWidget(splitter)
+        vpnButtonsLayout = QHBoxLayout()
+        self.openWatchGuardButton = QPushButton("Open WatchGuard VPN")
+        self.disconnectButton = QPushButton("Disconnect VPN")
+        vpnButtonsLayout.addWidget(self.openWatchGuardButton)
+        vpnButtonsLayout.addWidget(self.disconnectButton)
+        self.healthIndicator = HealthIndicator()
+        vpnButtonsLayout.addWidget(self.healthIndicator)
+        vpnButtonsLayout.setStretch(0, 1)
+        vpnButtonsLayout.setStretch(1, 1)
+        mainLayout.addLayout(vpnButtonsLayout)
+        transferLayout = QHBoxLayout()
+        self.progressBar = QProgressBar()
+        self.progressBar.setRange(0, 100)
+        self.progressBar.hide()
+        transferLayout.addWidget(self.progressBar, 1)
+        self.transferLabel = QLabel()
+        self.transferLabel.hide()
+        transferLayout.addWidget(self.transferLabel)
+        self.cancelTransfersButton = QPushButton("Cancel Transfers")
+        self.cancelTransfersButton.hide()
+        self.cancelTransfersButton.clicked.connect(self.cancelTransfers)
+        transferLayout.addWidget(self.cancelTransfersButton)
+        mainLayout.addLayout(transferLayout)
+        self.outputBox = LogConsole()
+        mainLayout.addWidget(self.outputBox)
+        centralWidget.setLayout(mainLayout)
+        self.setCentralWidget(centralWidget)
+        self.credentialsWidget.serverSelectionChanged.connect(self.header.loadStatusImage)
+        self.credentialsWidget.serverSelectionChanged.connect(self.selectHealthTarget)
+        self.healthUpdated.connect(lambda target: self.healthIndicator.refresh())
+        self.transferUpdated.connect(self.transferProgress)
+        self.transferError.connect(lambda msg: self.outputBox.append(msg, "ERROR"))
+        self.folderBrowser.syncRequested.connect(self.startSync)
+        self.folderBrowser.drivesUpdated.connect(self.updateHealthShares)
+        self.credentialsWidget.connectServersRequested.connect(self.connectNetworkFolders)
+        self.credentialsWidget.rdpLaunchRequested.connect(self.launchRDP)
+        self.openWatchGuardButton.clicked.connect(self.openWatchGuard)
+        self.disconnectButton.clicked.connect(self.disconnectVPN)
+        self.applyStyles()
+        
+    def openWatchGuard(self):
+        try:
+            if is_vpn_client_running():
+                QMessageBox.information(self, "Process Running", "WatchGuard is already running.")
+                return
+        except Exception as e:
+            self.outputBox.append(f"Error checking process: {str(e)}", "ERROR")
+        self.outputBox.append("Launching WatchGuard application...")
+        try:
+            launch_vpn_client()
+            self.outputBox.append("WatchGuard application launched successfully.")
+        except Exception as e:
+            self.outputBox.append(f"Error launching WatchGuard: {str(e)}", "ERROR")
+    
+    def disconnectVPN(self):
+        self.outputBox.append("Attempting to disconnect VPN and terminate WatchGuard...")
+        try:
+            self.reconnectWatchdog.disarm()
+            terminate_vpn_client()
+            self.outputBox.append("WatchGuard application terminated.")
+            self.folderBrowser.setRoot(QDir.homePath())
+            self.folderBrowser.invalidateDriveList()
+        except Exception as e:
+            self.outputBox.append(f"Error disconnecting: {str(e)}", "ERROR")
+    
+    def connectNetworkFolders(self, status):
+        if status not in self.credentialsWidget.profileTabs:
+            self.outputBox.append("Unknown network folder selection for connection.", "ERROR")
+            return
+        worker = self.mappingWorkers.get(status)
+        if worker is not None and worker.isRunning():
+            self.outputBox.append("The network folders of this profile are still being connected.", "WARNING")
+            return
+        data = get_config_store().data()
+        self.credentialsWidget.setConnectEnabled(status, False)
+        server, username, password = self.credentialsWidget.profileValues(status)
+        mappingJobs = build_mapping_jobs(status, data, username, password)
+
+        # Each drive is released and remapped on the worker's pool as soon as
+        # its own "net use /delete" returns; nothing runs on the GUI thread.
+        # Unless a full remap is forced, drives that are already connected to
+        # the right share are left alone.
+        if self.forceRemapToggle.isChecked():
+            self.outputBox.append("Disconnecting and remapping network folders...")
+            worker = MappingWorker(status, mappingJobs, disconnect_first=True)
+        else:
+            self.outputBox.append("Checking current network folder mappings...")
+            worker = MappingWorker(status, mappingJobs, reconcile=True)
+        worker.plan_signal.connect(self.outputBox.append)
+        worker.drive_released_signal.connect(self.driveReleased)
+        worker.drive_result_signal.connect(self.driveMapped)
+        worker.finished_signal.connect(self.mappingFinished)
+        # The reference is dropped only once the thread has really ended.
+        worker.finished.connect(lambda: self.mappingWorkerDone(status, worker))
+        self.mappingWorkers[status] = worker
+        worker.start()
+
+    def driveReleased(self, drive):
+        self.outputBox.append(f"Drive {drive} released. Reconnecting...")
+
+    def driveMapped(self, drive, ok, msg):
+        self.outputBox.append(msg, "INFO" if ok else "ERROR")
+
+    def mappingFinished(self, status, msg, ok, results, jobs):
+        self.outputBox.append(msg, "INFO" if ok else "ERROR")
+        # From now on the watchdog keeps the drives that mapped connected.
+        mapped = {result.drive for result in results if result.ok}
+        self.reconnectWatchdog.arm(status, [job for job in jobs if job.drive in mapped])
+        self.folderBrowser.invalidateDriveList()
+        self.credentialsWidget.setConnectEnabled(status, True)
+
+    def mappingWorkerDone(self, status, worker):
+        if self.mappingWorkers.get(status) is worker:
+            del self.mappingWorkers[status]
+    
+    def transferProgress(self, job):
+        from ..core.transfer import CANCELLED, DONE, FAILED, QUEUED, RETRYING, RUNNING, SKIPPED
+        if job.state == RUNNING:
+            self.progressBar.setValue(job.percent())
+            self.progressBar.setFormat(f"{job.name()}  %p%")
+        elif job.state == RETRYING:
+            self.outputBox.append(f"Copy of {job.source} interrupted ({job.error}); resuming...", "WARNING")
+        elif job.state == DONE:
+            resumed = f" (resumed at {format_size(job.resumedFrom)})" if job.resumedFrom else ""
+            self.outputBox.append(f"Copied {job.source} to {job.dest}{resumed}", "DEBUG")
+            self.transferDirs.add(os.path.dirname(job.dest))
+        elif job.state == FAILED:
+            self.outputBox.append(f"Copy of {job.source} failed: {job.error}. The partial file is kept; "
+                                  "use \"Retry failed transfers\" to resume it.", "ERROR")
+        elif job.state == CANCELLED:
+            self.outputBox.append(f"Copy of {job.source} cancelled.", "WARNING")
+        elif job.state == SKIPPED:
+            self.outputBox.append(f"Skipped {job.source}: {job.error} ({job.dest}).", "WARNING")
+        counts = self.transferQueue.counts()
+        busy = bool(counts[RUNNING] or counts[RETRYING] or counts[QUEUED])
+        if busy:
+            total = sum(counts.values())
+            self.transferLabel.setText(f"{format_size(int(self.transferQueue.throughput()))}/s  "
+                                       f"{counts[DONE]}/{total} files")
+        elif self.progressBar.isVisible():
+            self.outputBox.append(f"Transfers finished: {counts[DONE]} copied, {counts[FAILED]} failed, "
+                                  f"{counts[CANCELLED]} cancelled, {counts[SKIPPED]} skipped.",
+                                  "ERROR" if counts[FAILED] else "INFO")
+            self.transferQueue.clearFinished()
+            # Re-list the folders that received files once, not per file.
+            for path in self.transferDirs:
+                self.folderBrowser.model.refreshPath(path)
+            self.transferDirs.clear()
+        self.progressBar.setVisible(busy or self.syncRunning())
+        self.transferLabel.setVisible(busy)
+        self.cancelTransfersButton.setVisible(busy or self.syncRunning())
+
+    def cancelTransfers(self):
+        self.transferQueue.cancel()
+        if self.syncRunning():
+            self.syncWorker.requestInterruption()
+
+    def syncRunning(self):
+        return self.syncWorker is not None and self.syncWorker.isRunning()
+
+    def startSync(self, source, dest):
+        if self.syncRunning():
+            QMessageBox.information(self, "Sync Running", "A folder sync is already running.")
+            return
+        self.outputBox.append(f"Syncing {source} to {dest}...")
+        self.syncWorker = SyncWorker(source, dest, delete=get_config_store().get("sync_delete", False))
+        self.syncWorker.progress_signal.connect(self.syncProgress)
+        self.syncWorker.finished_signal.connect(self.syncFinished)
+        self.progressBar.setValue(0)
+        self.progressBar.setFormat("Sync %p%")
+        self.progressBar.show()
+        self.cancelTransfersButton.show()
+        self.syncWorker.start()
+
+    def syncProgress(self, done, total, rel):
+        self.progressBar.setValue(int(done * 100 / total) if total else 100)
+        self.progressBar.setFormat(f"Sync {done}/{total}  %p%")
+
+    def syncFinished(self, result):
+        if isinstance(result, Exception):
+            self.outputBox.append(f"Sync failed: {str(result)}", "ERROR")
+        else:
+            for error in result.errors:
+                self.outputBox.append(f"Sync: {error}", "ERROR")
+            state = "stopped" if result.stopped else "finished"
+            self.outputBox.append(f"Sync {state}: {result.summary()}", "INFO" if result.ok() else "WARNING")
+        busy = self.transferQueue.isBusy()
+        self.progressBar.setVisible(busy)
+        self.cancelTransfersButton.setVisible(busy)
+
+    def launchRDP(self, status):
+        tab = self.credentialsWidget.profileTabs.get(status)
+        url = tab.profile.rdpUrl if tab is not None else ""
+        if not url:
+            self.outputBox.append("Unknown network folder selection for RDP launch.", "ERROR")
+            return
+        chrome_path = shutil.which("chrome.exe")
+        if not chrome_path:
+            possible_paths = [
+                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"
+            ]
+            for path in possible_paths:
+                if os.path.exists(path):
+                    chrome_path = path
+                    break
+        if chrome_path:
+            self.outputBox.append(f"Launching Chrome to {url}...")
+            try:
+                get_runner().popen([chrome_path, url])
+                self.outputBox.append("Chrome launched successfully.")
+            except Exception as e:
+                self.outputBox.append(f"Error launching Chrome: {str(e)}", "ERROR")
+        else:
+            QMessageBox.warning(self, "Chrome Not Found", "Google Chrome is not installed. Please install Chrome.")
+    
+    def toggleMode(self, state):
+        self.darkMode = state == Qt.Checked
+        if self.darkMode:
+            self.setWindowTitle("VPN Manager - Dark Mode")
+        else:
+            self.setWindowTitle("VPN Manager - Light Mode")
+        self.applyStyles()
+        
+    def applyStyles(self):
+        if self.darkMode:
+            style = """
+                QMainWindow { background-color: #000000; }
+                QWidget { font-family: Arial; font-size: 12pt; color: #FFFFFF; }
+                QPushButton {
+                    background-color: #FF0000; color: #FFFFFF;
+                    border: none; padding: 6px 12px; border-radius: 4px;
+                }
+                QPushButton:hover { background-color: #CC0000; }
+                QLineEdit {
+                    border: 1px solid #FFFFFF; padding: 4px;
+                    color: #FFFFFF; background-color: #333333;
+                }
+                QTabWidget::pane { border: 1px solid #FFFFFF; }
+                QTabBar::tab {
+                    background: #000000; border: 1px solid #FFFFFF;
+                    padding: 8px; color: #FFFFFF;
+                }
+                QTabBar::tab:selected {
+                    background: #FF0000; color: #FFFFFF;
+                }
+                QTreeView {
+                    background-color: #555555; color: #FF0000;
+                }
+                QHeaderView::section {
+                    background-color: #555555; color: #FF0000;
+                }
+                QPlainTextEdit#outputBox {
+                    background-color: #333333; color: #FF0000;
+                    border: 1px solid #FFFFFF;
+                }
+                QComboBox {
+                    background-color: #333333;
+                    color: #FF0000;
+                    border: 1px solid #FFFFFF;
+                    padding: 2px;
+                }
+                QComboBox QAbstractItemView {
+                    background-color: #333333;
+                    color: #FF0000;
+                    selection-background-color: #FF0000;
+                    selection-color: #FFFFFF;
+                }
+                #header { background-color: #444444; }
+            """
+        else:
+            style = """
+                QMainWindow { background-color: #FFFFFF; }
+                QWidget { font-family: Arial; font-size: 12pt; color: #000000; }
+                QPushButton {
+                    background-color: #FF0000; color: #FFFFFF;
+                    border: none; padding: 6px 12px; border-radius: 4px;
+                }
+                QPushButton:hover { background-color: #CC0000; }
+                QLineEdit {
+                    border: 1px solid #000000; padding: 4px;
+                    color: #000000; background-color: #FFFFFF;
+                }
+                QTabWidget::pane { border: 1px solid #000000; }
+                QTabBar::tab {
+                    background: #FFFFFF; border: 1px solid #000000;
+                    padding: 8px; color: #000000;
+                }
+                QTabBar::tab:selected {
+                    background: #FF0000; color: #FFFFFF;
+                }
+                QTreeView {
+                    background-color: #EEEEEE; color: #000000;
+                }
+                QHeaderView::section {
+                    background-color: #EEEEEE; color: #000000;
+                }
+                QPlainTextEdit#outputBox {
+                    background-color: #FFFFFF; color: #000000;
+                    border: 1px solid #000000;
+                }
+                QComboBox {
+                    background-color: #FFFFFF;
+                    color: #000000;
+                    border: 1px solid #000000;
+                    padding: 2px;
+                }
+                QComboBox QAbstractItemView {
+                    background-color: #FFFFFF;
+                    color: #000000;
+                    selection-background-color: #FF0000;
+                    selection-color: #FFFFFF;
+                }
+                #header { background-color: #F0F0F0; }
+            """
+        self.setStyleSheet(style)
@@ -0,0 +1,8 @@
+import sys
+
+# Kept so "python cli.py ..." works from a checkout; the CLI lives in the
+# broetje_vpn package.
+from broetje_vpn.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def app_dirs(tmp_path, monkeypatch):
+    # Caches, the config and the vault of a test never touch the real
+    # per-user folders.
+    monkeypatch.setenv("BROETJE_VPN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("BROETJE_VPN_DATA_DIR", str(tmp_path / "data"))
+    return tmp_path
@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from broetje_vpn.core.change_watcher import ChangeWatcher, PollingBackend
+
+
+class Changes:
+    def __init__(self):
+        self.paths = []
+        self.event = threading.Event()
+
+    def __call__(self, path):
+        self.paths.append(path)
+        self.event.set()
+
+    def wait(self, timeout=5.0):
+        ok = self.event.wait(timeout)
+        self.event.clear()
+        return ok
+
+    def waitFor(self, path, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while path not in self.paths and time.monotonic() < deadline:
+            self.wait(0.05)
+        return path in self.paths
+
+
+def started(watcher, path):
+    changes = Changes()
+    watcher.addListener(changes)
+    watcher.watch(path)
+    watcher.start()
+    time.sleep(0.3)
+    return changes
+
+
+def test_polling_backend_backs_off_and_sees_changes(tmp_path):
+    now = [0.0]
+    backend = PollingBackend(min_interval=1.0, max_interval=4.0, clock=lambda: now[0])
+    backend.add(str(tmp_path))
+    assert backend.check() == []
+    for step in (1.0, 2.0, 4.0):
+        now[0] += step
+        assert backend.check() == []
+    assert backend.dirs[str(tmp_path)][1] == 4.0
+    (tmp_path / "new.txt").write_text("x")
+    os.utime(tmp_path, (5000, 5000))
+    now[0] += 4.0
+    assert backend.check() == [str(tmp_path)]
+    assert backend.dirs[str(tmp_path)][1] == 1.0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify backend")
+def test_recreated_folder_is_watched_again(tmp_path):
+    folder = tmp_path / "project"
+    folder.mkdir()
+    watcher = ChangeWatcher(debounce=0.05, min_interval=0.1, max_interval=0.2)
+    try:
+        changes = started(watcher, str(folder))
+        (folder / "a.txt").write_text("a")
+        assert changes.waitFor(str(folder))
+        os.remove(folder / "a.txt")
+        folder.rmdir()
+        time.sleep(0.5)
+        folder.mkdir()
+        time.sleep(0.5)
+        changes.paths.clear()
+        (folder / "b.txt").write_text("b")
+        assert changes.waitFor(str(folder))
+    finally:
+        watcher.stop()
+
+
+def test_unwatched_folder_is_not_reported(tmp_path):
+    watcher = ChangeWatcher(debounce=0.05, min_interval=0.1, max_interval=0.2, use_native=False)
+    try:
+        changes = started(watcher, str(tmp_path))
+        watcher.unwatch(str(tmp_path))
+        time.sleep(0.3)
+        os.utime(tmp_path, (5000, 5000))
+        assert not changes.wait(0.6)
+    finally:
+        watcher.stop()
@@ -0,0 +1,16 @@
+from broetje_vpn.cli import main
+
+
+def test_sync_reports_os_errors_without_a_traceback(tmp_path, capsys):
+    (tmp_path / "src" / "sub").mkdir(parents=True)
+    (tmp_path / "src" / "sub" / "a.txt").write_text("a")
+    (tmp_path / "file").write_text("not a folder")
+    assert main(["sync", str(tmp_path / "src"), str(tmp_path / "file" / "dest")]) == 1
+    assert capsys.readouterr().err.startswith("Sync failed:")
+
+
+def test_sync_copies_a_tree(tmp_path, capsys):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.txt").write_text("a")
+    assert main(["sync", str(tmp_path / "src"), str(tmp_path / "dest")]) == 0
+    assert (tmp_path / "dest" / "a.txt").read_text() == "a"
@@ -0,0 +1,120 @@
+import base64
+import json
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from broetje_vpn.core.config_store import ConfigStore
+from broetje_vpn.core.credential_vault import (CredentialVault, FileKeystore, VaultKeyLostError,
+                                               migrate_plaintext_passwords)
+
+
+def make_vault(tmp_path):
+    return CredentialVault(str(tmp_path / "vault.json"), FileKeystore(str(tmp_path / "vault.key")))
+
+
+def test_round_trip_across_instances(tmp_path):
+    make_vault(tmp_path).set("us", "s3cret-pw")
+    vault = make_vault(tmp_path)
+    assert vault.get("us") == "s3cret-pw"
+    assert vault.names() == ["us"]
+    vault.delete("us")
+    assert make_vault(tmp_path).get("us") == ""
+
+
+def test_vault_file_holds_no_plaintext(tmp_path):
+    make_vault(tmp_path).set("us", "s3cret-pw")
+    raw = (tmp_path / "vault.json").read_text()
+    assert "s3cret-pw" not in raw
+    assert "s3cret-pw" not in base64.b64decode(json.loads(raw)["data"]).decode("latin-1")
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX only")
+def test_key_file_is_private(tmp_path):
+    make_vault(tmp_path).set("us", "pw")
+    assert os.stat(tmp_path / "vault.key").st_mode & 0o777 == 0o600
+
+
+def test_tampered_vault_is_rejected(tmp_path):
+    make_vault(tmp_path).set("us", "pw")
+    path = tmp_path / "vault.json"
+    blob = json.loads(path.read_text())
+    sealed = bytearray(base64.b64decode(blob["data"]))
+    sealed[-1] ^= 1
+    blob["data"] = base64.b64encode(bytes(sealed)).decode("ascii")
+    path.write_text(json.dumps(blob))
+    with pytest.raises(VaultKeyLostError):
+        make_vault(tmp_path).get("us")
+
+
+def test_lost_key_is_reported_and_reset_recovers(tmp_path):
+    make_vault(tmp_path).set("us", "pw")
+    os.remove(tmp_path / "vault.key")
+    vault = make_vault(tmp_path)
+    with pytest.raises(VaultKeyLostError):
+        vault.get("us")
+    vault.reset()
+    assert vault.get("us") == ""
+    vault.set("us", "new-pw")
+    assert make_vault(tmp_path).get("us") == "new-pw"
+
+
+def test_wrong_or_damaged_key_is_reported(tmp_path):
+    make_vault(tmp_path).set("us", "pw")
+    key_path = tmp_path / "vault.key"
+    key_path.write_bytes(os.urandom(32))
+    with pytest.raises(VaultKeyLostError):
+        make_vault(tmp_path).get("us")
+    key_path.write_bytes(b"short")
+    with pytest.raises(VaultKeyLostError):
+        make_vault(tmp_path).get("us")
+
+
+def test_old_vault_format_is_reported(tmp_path):
+    (tmp_path / "vault.json").write_text(json.dumps({"version": 1, "salt": "", "data": ""}))
+    with pytest.raises(VaultKeyLostError):
+        make_vault(tmp_path).get("us")
+
+
+def test_concurrent_key_creation_agrees_on_one_key(tmp_path):
+    keystores = [FileKeystore(str(tmp_path / "vault.key")) for _ in range(8)]
+    blobs = [None] * len(keystores)
+    barrier = threading.Barrier(len(keystores))
+
+    def seal(i):
+        barrier.wait()
+        blobs[i] = keystores[i].protect(b"payload")
+
+    threads = [threading.Thread(target=seal, args=(i,)) for i in range(len(keystores))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    reader = FileKeystore(str(tmp_path / "vault.key"))
+    assert all(reader.unprotect(blob) == b"payload" for blob in blobs)
+    assert os.listdir(tmp_path) == ["vault.key"]
+
+
+def test_migrate_plaintext_passwords(tmp_path):
+    config_path = tmp_path / "credentials_manager.json"
+    config_path.write_text(json.dumps({
+        "us_credentials": {"server": "vpn.example", "username": "jo", "password": "pw1"},
+        "german_credentials": {"server": "vpn.example.de", "username": "jo", "password": ""},
+        "other": {"password": "untouched"},
+    }))
+    store = ConfigStore(str(config_path), write_delay=0)
+    vault = make_vault(tmp_path)
+
+    moved = migrate_plaintext_passwords(store, vault, ["us_credentials", "german_credentials"])
+    store.flush()
+
+    assert moved == ["us_credentials"]
+    assert make_vault(tmp_path).get("us_credentials") == "pw1"
+    data = json.loads(config_path.read_text())
+    assert data["us_credentials"] == {"server": "vpn.example", "username": "jo"}
+    assert data["german_credentials"] == {"server": "vpn.example.de", "username": "jo"}
+    assert data["other"] == {"password": "untouched"}
+    assert migrate_plaintext_passwords(store, vault, ["us_credentials"]) == []
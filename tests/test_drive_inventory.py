@@ -0,0 +1,62 @@
+from broetje_vpn.core.drive_inventory import DriveEntry, parse_net_use, parse_wmic
+from broetje_vpn.core.runner import SimulatedRunner
+
+
+def row(status, drive, remote):
+    # Column layout of the real tool: the network name starts at column 49,
+    # or on a line of its own after a remote of 26 characters or more.
+    if len(remote) < 26:
+        return f"{status:<13}{drive:<10}{remote:<26}Microsoft Windows Network\r\n"
+    return f"{status:<13}{drive:<10}{remote}\r\n{'':<49}Microsoft Windows Network\r\n"
+
+
+NET_USE = (
+    "New connections will be remembered.\r\n"
+    "\r\n"
+    "Status       Local     Remote                    Network\r\n"
+    "\r\n"
+    "-------------------------------------------------------------------------------\r\n"
+    + row("OK", "N:", "\\\\banet.loc\\ba")
+    + row("Disconnected", "S:", "\\\\srv\\Shared Docs")
+    + row("Unavailable", "T:", "\\\\srv\\a long share name with spaces")
+    + row("", "U:", "\\\\srv\\nineteen characters")
+    + "The command completed successfully.\r\n"
+)
+
+
+def by_drive(entries):
+    return {entry.drive: (entry.remote, entry.status) for entry in entries}
+
+
+def test_parse_net_use_keeps_spaces_and_every_status():
+    assert by_drive(parse_net_use(NET_USE)) == {
+        "N:": ("\\\\banet.loc\\ba", "OK"),
+        "S:": ("\\\\srv\\Shared Docs", "Disconnected"),
+        "T:": ("\\\\srv\\a long share name with spaces", "Unavailable"),
+        "U:": ("\\\\srv\\nineteen characters", ""),
+    }
+
+
+def test_parse_net_use_without_aligned_columns():
+    output = "OK N: \\\\srv\\Shared Docs  Microsoft Windows Network\n"
+    assert by_drive(parse_net_use(output)) == {"N:": ("\\\\srv\\Shared Docs", "OK")}
+
+
+def test_parse_net_use_reads_the_simulated_output():
+    runner = SimulatedRunner(drives={"N:": "\\\\srv\\x", "P:": "\\\\srv\\Project Files 2024 archive"})
+    runner.setDriveStatus("P:", "Reconnecting")
+    assert by_drive(parse_net_use(runner.netUseOutput())) == {
+        "N:": ("\\\\srv\\x", "OK"),
+        "P:": ("\\\\srv\\Project Files 2024 archive", "Reconnecting"),
+    }
+
+
+def test_parse_wmic():
+    output = "DeviceID  ProviderName\r\nN:        \\\\banet.loc\\ba\r\n\r\n"
+    assert by_drive(parse_wmic(output)) == {"N:": ("\\\\banet.loc\\ba", "")}
+
+
+def test_only_ok_counts_as_connected():
+    assert DriveEntry("N:", "\\\\srv\\x", "OK").isConnected()
+    for status in ("", "Disconnected", "Unavailable", "Reconnecting"):
+        assert not DriveEntry("N:", "\\\\srv\\x", status).isConnected()
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from broetje_vpn.core import file_cache
+from broetje_vpn.core.file_cache import CachedCopyInUse, FileCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    root = tmp_path / "files"
+    root.mkdir()
+    return FileCache(str(root), max_bytes=10000)
+
+
+def write(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_open_copies_once_and_serves_the_copy(tmp_path, cache):
+    source = tmp_path / "share" / "plan.txt"
+    source.parent.mkdir()
+    write(source, "v1", 1000)
+    local, stale = cache.open(str(source))
+    assert stale is None and open(local).read() == "v1"
+    assert cache.open(str(source)) == (local, None)
+    write(source, "v2", 2000)
+    assert open(cache.open(str(source))[0]).read() == "v2"
+
+
+def test_unreachable_share_serves_the_older_copy(tmp_path, cache):
+    source = tmp_path / "share" / "plan.txt"
+    source.parent.mkdir()
+    write(source, "v1", 1000)
+    local, _ = cache.open(str(source))
+    os.rename(source.parent, tmp_path / "offline")
+    path, stale = cache.open(str(source))
+    assert path == local and stale is not None
+
+
+def test_locked_cached_copy_is_reported_and_kept(tmp_path, cache, monkeypatch):
+    source = tmp_path / "share" / "plan.txt"
+    source.parent.mkdir()
+    write(source, "v1", 1000)
+    local, _ = cache.open(str(source))
+    write(source, "v2", 2000)
+    real_replace = os.replace
+
+    def locked_replace(src, dst):
+        if dst == local:
+            raise PermissionError(13, "The process cannot access the file")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(file_cache.os, "replace", locked_replace)
+    with pytest.raises(CachedCopyInUse) as info:
+        cache.open(str(source))
+    assert info.value.local == local and open(local).read() == "v1"
+    assert sorted(os.listdir(os.path.dirname(local))) == ["plan.txt"]
+
+
+def test_evict_keeps_the_row_of_a_file_it_cannot_remove(tmp_path, cache, monkeypatch):
+    share = tmp_path / "share"
+    share.mkdir()
+    for i, name in enumerate(("a.bin", "b.bin", "c.bin")):
+        write(share / name, "x" * 2000, 1000 + i)
+        cache.open(str(share / name))
+    locked = cache.lookup(str(share / "a.bin"))[0]
+    real_remove = os.remove
+
+    def remove(path):
+        if path == locked:
+            raise PermissionError(13, "in use")
+        return real_remove(path)
+
+    monkeypatch.setattr(file_cache.os, "remove", remove)
+    cache.max_bytes = 2500
+    cache.evict()
+    assert cache.lookup(str(share / "a.bin")) is not None
+    assert cache.lookup(str(share / "b.bin")) is None
+    monkeypatch.setattr(file_cache.os, "remove", real_remove)
+    cache.evict()
+    assert cache.lookup(str(share / "a.bin")) is None and not os.path.exists(locked)
+    assert cache.totalBytes() == 2000
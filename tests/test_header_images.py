@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QColor, QImage
+from PyQt5.QtWidgets import QApplication
+
+from broetje_vpn.ui import header
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    folder = tmp_path / "assets"
+    folder.mkdir()
+    image = QImage(800, 400, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    image.save(str(folder / "flag one.jpg"), "JPG")
+    monkeypatch.setattr(header, "asset_path", lambda name: str(folder / name))
+    yield folder
+    del app
+
+
+def test_images_are_scaled_once_and_kept_on_disk(assets):
+    pixmap = header.ImageCache().pixmap("flag one.jpg", 200)
+    assert (pixmap.width(), pixmap.height()) == (200, 100)
+    cached = os.listdir(header.cache_dir("images"))
+    assert len(cached) == 1 and cached[0].startswith("flag_one_200_")
+
+    # A fresh cache (the next start) loads the pre-scaled copy instead of
+    # the source; marking that copy blue shows which one was read.
+    marked = QImage(200, 100, QImage.Format_RGB32)
+    marked.fill(QColor("blue"))
+    marked.save(os.path.join(header.cache_dir("images"), cached[0]), "PNG")
+    cache = header.ImageCache()
+    again = cache.pixmap("flag one.jpg", 200)
+    assert again.toImage().pixelColor(10, 10) == QColor("blue")
+    assert cache.pixmap("flag one.jpg", 200) is again
+
+
+def test_changed_source_gets_a_new_disk_copy(assets):
+    source = str(assets / "flag one.jpg")
+    cache = header.ImageCache()
+    before = cache.diskCachePath(source, 200)
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache.diskCachePath(source, 200) != before
+
+
+def test_missing_image_is_null_and_not_cached(assets):
+    assert header.ImageCache().pixmap("missing.png", 200).isNull()
+    assert os.listdir(header.cache_dir("images")) == []
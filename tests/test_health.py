@@ -0,0 +1,36 @@
+import math
+
+from broetje_vpn.core import health
+from broetje_vpn.core.health import TimeSeriesRing, probe_share
+
+
+def test_ring_keeps_the_latest_samples_in_order():
+    ring = TimeSeriesRing(capacity=3)
+    for i in range(5):
+        ring.append(float(i), True, rtt_ms=float(i))
+    assert ring.series("timestamps") == [2.0, 3.0, 4.0]
+    assert ring.latest()[0] == 4.0
+
+
+def test_probe_share_reads_a_different_slice_each_round(tmp_path, monkeypatch):
+    (tmp_path / "a.bin").write_bytes(b"a" * 4096)
+    (tmp_path / "b.bin").write_bytes(b"b" * 4096)
+    reads = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        f = real_open(path, *args, **kwargs)
+        seek = f.seek
+        f.seek = lambda offset: reads.append((path, offset)) or seek(offset)
+        return f
+
+    monkeypatch.setattr(health, "open", tracking_open, raising=False)
+    for round_no in range(4):
+        reachable, rtt_ms, kbps = probe_share(str(tmp_path), read_bytes=1024, round_no=round_no)
+        assert reachable and not math.isnan(rtt_ms)
+    assert len(set(reads)) == 4
+
+
+def test_probe_share_of_a_missing_path_is_down(tmp_path):
+    reachable, rtt_ms, kbps = probe_share(str(tmp_path / "missing"))
+    assert not reachable and math.isnan(rtt_ms)
@@ -0,0 +1,27 @@
+from broetje_vpn.core.import_report import import_report, measure_imports, parse_importtime
+
+
+def test_parse_importtime_skips_header_and_noise():
+    text = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   zipimport",
+        "import time:        80 |        300 | broetje_vpn",
+        "some other stderr line",
+    ])
+    assert parse_importtime(text) == [("zipimport", 120, 120, 1), ("broetje_vpn", 80, 300, 0)]
+
+
+def test_measure_imports_works_outside_the_checkout(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PYTHONPATH", raising=False)
+    names = [name for name, _, _, _ in measure_imports("broetje_vpn.core.config_store")]
+    assert "broetje_vpn.core.config_store" in names
+    assert import_report("broetje_vpn.core.config_store", top=3)[0].startswith("import broetje_vpn.core.config_store:")
+
+
+def test_ui_module_does_not_load_optional_features():
+    names = {name for name, _, _, _ in measure_imports("broetje_vpn.ui.main_window")}
+    assert "broetje_vpn.ui.main_window" in names
+    for lazy in ("health", "reconnect_watchdog", "transfer", "credential_vault", "prefetch", "search_index",
+                 "change_watcher", "file_cache", "delta_sync"):
+        assert f"broetje_vpn.core.{lazy}" not in names
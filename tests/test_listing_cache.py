@@ -0,0 +1,64 @@
+import os
+
+from broetje_vpn.core import listing_cache
+from broetje_vpn.core.listing_cache import (IS_DIR, NAME, SIZE, ListingCache, fetch_listing, iter_directory_pages,
+                                            list_directory)
+
+
+def make_tree(root):
+    root.mkdir()
+    (root / "beta").mkdir()
+    (root / "Alpha").mkdir()
+    (root / "b.txt").write_bytes(b"12345")
+    (root / "A.txt").write_bytes(b"")
+    return root
+
+
+def test_list_directory_puts_folders_first_case_insensitively(tmp_path):
+    entries = list_directory(str(make_tree(tmp_path / "share")))
+    assert [e[NAME] for e in entries] == ["Alpha", "beta", "A.txt", "b.txt"]
+    assert [e[IS_DIR] for e in entries] == [True, True, False, False]
+    assert entries[3][SIZE] == 5
+
+
+def test_pages_cover_every_entry(tmp_path):
+    for i in range(7):
+        (tmp_path / f"f{i}").write_bytes(b"")
+    pages = list(iter_directory_pages(str(tmp_path), page_size=3))
+    assert [len(p) for p in pages] == [3, 3, 1]
+
+
+def test_cache_persists_across_instances(tmp_path):
+    db = str(tmp_path / "listings.sqlite3")
+    share = str(make_tree(tmp_path / "share"))
+    ListingCache(db).put(share, 12.5, list_directory(share))
+    mtime, entries = ListingCache(db).get(share + os.sep)
+    assert mtime == 12.5
+    assert entries == list_directory(share)
+    ListingCache(db).discard(share)
+    assert ListingCache(db).get(share) is None
+
+
+def test_fetch_listing_skips_unchanged_directories(tmp_path):
+    cache = ListingCache(str(tmp_path / "listings.sqlite3"))
+    share = make_tree(tmp_path / "share")
+    changed, mtime, entries = fetch_listing(str(share), cache)
+    assert changed and len(entries) == 4
+
+    assert fetch_listing(str(share), cache, known_mtime=mtime) == (False, mtime, None)
+
+    (share / "new.txt").write_bytes(b"")
+    os.utime(share, (mtime + 10, mtime + 10))
+    changed, new_mtime, entries = fetch_listing(str(share), cache, known_mtime=mtime)
+    assert changed and new_mtime != mtime
+    assert "new.txt" in [e[NAME] for e in entries]
+    assert cache.get(str(share)) == (new_mtime, entries)
+
+
+def test_least_recently_fetched_listings_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(listing_cache, "PRUNE_EVERY", 1)
+    cache = ListingCache(str(tmp_path / "listings.sqlite3"), max_entries=2)
+    for name in ("one", "two", "three"):
+        cache.put(str(tmp_path / name), 1.0, [])
+    assert cache.get(str(tmp_path / "one")) is None
+    assert cache.get(str(tmp_path / "three")) == (1.0, [])
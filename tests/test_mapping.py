@@ -0,0 +1,30 @@
+from broetje_vpn.core.drive_inventory import DriveEntry
+from broetje_vpn.core.mapping import KEEP, MAP, REMAP, MappingJob, plan_reconciliation
+
+
+def job(drive, path):
+    return MappingJob(drive, path, "banet.loc\\user", "secret")
+
+
+def actions(jobs, live):
+    return {j.drive: action for j, action in plan_reconciliation(jobs, live)}
+
+
+def test_plan_keeps_maps_and_remaps():
+    jobs = [job("N:", "\\\\banet.loc\\ba"), job("P:", "\\\\srv\\Shared Docs"), job("Q:", "\\\\srv\\q"),
+            job("R:", "\\\\srv\\r"), job("S:", "\\\\srv\\s")]
+    live = [DriveEntry("N:", "\\\\BANET.LOC\\ba\\", "OK"),
+            DriveEntry("P:", "\\\\srv\\Shared Docs", "OK"),
+            DriveEntry("R:", "\\\\srv\\elsewhere", "OK"),
+            DriveEntry("S:", "\\\\srv\\s", "Unavailable")]
+    assert actions(jobs, live) == {"N:": KEEP, "P:": KEEP, "Q:": MAP, "R:": REMAP, "S:": REMAP}
+
+
+def test_plan_remaps_letters_without_status():
+    assert actions([job("N:", "\\\\srv\\x")], [DriveEntry("N:", "\\\\srv\\x", "")]) == {"N:": REMAP}
+
+
+def test_display_command_masks_the_password():
+    j = job("N:", "\\\\srv\\x")
+    assert "secret" not in j.displayCommand()
+    assert j.mask("net use failed for secret") == "net use failed for " + j.displayCommand().split()[-1]
@@ -0,0 +1,73 @@
+import os
+
+from broetje_vpn.core.search_index import FileIndex, collapse_roots
+
+
+def make_tree(root):
+    for rel in ("a/x.txt", "a/b/y.txt", "c/z.txt"):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+def names(results):
+    return sorted(os.path.basename(path) for path, _ in results)
+
+
+def test_collapse_roots_drops_nested_roots(tmp_path):
+    roots = [str(tmp_path / "a" / "b"), str(tmp_path / "a"), str(tmp_path / "c")]
+    assert sorted(collapse_roots(roots)) == [str(tmp_path / "a"), str(tmp_path / "c")]
+
+
+def test_search_finds_substring_and_fuzzy_matches(tmp_path):
+    root = tmp_path / "share"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.z"))
+    assert index.updateRoots([str(root)]) == 4
+    assert names(index.search("y.txt")) == ["y.txt"]
+    assert "z.txt" in names(index.search("ztx"))
+
+
+def test_unchanged_directories_are_not_relisted(tmp_path):
+    root = tmp_path / "share"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.z"))
+    index.updateRoots([str(root)])
+    assert index.updateRoots([str(root)]) == 0
+
+
+def test_unreachable_root_keeps_the_index(tmp_path):
+    root = tmp_path / "share"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.z"))
+    index.updateRoots([str(root)])
+    before = len(index)
+    os.rename(root, tmp_path / "offline")
+    index.updateRoots([str(root)])
+    assert len(index) == before
+    assert names(index.search("y.txt")) == ["y.txt"]
+
+
+def test_deleted_folder_is_forgotten(tmp_path):
+    root = tmp_path / "share"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.z"))
+    index.updateRoots([str(root)])
+    os.remove(root / "a" / "b" / "y.txt")
+    os.rmdir(root / "a" / "b")
+    # Make sure the parent's mtime moves even on coarse file systems.
+    os.utime(root / "a", (1, 1))
+    index.updateRoots([str(root)])
+    assert index.search("y.txt") == []
+    assert names(index.search("x.txt")) == ["x.txt"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    root = tmp_path / "share"
+    make_tree(root)
+    index = FileIndex(str(tmp_path / "index.z"))
+    index.updateRoots([str(root)])
+    index.save()
+    loaded = FileIndex(str(tmp_path / "index.z"))
+    assert loaded.load()
+    assert names(loaded.search("z.txt")) == ["z.txt"]
@@ -0,0 +1,58 @@
+import json
+import random
+
+from broetje_vpn.core.config_store import ConfigStore
+from broetje_vpn.core.server_catalog import CONFIG_KEY, ServerCatalog, read_server_file, write_server_file
+
+
+def make_catalog(tmp_path, servers):
+    path = tmp_path / "credentials_manager.json"
+    path.write_text(json.dumps({CONFIG_KEY: servers}))
+    return ServerCatalog(ConfigStore(str(path), write_delay=0))
+
+
+def brute_force(catalog, query):
+    terms = query.lower().split()
+    return [e["id"] for e in catalog.entries()
+            if all(t in (e["description"] + "\t" + e["address"]).lower() for t in terms)]
+
+
+def test_filter_matches_brute_force_while_typing(tmp_path):
+    rng = random.Random(7)
+    words = ["Pratt", "Whitney", "uschi", "Airbus", "ab", "abc", "07", "Projekt", "daten"]
+    servers = [{"description": " ".join(rng.sample(words, 2)) + f" {i}",
+                "address": "\\\\banet.loc\\" + "\\".join(rng.sample(words, 3))} for i in range(300)]
+    catalog = make_catalog(tmp_path, servers)
+    for query in ["a", "ab", "abc", "abc p", "abc pr", "abc pra", "w", "wh u", "\\\\banet", "xyz", "", "07 d"]:
+        assert catalog.filter(query) == brute_force(catalog, query), query
+
+
+def test_filter_sees_catalog_changes_after_a_cached_query(tmp_path):
+    catalog = make_catalog(tmp_path, [{"description": "Pratt", "address": "\\\\a\\one"}])
+    assert len(catalog.filter("pra")) == 1
+    new_id = catalog.add("Praxis", "\\\\a\\two")
+    assert catalog.filter("prax") == [new_id]
+    catalog.update(new_id, "Other", "\\\\a\\two")
+    assert catalog.filter("pra") == brute_force(catalog, "pra")
+    catalog.remove([new_id])
+    assert catalog.filter("") == catalog.ids()
+
+
+def test_import_skips_known_addresses_and_ids_survive_reload(tmp_path):
+    catalog = make_catalog(tmp_path, [{"description": "One", "address": "\\\\srv\\share"}])
+    added, skipped = catalog.importEntries([
+        {"description": "Dup", "address": "\\\\SRV\\share\\"},
+        {"description": "Two", "address": "\\\\srv\\other"},
+        {"description": "", "address": "\\\\srv\\nameless"},
+    ])
+    assert (len(added), skipped) == (1, 2)
+    catalog.store.flush()
+    reloaded = make_catalog(tmp_path, json.loads((tmp_path / "credentials_manager.json").read_text())[CONFIG_KEY])
+    assert reloaded.ids() == catalog.ids()
+
+
+def test_server_files_round_trip(tmp_path):
+    entries = [{"description": "One, with comma", "address": "\\\\srv\\a"}, {"description": "Two", "address": "x"}]
+    for name in ("servers.json", "servers.csv"):
+        write_server_file(str(tmp_path / name), entries)
+        assert read_server_file(str(tmp_path / name)) == entries
@@ -0,0 +1,108 @@
+import json
+import os
+import time
+
+from broetje_vpn.core.transfer import (
+    DONE, SKIPPED, TransferJob, TransferQueue, copy_file, part_paths, source_stamp
+)
+
+
+def run_queue(queue, sources, dest_dir, timeout=10.0):
+    queue.submit(sources, dest_dir).result(timeout)
+    deadline = time.monotonic() + timeout
+    while queue.isBusy():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def make_queue():
+    queue = TransferQueue(retries=0)
+    errors = []
+    queue.addErrorListener(errors.append)
+    return queue, errors
+
+
+def test_copies_a_folder_tree(tmp_path):
+    src = tmp_path / "project"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("a")
+    (src / "sub" / "b.txt").write_text("b")
+    queue, errors = make_queue()
+    run_queue(queue, [str(src)], str(tmp_path / "out"))
+    assert (tmp_path / "out" / "project" / "sub" / "b.txt").read_text() == "b"
+    assert queue.counts()[DONE] == 2 and errors == []
+
+
+def test_existing_destination_is_skipped_not_overwritten(tmp_path):
+    (tmp_path / "a.txt").write_text("new")
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.txt").write_text("old")
+    queue, errors = make_queue()
+    run_queue(queue, [str(tmp_path / "a.txt")], str(tmp_path / "out"))
+    assert (tmp_path / "out" / "a.txt").read_text() == "old"
+    assert queue.counts()[SKIPPED] == 1
+
+
+def test_same_destination_is_only_queued_once(tmp_path):
+    for folder in ("one", "two"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "a.txt").write_text(folder * 100000)
+    queue, errors = make_queue()
+    run_queue(queue, [str(tmp_path / "one" / "a.txt"), str(tmp_path / "two" / "a.txt")], str(tmp_path / "out"))
+    counts = queue.counts()
+    assert counts[DONE] == 1 and counts[SKIPPED] == 1
+    assert (tmp_path / "out" / "a.txt").read_text() == "one" * 100000
+    assert not os.path.exists(part_paths(str(tmp_path / "out" / "a.txt"))[0])
+
+
+def test_folder_is_not_copied_into_itself(tmp_path):
+    src = tmp_path / "project"
+    src.mkdir()
+    (src / "a.txt").write_text("a")
+    queue, errors = make_queue()
+    run_queue(queue, [str(src)], str(src / "backup"))
+    assert len(errors) == 1 and "into itself" in errors[0]
+    assert not (src / "backup").exists()
+
+
+def test_scan_errors_reach_the_error_listener(tmp_path):
+    (tmp_path / "file").write_text("x")
+    (tmp_path / "folder").mkdir()
+    queue, errors = make_queue()
+    future = queue.submit([str(tmp_path / "folder")], str(tmp_path / "file"))
+    deadline = time.monotonic() + 5
+    while not errors and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert future.exception() is not None
+    assert errors and errors[0].startswith("Could not queue the copy")
+
+
+def test_copy_resumes_a_matching_part_file(tmp_path):
+    source = tmp_path / "big.bin"
+    source.write_bytes(bytes(range(256)) * 64)
+    dest = str(tmp_path / "out.bin")
+    part, meta = part_paths(dest)
+    with open(part, "wb") as f:
+        f.write(source.read_bytes()[:5000])
+    with open(meta, "w", encoding="utf-8") as f:
+        json.dump(source_stamp(str(source), os.stat(source)), f)
+    job = TransferJob(str(source), dest)
+    copy_file(job, chunk_size=1024)
+    assert job.resumedFrom == 5000
+    assert open(dest, "rb").read() == source.read_bytes()
+    assert not os.path.exists(part) and not os.path.exists(meta)
+
+
+def test_stale_part_file_is_not_resumed(tmp_path):
+    source = tmp_path / "big.bin"
+    source.write_bytes(b"x" * 4096)
+    dest = str(tmp_path / "out.bin")
+    part, meta = part_paths(dest)
+    with open(part, "wb") as f:
+        f.write(b"y" * 1000)
+    with open(meta, "w", encoding="utf-8") as f:
+        json.dump({"source": str(source), "size": 1, "mtime": 0}, f)
+    job = TransferJob(str(source), dest)
+    copy_file(job)
+    assert job.resumedFrom == 0
+    assert open(dest, "rb").read() == b"x" * 4096